@@ -0,0 +1,66 @@
+ANIMATION_STATES = {
+    'Standing': {'frames': ['Walk1', 'Walk2'], 'fps': 2},
+    'Walking': {'frames': ['Walk1', 'Walk2'], 'fps': 2},
+    'happy': {'frames': ['Happy', 'Walk1'], 'fps': 2},
+    'sleeping': {'frames': ['Sleep1', 'Sleep2'], 'fps': 2},
+    'eating': {'frames': ['Eat1', 'Eat2'], 'fps': 2},
+    'playing': {'frames': ['Attack', 'Walk1'], 'fps': 2},
+    'special': {'frames': ['Happy', 'Walk1', 'Walk2', 'Happy'], 'fps': 2},
+    'angry': {'frames': ['Angry', 'Walk1'], 'fps': 2},
+    'sad': {'frames': ['Lose1', 'Walk1'], 'fps': 2},
+    'sick': {'frames': ['Walk1', 'Lose1'], 'fps': 2},
+    # Evolving plays the shared evolution sequence instead of per-stage frames.
+    'Evolving': {'frames': None, 'fps': 4, 'mirror': False}
+}
+# Highest first: sleep > evolving > sick > interaction > idle.
+PRECEDENCE = ['sleeping', 'Evolving', 'sick', 'interaction', 'idle']
+IDLE_STATE = 'Standing'
+DEFAULT_FRAME = 'Walk1'
+class AnimationGraph:
+    def __init__(self, states=ANIMATION_STATES, idle_state=IDLE_STATE, default_frame=DEFAULT_FRAME):
+        self.states = states
+        self.idle_state = idle_state
+        self.default_frame = default_frame
+        self.table = {}
+        self.compiles = 0
+    def frame_names(self):
+        names = {self.default_frame}
+        for spec in self.states.values():
+            names.update(spec['frames'] or [])
+        return sorted(names)
+    def compile(self, is_available, label=''):
+        """Resolve every state's frames against what this sprite set has, once, reporting each substitution."""
+        available = {name for name in self.frame_names() if is_available(name)}
+        substitute = self.default_frame if self.default_frame in available else next(iter(sorted(available)), None)
+        if substitute is None:
+            print(f"No animation frames found{label}")
+        table = {}
+        for state, spec in self.states.items():
+            if spec['frames'] is None:
+                table[state] = (None, spec['fps'], spec.get('mirror', True))
+                continue
+            frames = []
+            for frame in spec['frames']:
+                if frame in available:
+                    frames.append(frame)
+                elif substitute:
+                    print(f"Animation frame {frame} for '{state}' not found{label}, using {substitute}")
+                    frames.append(substitute)
+            table[state] = (tuple(frames), spec['fps'], spec.get('mirror', True))
+        self.table = table
+        self.compiles += 1
+        return table
+    def resolve(self, animation, is_sleeping=False, is_sick=False):
+        """Pick the state to draw by PRECEDENCE; unknown animations draw as idle."""
+        active = {
+            'sleeping': is_sleeping or animation == 'sleeping',
+            'Evolving': animation == 'Evolving',
+            'sick': is_sick or animation == 'sick',
+            'interaction': animation in self.table and animation != self.idle_state,
+            'idle': True
+        }
+        for layer in PRECEDENCE:
+            if active[layer]:
+                if layer == 'interaction':
+                    return animation
+                return self.idle_state if layer == 'idle' else layer
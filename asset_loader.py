@@ -0,0 +1,77 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+def decode_icon(path, size, resample=Image.LANCZOS):
+    """Open an image as RGBA and resize it; PIL only, so it can run on a pool thread."""
+    img = Image.open(path).convert("RGBA")
+    return img.resize(size, resample)
+class AssetLoader:
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers or min(8, os.cpu_count() or 2)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="AssetLoader")
+        self.pending = []
+        self.active = True
+        self.timings = {}
+        self.started = time.perf_counter()
+    def _group_timing(self, group):
+        if group not in self.timings:
+            self.timings[group] = {'count': 0, 'failed': 0, 'decode_ms': 0.0, 'photo_ms': 0.0, 'ready_ms': 0.0}
+        return self.timings[group]
+    def _run(self, func, args):
+        start = time.perf_counter()
+        result = func(*args)
+        return result, (time.perf_counter() - start) * 1000, (time.perf_counter() - self.started) * 1000
+    def load(self, group, func, *args, on_ready=None):
+        """Decode on the pool and pass the result to on_ready from finish(); runs inline once startup is over."""
+        timing = self._group_timing(group)
+        timing['count'] += 1
+        if not self.active:
+            try:
+                result, decode_ms, ready_ms = self._run(func, args)
+            except Exception as e:
+                timing['failed'] += 1
+                print(f"Error loading {group} asset: {e}")
+                return False
+            timing['decode_ms'] += decode_ms
+            self._deliver(group, on_ready, result)
+            return True
+        self.pending.append((group, self.executor.submit(self._run, func, args), on_ready))
+        return True
+    def _deliver(self, group, on_ready, result):
+        if on_ready is None:
+            return
+        start = time.perf_counter()
+        try:
+            on_ready(result)
+        except Exception as e:
+            self.timings[group]['failed'] += 1
+            print(f"Error finishing {group} asset: {e}")
+        self.timings[group]['photo_ms'] += (time.perf_counter() - start) * 1000
+    def finish(self):
+        """Wait for the queued decodes, run their callbacks in submission order and report per-group timing."""
+        while self.pending:
+            group, future, on_ready = self.pending.pop(0)
+            timing = self.timings[group]
+            try:
+                result, decode_ms, ready_ms = future.result()
+            except Exception as e:
+                timing['failed'] += 1
+                print(f"Error loading {group} asset: {e}")
+                continue
+            timing['decode_ms'] += decode_ms
+            timing['ready_ms'] = max(timing['ready_ms'], ready_ms)
+            self._deliver(group, on_ready, result)
+        if self.active:
+            self.active = False
+            self.executor.shutdown(wait=False)
+            self.report()
+    def report(self):
+        total_ms = (time.perf_counter() - self.started) * 1000
+        print(f"Startup assets loaded in {total_ms:.1f} ms on {self.max_workers} threads:")
+        for group, timing in self.timings.items():
+            print(f"  {group}: {timing['count']} assets, {timing['decode_ms']:.1f} ms decoding, "
+                  f"{timing['photo_ms']:.1f} ms on the Tk thread, ready at {timing['ready_ms']:.1f} ms"
+                  + (f", {timing['failed']} failed" if timing['failed'] else ""))
+    def get_stats(self):
+        return {group: dict(timing) for group, timing in self.timings.items()}
@@ -0,0 +1,117 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from simulate import Simulation
+from stat_catchup import MINUTES_PER_DAY
+# Each pet's care policy is drawn from these: a list is a choice, a (low, high) pair or {"min", "max"} a uniform range.
+POLICY_RANGES = {
+    'check_every_minutes': [30, 60, 120, 240],
+    'feed_below': (30, 70),
+    'play_below': (20, 60),
+    'pet_below': (20, 60),
+    'clean_below': (20, 60),
+    'open_chest_chance': (0.2, 0.9),
+    'games_per_check': [0, 1, 2, 3],
+    'game_win_rate': (0.3, 0.9)
+}
+STAGES = ['Child', 'Teen', 'Adult']
+def sample_policy(rng, ranges=POLICY_RANGES):
+    policy = {}
+    for key, spec in ranges.items():
+        if isinstance(spec, list):
+            policy[key] = rng.choice(spec)
+        elif isinstance(spec, dict):
+            policy[key] = round(rng.uniform(spec['min'], spec['max']), 3)
+        else:
+            policy[key] = round(rng.uniform(*spec), 3)
+    return policy
+def run_pet(job):
+    """Simulate one pet; everything random comes from its seed, so the same job always gives the same result."""
+    seed, days, config, ranges = job
+    rng = random.Random(seed)
+    policy = dict(config.get('policy', {}), **sample_policy(rng, ranges))
+    sim = Simulation(policy, config, rng=rng, sample_minutes=MINUTES_PER_DAY)
+    summary = sim.run(days)
+    evolution_days = {evolution['stage']: evolution['day'] for evolution in summary['evolutions']}
+    return {
+        'seed': seed,
+        'policy': policy,
+        'first_sick_day': summary['first_sick_day'],
+        'sick_days': summary['sick_days'],
+        'evolution_days': evolution_days,
+        'poops_per_day': summary['poops'] / days,
+        'chest_coins_per_day': summary['coins']['chest'] / days,
+        'game_coins_per_day': summary['coins']['games'] / days,
+        'coins_per_day': (summary['coins']['chest'] + summary['coins']['games']) / days,
+        'chests_opened': summary['chests']['opened']
+    }
+def distribution(values):
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        return {'n': 0}
+    if len(values) > 1:
+        deciles = statistics.quantiles(values, n=10, method='inclusive')
+        p10, p50, p90 = deciles[0], statistics.median(values), deciles[-1]
+    else:
+        p10 = p50 = p90 = values[0]
+    return {
+        'n': len(values),
+        'mean': round(statistics.fmean(values), 3),
+        'min': round(values[0], 3),
+        'p10': round(p10, 3),
+        'p50': round(p50, 3),
+        'p90': round(p90, 3),
+        'max': round(values[-1], 3)
+    }
+def summarize(results):
+    report = {
+        'pets': len(results),
+        'never_sick': sum(1 for result in results if result['first_sick_day'] is None),
+        'time_to_sickness_days': distribution(result['first_sick_day'] for result in results),
+        'sick_days': distribution(result['sick_days'] for result in results),
+        'poops_per_day': distribution(result['poops_per_day'] for result in results),
+        'coins_per_day': distribution(result['coins_per_day'] for result in results),
+        'chest_coins_per_day': distribution(result['chest_coins_per_day'] for result in results),
+        'game_coins_per_day': distribution(result['game_coins_per_day'] for result in results)
+    }
+    for stage in STAGES:
+        report[f'{stage.lower()}_evolution_day'] = distribution(result['evolution_days'].get(stage) for result in results)
+    return report
+def run_batch(pets, days=90, base_seed=0, workers=None, config=None, ranges=POLICY_RANGES):
+    """Simulate pets seeded base_seed.. base_seed + pets - 1 across a process pool; results come back in seed order."""
+    jobs = [(base_seed + i, days, config or {}, ranges) for i in range(pets)]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        return [run_pet(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_pet, jobs, chunksize=max(1, pets // (workers * 4))))
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate many pets in parallel and report balance distributions.")
+    parser.add_argument('--pets', type=int, default=1000)
+    parser.add_argument('--days', type=float, default=90)
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first pet; pet i uses seed + i")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--config', help="JSON file with decay_rates, evolution_thresholds, poop_frequency, policy and policy_ranges")
+    parser.add_argument('--out', help="write the report and per-pet results to a JSON file")
+    args = parser.parse_args(argv)
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    ranges = config.get('policy_ranges', POLICY_RANGES)
+    started = time.perf_counter()
+    results = run_batch(args.pets, args.days, args.seed, args.workers, config, ranges)
+    report = summarize(results)
+    if args.out:
+        with open(args.out, 'w') as f:
+            json.dump({'report': report, 'config': config, 'results': results}, f, indent=4)
+    print(json.dumps(report, indent=4))
+    print(f"Simulated {args.pets} pets for {args.days:g} days in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+    return report
+if __name__ == "__main__":
+    main()
@@ -398,7 +398,7 @@ class ContextAwareness:
             "You look busy! I'll hide for a bit. 🫣",
             "Let me give you some room. *hops to the side*",
         ]
-        if random.random() < 0.3:
+        if random.random() < 0.3 and self._pet_in_the_way():
             comment = random.choice(movement_comments)
             self._ensure_speech_bubble_visibility()
             def show_bubble_and_move():
@@ -407,58 +407,45 @@ class ContextAwareness:
                     self.move_pet_to_safe_position(self.get_active_window_info(), delay_ms=100)
             self.pet_manager.root.after(200, show_bubble_and_move)
             self.last_comment_time = datetime.now()
+    def _pet_in_the_way(self):
+        animation = getattr(self.pet_manager, 'animation', None)
+        if not animation or not hasattr(animation, 'path_planner'):
+            return True
+        return not animation.path_planner.is_free(animation.movement.position(), kinds=('window',))
     def move_pet_to_safe_position(self, window_info, delay_ms=1000):
         if not window_info:
             return
+        if delay_ms > 0:
+            self.pet_manager.root.after(delay_ms, lambda: self.move_pet_to_safe_position(window_info, 0))
+            return
+        min_y = 150
+        animation = getattr(self.pet_manager, 'animation', None)
+        if animation and hasattr(animation, 'path_planner'):
+            route = animation.path_planner.plan_escape(animation.movement.position(), min_y)
+            if route == []:
+                return
+            if route:
+                self._smooth_move_to_position(route[-1], route)
+                return
         window_rect = self.get_window_rectangle(window_info['hwnd'])
         if not window_rect:
             return
         screen_width = self.pet_manager.root.winfo_screenwidth()
         screen_height = self.pet_manager.root.winfo_screenheight()
-        min_y = 150
         safe_pos = self.calculate_safe_position(window_rect, screen_width, screen_height, min_y)
         if safe_pos:
-            if delay_ms <= 0:
-                self._smooth_move_to_position(safe_pos)
-            else:
-                self.pet_manager.root.after(delay_ms, lambda: self._smooth_move_to_position(safe_pos))
-    def _smooth_move_to_position(self, target_pos):
+            self._smooth_move_to_position(safe_pos)
+    def _smooth_move_to_position(self, target_pos, route=None):
         if not hasattr(self.pet_manager, 'root') or not self.pet_manager.root.winfo_exists():
             return
-        target_x, target_y = target_pos
         if hasattr(self.pet_manager, 'animation') and self.pet_manager.animation:
             self.pet_manager.animation.pause_movement()
             self.pet_manager.pet_state.is_interacting = True
-            current_x = self.pet_manager.root.winfo_x()
-            self.pet_manager.pet_state.direction = 'right' if target_x > current_x else 'left'
-            self.pet_manager.pet_state.current_animation = 'Walking'
-            def controlled_move_step():
-                if not self.pet_manager.root.winfo_exists():
-                    self.pet_manager.pet_state.current_animation = 'Standing'
-                    self.pet_manager.pet_state.is_interacting = False
-                    self.pet_manager.animation.schedule_resume_movement(1000)
-                    return
-                curr_x = self.pet_manager.root.winfo_x()
-                curr_y = self.pet_manager.root.winfo_y()
-                dx = target_x - curr_x
-                dy = target_y - curr_y
-                distance = (dx**2 + dy**2)**0.5
-                if abs(dx) > 2:
-                    self.pet_manager.pet_state.direction = 'right' if dx > 0 else 'left'
-                if distance < 10:
-                    self.pet_manager.pet_state.current_animation = 'Standing'
-                    self.pet_manager.pet_state.is_interacting = False
-                    self.pet_manager.animation.schedule_resume_movement(1000)
-                    return
-                speed_setting = self.pet_manager.settings.get('movement_speed', 5)
-                pixels_per_step = max(1, speed_setting)
-                step_x = pixels_per_step * (dx / distance) if distance > 0 else 0
-                step_y = pixels_per_step * (dy / distance) if distance > 0 else 0
-                new_x = curr_x + step_x
-                new_y = curr_y + step_y
-                self.pet_manager.root.geometry(f'+{int(new_x)}+{int(new_y)}')
-                self.pet_manager.root.after(50, controlled_move_step)
-            controlled_move_step()
+            def arrived():
+                self.pet_manager.pet_state.current_animation = 'Standing'
+                self.pet_manager.pet_state.is_interacting = False
+                self.pet_manager.animation.schedule_resume_movement(1000)
+            self.pet_manager.animation.walk_path(route or [target_pos], on_arrive=arrived, stop_on_interaction=False)
     def update_context_awareness(self):
         if not self.monitoring_enabled or self.pet_manager.pet_state.is_interacting:
             return
@@ -0,0 +1,84 @@
+import os
+import time
+FRAME_FALLBACKS = {
+    'Sleep2': 'Sleep1',
+    'Refuse': 'Angry'
+}
+class FrameManifest:
+    def __init__(self, base_path, atlas=None, check_interval=30):
+        self.base_path = base_path
+        self.atlas = atlas
+        self.check_interval = check_interval
+        self.files = {}
+        self.resolved = {}
+        self.dir_mtimes = {}
+        self.last_check = 0
+        self.scan()
+    def _watched_dirs(self):
+        return [self.base_path, os.path.join(self.base_path, 'Evolution')]
+    def _read_dir_mtimes(self):
+        mtimes = {}
+        for directory in self._watched_dirs():
+            try:
+                mtimes[directory] = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtimes[directory] = None
+        return mtimes
+    def scan(self):
+        """Build the lowercase name -> (path, mtime) table with one pass over the frames directories."""
+        self.files = {}
+        self.resolved = {}
+        if self.atlas:
+            for name in self.atlas.frames:
+                path = os.path.join(self.base_path, *name.split('/'))
+                self.files[name] = (path, self.atlas.mtime)
+        else:
+            for directory in self._watched_dirs():
+                prefix = os.path.relpath(directory, self.base_path).replace(os.sep, '/')
+                prefix = '' if prefix == '.' else prefix + '/'
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_file() and entry.name.lower().endswith('.png'):
+                                self.files[(prefix + entry.name).lower()] = (entry.path, entry.stat().st_mtime_ns)
+                except OSError as e:
+                    print(f"Error scanning frames directory {directory}: {e}")
+        self.dir_mtimes = self._read_dir_mtimes()
+        self.last_check = time.monotonic()
+    def refresh_if_changed(self, force=False):
+        """Rescan only when a frames directory changed; checks are throttled to check_interval seconds."""
+        now = time.monotonic()
+        if not force and now - self.last_check < self.check_interval:
+            return False
+        self.last_check = now
+        if self.atlas:
+            return False
+        if self._read_dir_mtimes() != self.dir_mtimes:
+            self.scan()
+            return True
+        return False
+    def _lookup(self, stage, state, color=None):
+        name = f"{stage}_{state}_{color}.png" if color and color != 'black' else f"{stage}_{state}.png"
+        entry = self.files.get(name.lower())
+        return entry[0] if entry else None
+    def resolve(self, stage, state, color='black'):
+        key = (stage, state, color)
+        if key in self.resolved:
+            return self.resolved[key]
+        path = self._lookup(stage, state, color)
+        if path is None and color != 'black':
+            path = self._lookup(stage, state)
+            if path is not None:
+                print(f"Using default black variant for {state} as {color} variant not found")
+        if path is None and state in FRAME_FALLBACKS:
+            path = self._lookup(stage, FRAME_FALLBACKS[state], color)
+        self.resolved[key] = path
+        return path
+    def resolve_evolution(self, index):
+        entry = self.files.get(f"evolution/evo{index}.png")
+        return entry[0] if entry else None
+    def source_name(self, path):
+        return os.path.relpath(path, self.base_path).replace(os.sep, '/').lower()
+    def source_mtime(self, path):
+        entry = self.files.get(self.source_name(path))
+        return entry[1] if entry else 0
@@ -0,0 +1,221 @@
+import math
+import time
+class ScheduledTask:
+    def __init__(self, name, callback, interval_ms, priority, subsystem, next_due):
+        self.name = name
+        self.callback = callback
+        self.interval_ms = interval_ms
+        self.priority = priority
+        self.subsystem = subsystem
+        self.next_due = next_due
+        self.runs = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+class FrameScheduler:
+    COALESCE_MS = 10
+    def __init__(self, root, clock=time.monotonic, frame_budget_ms=16):
+        self.root = root
+        self.clock = clock
+        self.frame_budget_ms = frame_budget_ms
+        self.tasks = {}
+        self.paused = set()
+        self.interval_scale = {}
+        self.current_task = None
+        self.duplicates = {}
+        self.timer = None
+        self.timer_due = None
+        self.wakeups = 0
+        self.task_runs = 0
+        self.over_budget = 0
+        self.last_frame_ms = 0.0
+    def now_ms(self):
+        return self.clock() * 1000
+    def register(self, name, callback, interval_ms, priority=0, subsystem='app', delay_ms=None, replace=False):
+        """Run callback every interval_ms until it returns False; a name that is already live is reported and kept."""
+        existing = self.tasks.get(name)
+        # A task re-registering its own name from inside its callback is continuing its chain, not a duplicate.
+        if existing is not None and not replace and existing is not self.current_task:
+            self._report_duplicate(name)
+            return name
+        delay_ms = interval_ms if delay_ms is None else delay_ms
+        self.tasks[name] = ScheduledTask(name, callback, interval_ms, priority, subsystem, self.now_ms() + delay_ms)
+        self._arm()
+        return name
+    def after(self, name, delay_ms, callback, subsystem='app', replace=False):
+        """Named one-shot timer, for chains that re-arm themselves with a varying delay."""
+        def run_once():
+            callback()
+            return False
+        return self.register(name, run_once, delay_ms, subsystem=subsystem, replace=replace)
+    def _report_duplicate(self, name):
+        self.duplicates[name] = self.duplicates.get(name, 0) + 1
+        if self.duplicates[name] == 1:
+            print(f"Ignoring duplicate start of scheduled loop '{name}', it is already running")
+    def unregister(self, name):
+        removed = self.tasks.pop(name, None) is not None
+        if removed:
+            self._arm()
+        return removed
+    def is_registered(self, name):
+        return name in self.tasks
+    def set_interval(self, name, interval_ms):
+        task = self.tasks.get(name)
+        if task is None:
+            return False
+        task.next_due = min(task.next_due, self.now_ms() + interval_ms)
+        task.interval_ms = interval_ms
+        self._arm()
+        return True
+    def align(self, name, other):
+        """Move name's next run onto other's, so tasks sharing an interval also share their wakeups."""
+        task, lead = self.tasks.get(name), self.tasks.get(other)
+        if task is None or lead is None or task.interval_ms != lead.interval_ms:
+            return False
+        now = self.now_ms()
+        missed = max(0, math.ceil((now - lead.next_due) / lead.interval_ms)) if lead.interval_ms else 0
+        task.next_due = max(lead.next_due + missed * lead.interval_ms, now)
+        self._arm()
+        return True
+    def pause(self, subsystem):
+        self.paused.add(subsystem)
+        self._arm()
+    def resume(self, subsystem):
+        if subsystem not in self.paused:
+            return
+        self.paused.discard(subsystem)
+        now = self.now_ms()
+        for task in self.tasks.values():
+            if task.subsystem == subsystem:
+                task.next_due = max(task.next_due, now)
+        self._arm()
+    def is_paused(self, subsystem):
+        return subsystem in self.paused
+    def set_interval_scale(self, subsystem, scale):
+        """Stretch the interval of every task in a subsystem, including ones registered later."""
+        if scale == 1:
+            self.interval_scale.pop(subsystem, None)
+        else:
+            self.interval_scale[subsystem] = scale
+    def _next_due(self):
+        due = [task.next_due for task in self.tasks.values() if task.subsystem not in self.paused]
+        return min(due) if due else None
+    def _arm(self):
+        """Keep exactly one Tk callback pending, set for the earliest due task."""
+        due = self._next_due()
+        if self.timer is not None:
+            if due is not None and self.timer_due is not None and self.timer_due <= due:
+                return
+            self.root.after_cancel(self.timer)
+            self.timer = None
+            self.timer_due = None
+        if due is None:
+            return
+        self.timer_due = due
+        self.timer = self.root.after(max(0, int(due - self.now_ms())), self._tick)
+    def _tick(self):
+        self.timer = None
+        self.timer_due = None
+        self.wakeups += 1
+        frame_start = self.now_ms()
+        due = [task for task in self.tasks.values()
+               if task.subsystem not in self.paused and task.next_due <= frame_start + self.COALESCE_MS]
+        due.sort(key=lambda task: (-task.priority, task.next_due))
+        for task in due:
+            if self.tasks.get(task.name) is not task or task.subsystem in self.paused:
+                continue
+            start = time.perf_counter()
+            self.current_task = task
+            try:
+                result = task.callback()
+            except Exception as e:
+                print(f"Error in scheduled task {task.name}: {e}")
+                result = None
+            finally:
+                self.current_task = None
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            task.runs += 1
+            task.total_ms += elapsed_ms
+            task.max_ms = max(task.max_ms, elapsed_ms)
+            self.task_runs += 1
+            if result is False:
+                if self.tasks.get(task.name) is task:
+                    del self.tasks[task.name]
+                continue
+            task.next_due = max(task.next_due + task.interval_ms * self.interval_scale.get(task.subsystem, 1), self.now_ms())
+        self.last_frame_ms = self.now_ms() - frame_start
+        if self.last_frame_ms > self.frame_budget_ms:
+            self.over_budget += 1
+        self._arm()
+    def get_stats(self):
+        return {
+            'wakeups': self.wakeups,
+            'task_runs': self.task_runs,
+            'over_budget': self.over_budget,
+            'last_frame_ms': self.last_frame_ms,
+            'paused': sorted(self.paused),
+            'interval_scale': dict(self.interval_scale),
+            'duplicates': dict(self.duplicates),
+            'tasks': {
+                task.name: {
+                    'subsystem': task.subsystem,
+                    'interval_ms': task.interval_ms,
+                    'runs': task.runs,
+                    'avg_ms': task.total_ms / task.runs if task.runs else 0.0,
+                    'max_ms': task.max_ms
+                } for task in self.tasks.values()
+            }
+        }
+class ScopedScheduler:
+    """One pet's view of the shared scheduler: task and subsystem names get the pet's prefix, so several pets can run the same loops and pause independently."""
+    def __init__(self, scheduler, scope):
+        self.scheduler = scheduler
+        self.scope = scope
+    def __getattr__(self, attr):
+        return getattr(self.scheduler, attr)
+    def _scoped(self, name):
+        return f"{self.scope}{name}"
+    def register(self, name, callback, interval_ms, priority=0, subsystem='app', delay_ms=None, replace=False):
+        self.scheduler.register(self._scoped(name), callback, interval_ms, priority, self._scoped(subsystem), delay_ms, replace)
+        # Run in step with the first pet's copy of this loop, so each extra pet adds work to a tick rather than a wakeup.
+        self.scheduler.align(self._scoped(name), name)
+        return name
+    def after(self, name, delay_ms, callback, subsystem='app', replace=False):
+        self.scheduler.after(self._scoped(name), delay_ms, callback, self._scoped(subsystem), replace)
+        return name
+    def unregister(self, name):
+        return self.scheduler.unregister(self._scoped(name))
+    def is_registered(self, name):
+        return self.scheduler.is_registered(self._scoped(name))
+    def set_interval(self, name, interval_ms):
+        if not self.scheduler.set_interval(self._scoped(name), interval_ms):
+            return False
+        self.scheduler.align(self._scoped(name), name)
+        return True
+    def pause(self, subsystem):
+        self.scheduler.pause(self._scoped(subsystem))
+    def resume(self, subsystem):
+        self.scheduler.resume(self._scoped(subsystem))
+    def is_paused(self, subsystem):
+        return self.scheduler.is_paused(self._scoped(subsystem))
+    def set_interval_scale(self, subsystem, scale):
+        self.scheduler.set_interval_scale(self._scoped(subsystem), scale)
+def task_scope(widget):
+    """The task prefix set on widget or the nearest window above it, or None outside a scoped pet window."""
+    # Instance attributes only: the headless windows answer (and record) any other attribute lookup.
+    while widget is not None:
+        attrs = getattr(widget, '__dict__', {})
+        if attrs.get('task_scope'):
+            return attrs['task_scope']
+        widget = attrs.get('master')
+    return None
+def get_scheduler(root):
+    """Return the scheduler shared by everything attached to root's Tk instance, creating it on first use."""
+    tk_root = root._root()
+    scheduler = getattr(tk_root, '_frame_scheduler', None)
+    if scheduler is None:
+        scheduler = FrameScheduler(tk_root, getattr(tk_root, 'clock', time.monotonic))
+        tk_root._frame_scheduler = scheduler
+    scope = task_scope(root)
+    if scope:
+        return ScopedScheduler(scheduler, scope)
+    return scheduler
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk
 import random
 import time
+from frame_scheduler import get_scheduler
+from treasure_rewards import level_reward
 class NumberGuesserGame:
     def __init__(self, parent, currency_system, pet_state=None):
         self.frame = ttk.Frame(parent)
@@ -17,8 +19,7 @@ class NumberGuesserGame:
         self.title_label.pack(pady=(10, 5))
         self.reward_frame = ttk.Frame(self.frame)
         self.reward_frame.pack(pady=(5, 10))
-        batch_number = (self.level - 1) // 3
-        base_reward = 1 + 2 * batch_number
+        base_reward = level_reward(self.level)
         self.currency_icon = None
         try:
             import os
@@ -72,8 +73,7 @@ class NumberGuesserGame:
             self.last_guess = guess
             if guess == self.target_number:
                 self.hint_label.config(text="Correct! 🎉", foreground="green")
-                batch_number = (self.level - 1) // 3
-                base_reward = 1 + 2 * batch_number
+                base_reward = level_reward(self.level)
                 self.currency_system.add_currency(base_reward)
                 if self.pet_state and hasattr(self.pet_state, 'pet_manager'):
                     self.pet_state.pet_manager.handle_interaction('play')
@@ -82,8 +82,7 @@ class NumberGuesserGame:
                 max_number = 10 + (self.level - 1)
                 self.target_number = random.randint(1, max_number)
                 self.info_label.config(text=f"Level {self.level}\nGuess 1-{max_number} ({self.guesses_left} guesses)")
-                new_batch_number = (self.level - 1) // 3
-                new_base_reward = 1 + 2 * new_batch_number
+                new_base_reward = level_reward(self.level)
                 self.reward_label.config(text=f"Reward: {new_base_reward} coins")
                 self.frame.after(1500, lambda: self.hint_label.config(text=""))
             else:
@@ -99,8 +98,7 @@ class NumberGuesserGame:
                     self.target_number = random.randint(1, max_number)
                     self.frame.after(2000, lambda: self.info_label.config(
                         text=f"Game Over! Restarting at Level {self.level}\nGuess 1-{max_number} ({self.guesses_left} guesses)"))
-                    new_batch_number = (self.level - 1) // 3
-                    new_base_reward = 1 + 2 * new_batch_number
+                    new_base_reward = level_reward(self.level)
                     self.reward_label.config(text=f"Reward: {new_base_reward} coins")
                     self.frame.after(2000, lambda: self.hint_label.config(text=""))
                 else:
@@ -124,8 +122,7 @@ class ReactionTestGame:
         self.title_label.pack(pady=(10, 5))
         self.reward_frame = ttk.Frame(self.frame)
         self.reward_frame.pack(pady=(5, 10))
-        batch_number = (self.level - 1) // 3
-        base_reward = 1 + 2 * batch_number
+        base_reward = level_reward(self.level)
         self.currency_icon = None
         try:
             import os
@@ -232,7 +229,7 @@ class ReactionTestGame:
         time_limit = max(0.3, 3.0 - (self.level * 0.1))
         time_diff = time_limit - reaction_time
         if reaction_time <= time_limit:
-            base_reward = 1 + 2 * ((self.level - 1) // 3)
+            base_reward = level_reward(self.level)
             self.currency_system.add_currency(base_reward)
             self.level += 1
             if self.pet_state and hasattr(self.pet_state, 'pet_manager'):
@@ -244,8 +241,7 @@ class ReactionTestGame:
             else:
                 feedback = "Just in time! ✅"
             self.status_label.config(text=f"{feedback}", foreground="#4CAF50")
-            new_batch_number = (self.level - 1) // 3
-            new_base_reward = 1 + 2 * new_batch_number
+            new_base_reward = level_reward(self.level)
             self.reward_label.config(text=f"Reward: {new_base_reward} coins")
             self.level_label.config(text=f"Level: {self.level}")
             new_time_limit = max(0.3, 3.0 - (self.level * 0.1))
@@ -256,8 +252,7 @@ class ReactionTestGame:
                 text=f"Too slow by {abs(time_diff):.2f}s! Try again",
                 foreground="#F44336"
             )
-            new_batch_number = (self.level - 1) // 3
-            new_base_reward = 1 + 2 * new_batch_number
+            new_base_reward = level_reward(self.level)
             self.reward_label.config(text=f"Reward: {new_base_reward} coins")
             self.level_label.config(text=f"Level: {self.level}")
             new_time_limit = max(0.3, 3.0 - (self.level * 0.1))
@@ -295,8 +290,7 @@ class BallClickerGame:
         self.title_label.grid(row=0, column=0, pady=(10, 5))
         self.reward_frame = ttk.Frame(self.frame)
         self.reward_frame.grid(row=1, column=0, pady=(5, 10))
-        batch_number = (self.level - 1) // 3
-        base_reward = 1 + 2 * batch_number
+        base_reward = level_reward(self.level)
         self.currency_icon = None
         try:
             import os
@@ -458,7 +452,7 @@ class BallClickerGame:
         if self.ball_spawn_timer:
             self.frame.after_cancel(self.ball_spawn_timer)
         self.canvas.delete('all')
-        base_reward = 1 + 2 * ((self.level - 1) // 3)
+        base_reward = level_reward(self.level)
         if success:
             self.currency_system.add_currency(base_reward)
             self.level += 1
@@ -475,8 +469,7 @@ class BallClickerGame:
                                   font=("Arial", 14, "bold"),
                                   fill="green",
                                   tags="end_message")
-            new_batch_number = (self.level - 1) // 3
-            new_base_reward = 1 + 2 * new_batch_number
+            new_base_reward = level_reward(self.level)
             self.reward_label.config(text=f"Reward: {new_base_reward} coins")
             self.level_label.config(text=f"Level {self.level}")
             self.start_button.config(
@@ -510,8 +503,7 @@ class BallClickerGame:
                                       font=("Arial", 14),
                                       fill="red",
                                       tags="end_message")
-            new_batch_number = (self.level - 1) // 3
-            new_base_reward = 1 + 2 * new_batch_number
+            new_base_reward = level_reward(self.level)
             self.reward_label.config(text=f"Reward: {new_base_reward} coins")
             self.level_label.config(text=f"Level {self.level}")
             self.start_button.config(
@@ -762,6 +754,7 @@ class GameHub:
                                         pady=8)
         self.instructions_label.pack(fill='x')
         self.update_currency_display()
+        get_scheduler(self.window).register('game_hub.currency', self.update_currency_display, 500, subsystem='ui')
         self.start_energy_monitoring()
         self.window.protocol("WM_DELETE_WINDOW", self.on_window_close)
     def start_energy_monitoring(self):
@@ -912,14 +905,14 @@ class GameHub:
     def on_window_close(self):
         """Handle window close event"""
         self.energy_check_active = False
+        get_scheduler(self.window).unregister('game_hub.currency')
         self.window.destroy()
     def create_number_guesser_game(self, level=1):
         game = NumberGuesserGame(self.notebook, self.currency_system, self.pet_state)
         game.level = level
         max_number = 10 + (game.level - 1)
         game.info_label.config(text=f"Level {game.level}\nGuess a number between 1-{max_number}")
-        batch_number = (game.level - 1) // 3
-        base_reward = 1 + 2 * batch_number
+        base_reward = level_reward(game.level)
         game.reward_label.config(text=f"Reward: {base_reward} coins")
         game.target_number = random.randint(1, max_number)
         game.guesses_left = 3 + ((game.level - 1) // 5)
@@ -930,8 +923,7 @@ class GameHub:
         game.level_label.config(text=f"Level: {game.level}")
         time_limit = max(0.3, 3.0 - (game.level * 0.1))
         game.goal_label.config(text=f"Goal: {time_limit:.2f}s")
-        batch_number = (game.level - 1) // 3
-        base_reward = 1 + 2 * batch_number
+        base_reward = level_reward(game.level)
         game.reward_label.config(text=f"Reward: {base_reward} coins")
         return game
     def create_ball_clicker_game(self, level=1):
@@ -940,14 +932,15 @@ class GameHub:
         game.level_label.config(text=f"Level {game.level}")
         game.required_clicks = 5 + game.level
         game.progress_label.config(text=f"Clicks: 0/{game.required_clicks}")
-        batch_number = (game.level - 1) // 3
-        base_reward = 1 + 2 * batch_number
+        base_reward = level_reward(game.level)
         game.reward_label.config(text=f"Reward: {base_reward} coins")
         return game
     def create_slot_machine_game(self):
         game = SlotMachineGame(self.notebook, self.currency_system, self.pet_state)
         return game
     def update_currency_display(self):
+        if not self.window.winfo_exists():
+            return False
         if hasattr(self, 'currency_label'):
             current_coins = self.currency_system.get_currency()
             self.currency_label.config(text=f"Coins: {current_coins}")
@@ -959,5 +952,4 @@ class GameHub:
                     self.window.after(200, lambda: self.icon_label.config(bg="#FFD700"))
                 self.currency_label.config(bg="#FFFFFF")
                 self.window.after(200, lambda: self.currency_label.config(bg="#FFD700"))
-            self.last_coins = current_coins
-        self.window.after(500, self.update_currency_display)
\ No newline at end of file
+            self.last_coins = current_coins
\ No newline at end of file
@@ -0,0 +1,118 @@
+import argparse
+import math
+import random
+import sys
+import time
+from frame_scheduler import get_scheduler
+from movement_engine import MOVE_TICK_MS
+from pet_animation import PetAnimation
+from pet_components import PetStats, PetGrowth
+from power_policy import PowerPolicy, RENDER_INTERVALS
+from renderer import HeadlessRoot
+# pet.animate's interval while the pet is active, the finest tick the checks below are measured on.
+TICK_SECONDS = RENDER_INTERVALS['active'] / 1000
+DRAW_OPS = ['canvas.create_image', 'canvas.itemconfigure', 'canvas.coords', 'canvas.delete']
+GEOMETRY_OPS = ['window.geometry']
+# Movement ticks that can land inside one render tick, plus one for a leg starting on the boundary.
+MAX_GEOMETRY_PER_TICK = math.ceil(RENDER_INTERVALS['active'] / MOVE_TICK_MS) + 1
+SETTINGS = {
+    'pet_size': 100,
+    'pet_color': 'black',
+    'movement_speed': 5,
+    'activity_level': 5,
+    'power_saver': 'off',
+    'fullscreen_suspend': True
+}
+class HeadlessPetState:
+    def __init__(self):
+        self.growth = PetGrowth(None)
+        self.stats = PetStats(self.growth)
+        self.growth.stats = self.stats
+        self.stage = 'Baby'
+        self.current_animation = 'Standing'
+        self.direction = 'left'
+        self.is_interacting = False
+        self.is_sleeping = False
+def make_pet():
+    root = HeadlessRoot()
+    pet_state = HeadlessPetState()
+    animation = PetAnimation(root, root.renderer.surface(), pet_state, dict(SETTINGS), root.renderer)
+    policy = PowerPolicy(root, pet_state, SETTINGS, get_scheduler(root))
+    return root, animation, policy
+def count(counts, ops):
+    return sum(counts[op] for op in ops)
+def run_ticks(root, ticks):
+    """Per-tick (draw, geometry, animate runs) for ticks render ticks of simulated time."""
+    task = get_scheduler(root).tasks['pet.animate']
+    per_tick = []
+    for _ in range(ticks):
+        mark = root.renderer.mark()
+        runs = task.runs
+        root.run_for(TICK_SECONDS)
+        counts = root.renderer.counts_since(mark)
+        per_tick.append((count(counts, DRAW_OPS), count(counts, GEOMETRY_OPS), task.runs - runs))
+    return per_tick
+def check(minutes=10, hidden_minutes=1, seed=0):
+    """Walk the pet for minutes, then hide it for hidden_minutes; returns (failures, report)."""
+    random.seed(seed)
+    root, animation, policy = make_pet()
+    scheduler = get_scheduler(root)
+    animation.start_random_movement()
+    started = time.perf_counter()
+    walking = run_ticks(root, int(minutes * 60 / TICK_SECONDS))
+    animate_runs = scheduler.tasks['pet.animate'].runs
+    movement = animation.movement.get_stats()
+    root.withdraw()
+    # Tk would deliver <Unmap> here and the policy re-evaluate at once; the headless root has no event loop.
+    policy.evaluate()
+    hidden = run_ticks(root, int(hidden_minutes * 60 / TICK_SECONDS))
+    elapsed = time.perf_counter() - started
+    draws = sum(tick[0] for tick in walking)
+    geometry = sum(tick[1] for tick in walking)
+    hidden_calls = sum(tick[0] + tick[1] for tick in hidden)
+    failures = []
+    if draws == 0:
+        failures.append("the pet never drew")
+    # Redraws only happen when the frame changes, so never more than one per pet.animate run.
+    overdrawn = [tick for tick in walking if tick[0] > max(1, tick[2])]
+    if overdrawn:
+        failures.append(f"{len(overdrawn)} render ticks drew more often than pet.animate ran, e.g. {overdrawn[0]}")
+    if draws > animate_runs:
+        failures.append(f"{draws} draw calls for {animate_runs} pet.animate runs")
+    if movement['moves'] == 0 or geometry == 0:
+        failures.append("the pet never moved")
+    if max(tick[1] for tick in walking) > MAX_GEOMETRY_PER_TICK:
+        failures.append(f"a render tick made {max(tick[1] for tick in walking)} window moves, "
+                        f"expected at most {MAX_GEOMETRY_PER_TICK}")
+    if geometry != movement['geometry_pushes']:
+        failures.append(f"{geometry} window moves recorded but the engine pushed {movement['geometry_pushes']}")
+    if hidden_calls:
+        failures.append(f"a hidden pet still made {hidden_calls} draw or move calls")
+    report = {
+        'simulated_minutes': minutes + hidden_minutes,
+        'elapsed_s': round(elapsed, 3),
+        'ticks': len(walking),
+        'draw_calls': draws,
+        'geometry_calls': geometry,
+        'animate_runs': animate_runs,
+        'moves': movement['moves'],
+        'hidden_calls': hidden_calls,
+        'power_mode': policy.mode
+    }
+    return failures, report
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the pet loop headless and check its draw and geometry calls per tick.")
+    parser.add_argument('--minutes', type=float, default=10, help="simulated minutes of walking")
+    parser.add_argument('--hidden-minutes', type=float, default=1, help="simulated minutes hidden afterwards")
+    parser.add_argument('--seed', type=int, default=0, help="seed for the wander routes")
+    args = parser.parse_args(argv)
+    failures, report = check(args.minutes, args.hidden_minutes, args.seed)
+    for key, value in report.items():
+        print(f"{key}: {value}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK")
+    return 1 if failures else 0
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+import argparse
+import json
+import os
+import tkinter as tk
+from main import VirtualPet
+from system_tray import create_household_menu
+HOUSEHOLD_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saves', 'household.json')
+DEFAULT_PET_NAME = "My Pet"
+PET_SPACING = 200
+class Household:
+    """Several pets in one process, each with its own window, stats and save; they share the Tk root, scheduler, sprite caches and tray icon."""
+    def __init__(self, root):
+        self.root = root
+        self.pets = []
+        self.lead = None
+        self.exiting = False
+    def add_pet(self, name):
+        if self.lead is None:
+            window = self.root
+        else:
+            window = tk.Toplevel(self.root)
+            # Gives this pet's loops and pausable subsystems their own names on the shared scheduler.
+            window.task_scope = f"{name.replace(' ', '_')}/"
+        pet = VirtualPet(window, self, name)
+        window.protocol("WM_DELETE_WINDOW", pet.exit_app)
+        if self.lead is None:
+            self.lead = pet
+        else:
+            pet.animation.movement.set_position(300 + PET_SPACING * len(self.pets), 300)
+        self.pets.append(pet)
+        return pet
+    def create_tray_menu(self):
+        return create_household_menu(list(self.pets), self.exit_app)
+    def exit_app(self):
+        self.exiting = True
+        for pet in self.pets:
+            pet.exit_app()
+def load_names(path=HOUSEHOLD_FILE):
+    if not os.path.exists(path):
+        return []
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get('pets', [])
+    except Exception as e:
+        print(f"Error loading household: {e}")
+        return []
+def save_names(names, path=HOUSEHOLD_FILE):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump({'pets': names}, f, indent=4)
+    except Exception as e:
+        print(f"Error saving household: {e}")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run several pets at once, each with its own window and save file.")
+    parser.add_argument('names', nargs='*', help="pet names, remembered for the next start; the first one is the main pet")
+    args = parser.parse_args(argv)
+    names = list(dict.fromkeys(args.names))
+    if names:
+        save_names(names)
+    names = names or load_names() or [DEFAULT_PET_NAME]
+    root = tk.Tk()
+    household = Household(root)
+    for name in names:
+        household.add_pet(name)
+    root.mainloop()
+if __name__ == "__main__":
+    main()
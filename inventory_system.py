@@ -4,6 +4,8 @@ from PIL import Image, ImageTk
 import os
 from datetime import datetime
 from unified_ui import COLORS
+from asset_loader import decode_icon
+from frame_scheduler import get_scheduler
 class InventoryItem:
     def __init__(self, name, image_path, description, quantity=1, max_quantity=99, unlimited=False, cost=0):
         self.name = name
@@ -16,15 +18,17 @@ class InventoryItem:
         self.image = None
         self.icon = None
         self.selected = False
-    def load_image(self, size=(32, 32)):
+    def load_image(self, size=(32, 32), asset_loader=None):
         try:
-            img = Image.open(self.image_path).convert("RGBA")
-            img = img.resize(size, Image.LANCZOS)
-            self.image = ImageTk.PhotoImage(img)
+            if asset_loader:
+                return asset_loader.load('item_icons', decode_icon, self.image_path, size, on_ready=self._set_image)
+            self._set_image(decode_icon(self.image_path, size))
             return True
         except Exception as e:
             print(f"Error loading item image {self.image_path}: {e}")
             return False
+    def _set_image(self, img):
+        self.image = ImageTk.PhotoImage(img)
     def update_currency_display(self):
         if hasattr(self.pet_state, 'currency_label'):
             self.pet_state.currency_label.config(
@@ -79,8 +83,10 @@ class InventorySystem:
         self.item_buttons = []
         self.item_cursor_id = None
         self.original_cursor = None
+        self.scheduler = get_scheduler(self.root)
         self.load_default_items()
     def load_default_items(self):
+        asset_loader = getattr(getattr(self.pet_state, 'pet_manager', None), 'asset_loader', None)
         try:
             img_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img_assets')
             toilet_paper_path = os.path.join(img_path, 'toilet_paper.png')
@@ -92,7 +98,7 @@ class InventorySystem:
                     quantity=1,
                     unlimited=True
                 )
-                toilet_paper.load_image()
+                toilet_paper.load_image(asset_loader=asset_loader)
                 self.items["toilet_paper"] = toilet_paper
             shower_path = os.path.join(img_path, 'shower.png')
             if os.path.exists(shower_path):
@@ -103,7 +109,7 @@ class InventorySystem:
                     quantity=1,
                     unlimited=True
                 )
-                shower.load_image()
+                shower.load_image(asset_loader=asset_loader)
                 self.items["shower"] = shower
                 first_aid_path = os.path.join(img_path, 'First_Aid.png')
                 if os.path.exists(first_aid_path):
@@ -114,7 +120,7 @@ class InventorySystem:
                         quantity=0,
                         cost=100
                     )
-                    first_aid.load_image()
+                    first_aid.load_image(asset_loader=asset_loader)
                     self.items["first_aid"] = first_aid
                 enchanted_apple_path = os.path.join(img_path, 'Enchanted_Apple.png')
                 if os.path.exists(enchanted_apple_path):
@@ -125,7 +131,7 @@ class InventorySystem:
                         quantity=0,
                         cost=250
                     )
-                    enchanted_apple.load_image()
+                    enchanted_apple.load_image(asset_loader=asset_loader)
                     self.items["enchanted_apple"] = enchanted_apple
                 sleeping_path = os.path.join(img_path, 'sleeping.png')
                 if os.path.exists(sleeping_path):
@@ -137,7 +143,7 @@ class InventorySystem:
                         unlimited=True,
                         cost=0
                     )
-                    sleeping.load_image()
+                    sleeping.load_image(asset_loader=asset_loader)
                     self.items["sleeping"] = sleeping
             evo1_path = os.path.join(img_path, 'Evo1.png')
             if os.path.exists(evo1_path):
@@ -148,7 +154,7 @@ class InventorySystem:
                     quantity=0,
                     max_quantity=1
                 )
-                evo1.load_image()
+                evo1.load_image(asset_loader=asset_loader)
                 self.items["evo1"] = evo1
             evo2_path = os.path.join(img_path, 'Evo2.png')
             if os.path.exists(evo2_path):
@@ -159,7 +165,7 @@ class InventorySystem:
                     quantity=0,
                     max_quantity=1
                 )
-                evo2.load_image()
+                evo2.load_image(asset_loader=asset_loader)
                 self.items["evo2"] = evo2
             food_items = [
                 ("apple", "Apple", "Hunger: +8, Happiness: +3, Energy: +4, Health: +6, Cleanliness: +1", 15),
@@ -186,7 +192,7 @@ class InventorySystem:
                         description=desc,
                         quantity=0
                     )
-                    item.load_image()
+                    item.load_image(asset_loader=asset_loader)
                     self.items[item_id] = item
         except Exception as e:
             print(f"Error loading default inventory items: {e}")
@@ -839,11 +845,12 @@ class InventorySystem:
             fill="white",
             tags="sleep_timer"
         )
-        self.update_sleep_timer()
+        if self.update_sleep_timer():
+            self.scheduler.register('inventory.sleep_timer', self.update_sleep_timer, 1000, subsystem='ui')
     def update_sleep_timer(self):
         """Update the sleep timer display"""
         if not hasattr(self.pet_state, 'sleep_timer_id') or not hasattr(self.pet_state, 'sleep_end_time'):
-            return
+            return False
         current_time = datetime.now().timestamp()
         remaining = self.pet_state.sleep_end_time - current_time
         if remaining > 0:
@@ -851,10 +858,9 @@ class InventorySystem:
             seconds = int(remaining % 60)
             timer_text = f"Sleep: {minutes:02d}:{seconds:02d}"
             self.canvas.itemconfig(self.pet_state.sleep_timer_id, text=timer_text)
-            if hasattr(self.pet_state, 'is_sleeping') and self.pet_state.is_sleeping:
-                self.root.after(1000, self.update_sleep_timer)
-        else:
-            self.clear_sleep_timer()
+            return hasattr(self.pet_state, 'is_sleeping') and self.pet_state.is_sleeping
+        self.clear_sleep_timer()
+        return False
     def clear_sleep_timer(self):
         """Clear the sleep timer display"""
         if hasattr(self.pet_state, 'sleep_timer_id'):
@@ -862,12 +868,16 @@ class InventorySystem:
             delattr(self.pet_state, 'sleep_timer_id')
     def start_energy_recovery(self):
         """Start gradual energy recovery during sleep"""
-        if not hasattr(self.pet_state, 'is_sleeping') or not self.pet_state.is_sleeping:
+        if self.scheduler.is_registered('pet.energy_recovery'):
             return
+        self.scheduler.register('pet.energy_recovery', self.recover_energy_step, 2000, subsystem='simulation', delay_ms=0)
+    def recover_energy_step(self):
+        if not hasattr(self.pet_state, 'is_sleeping') or not self.pet_state.is_sleeping:
+            return False
         current_energy = self.pet_state.stats.stats.get('energy', 100)
         if current_energy >= 100:
             self.wake_up_pet()
-            return
+            return False
         missing_energy = 100 - current_energy
         recovery_rate = max(1, missing_energy // 50)
         self.pet_state.stats.modify_stat('energy', recovery_rate)
@@ -876,8 +886,7 @@ class InventorySystem:
             self.pet_state.stats.modify_stat('hunger', -hunger_drop)
         if hasattr(self.pet_state, 'update_stats_display'):
             self.pet_state.update_stats_display()
-        if hasattr(self.pet_state, 'is_sleeping') and self.pet_state.is_sleeping:
-            self.root.after(2000, self.start_energy_recovery)
+        return hasattr(self.pet_state, 'is_sleeping') and self.pet_state.is_sleeping
     def wake_up_pet(self):
         """Wake up the pet from sleep"""
         if hasattr(self.pet_state, 'is_sleeping') and self.pet_state.is_sleeping:
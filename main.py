@@ -19,6 +19,10 @@ from inventory_system import InventorySystem
 from pet_animation import PetAnimation
 from pet_components import PetStats, PetGrowth
 from treasure_system import TreasureSystem
+from asset_loader import AssetLoader
+from frame_scheduler import get_scheduler
+from power_policy import PowerPolicy
+from renderer import TkRenderer
 class PetState:
     def __init__(self):
         self.growth = PetGrowth(None)
@@ -41,15 +45,19 @@ class PetState:
         if hasattr(self, 'pet_manager') and hasattr(self.pet_manager, 'animation'):
             self.pet_manager.animation.update_pet_image()
 class VirtualPet:
-    def __init__(self, root):
+    def __init__(self, root, household=None, name="My Pet"):
         self.root = root
+        self.household = household
+        # Pets after the first in a household reuse its asset loader and sprite caches and leave the tray to it.
+        self.lead = getattr(household, 'lead', None)
         self.root.overrideredirect(True)
         self.root.geometry("256x256+300+300")
         self.root.attributes('-topmost', True)
         self.save_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saves')
         os.makedirs(self.save_path, exist_ok=True)
         self.last_save = None
-        self._name = "My Pet"
+        self._name = name
+        self.settings_file = 'settings.json' if self.lead is None else f"{name.replace(' ', '_')}_settings.json"
         self.running = True
         self.settings = {
             'always_on_top': True,
@@ -61,8 +69,13 @@ class VirtualPet:
             'activity_level': 5,
             'poop_frequency': 0.2,
             'pet_color': 'black',
-            'context_awareness_enabled': True
+            'context_awareness_enabled': True,
+            'sprite_memory_mb': 16,
+            'power_saver': 'auto',
+            'fullscreen_suspend': True
         }
+        if self.lead is not None:
+            self.settings.update(self.lead.settings)
         self.pet_state = PetState()
         self.pet_state.pet_manager = self
         self.pet_state.stats.pet_state = self.pet_state
@@ -81,28 +94,33 @@ class VirtualPet:
                 pass
         else:
             pass
-        self.animation = PetAnimation(root, self.canvas, self.pet_state, self.settings)
+        self.scheduler = get_scheduler(self.root)
+        self.asset_loader = self.lead.asset_loader if self.lead is not None else AssetLoader()
+        self.renderer = TkRenderer(self.root)
+        self.animation = PetAnimation(root, self.canvas, self.pet_state, self.settings, self.renderer,
+                                      sprites_from=self.lead.animation if self.lead is not None else None)
         def check_context_awareness():
             if hasattr(self, 'context_awareness') and self.context_awareness:
                 try:
                     self.context_awareness.update_context_awareness()
                 except Exception as e:
                     pass
-            self.root.after(3000, check_context_awareness)
         if self.settings.get('context_awareness_enabled', True):
-            self.root.after(5000, check_context_awareness)
-        self.speech_bubble = SpeechBubble(self.canvas, self.root)
+            self.scheduler.register('context_awareness', check_context_awareness, 3000,
+                                    subsystem='simulation', delay_ms=5000)
+        self.speech_bubble = SpeechBubble(self.canvas, self.root, self.renderer)
+        self.animation.movement.attach_overlay('speech_bubble', self.speech_bubble.follow_pet)
         self.status_panel = SimpleStatusPanel(root, self)
         self.sleep_timer_label = None
-        self.sleep_timer_update_id = None
         print("Initializing poop system...")
-        self.poop_system = PoopSystem(self.root, self.canvas, self.pet_state)
+        self.poop_system = PoopSystem(self.root, self.canvas, self.pet_state, self.renderer)
         self.pet_state.poop_system = self.poop_system
         print(f"Poop system initialized with realistic pressure-based mechanics")
         self.inventory_system = InventorySystem(self.root, self.canvas, self.pet_state)
-        self.treasure_system = TreasureSystem(self.root, self.canvas, self.pet_state, self.inventory_system, self)
+        self.treasure_system = TreasureSystem(self.root, self.canvas, self.pet_state, self.inventory_system, self, self.renderer)
         self.pet_state.treasure_system = self.treasure_system
         self.auto_load_pet()
+        self.asset_loader.finish()
         self.last_click_time = 0
         self.last_happiness_boost_time = 0
         self.happiness_boost_cooldown = 0
@@ -115,9 +133,12 @@ class VirtualPet:
         self.canvas.bind('<ButtonRelease-1>', self.handle_drag_end)
         self.canvas.bind('<Double-Button-1>', self.handle_double_click)
         self.update_state()
+        self.scheduler.register('pet.update_state', self.update_state, 5000, subsystem='simulation')
+        self.power_policy = PowerPolicy(self.root, self.pet_state, self.settings, self.scheduler)
         if hasattr(self.animation, 'start_random_movement'):
             self.animation.start_random_movement()
-        self.setup_system_tray()
+        if self.lead is None:
+            self.setup_system_tray()
         alpha = int(255 * (100 - self.settings['transparency']) / 100)
         self.root.attributes('-alpha', alpha/255)
         if hasattr(self.animation, 'handle_color_change'):
@@ -145,6 +166,8 @@ class VirtualPet:
             evolution_occurred = self.pet_state.growth.check_evolution()
             if evolution_occurred:
                 self.pet_state.stage = self.pet_state.growth.stage
+            elif hasattr(self.animation, 'preload_upcoming_sprites'):
+                self.animation.preload_upcoming_sprites()
         if hasattr(self, 'poop_system'):
             self.poop_system.check_poop_generation(
                 self.root.winfo_x() + self.canvas.winfo_width() // 2,
@@ -163,7 +186,6 @@ class VirtualPet:
             self.save_pet()
             self.save_settings()
             self.update_counter = 0
-        self.root.after(5000, self.update_state)
     def check_sickness_status(self):
         is_sick = False
         for stat in ['hunger', 'happiness', 'energy', 'health', 'cleanliness', 'social']:
@@ -341,6 +363,7 @@ class VirtualPet:
             'inventory': {item_id: item.quantity for item_id, item in self.inventory_system.items.items() if not item.unlimited},
             'creation_date': datetime.now().isoformat(),
             'save_date': datetime.now().isoformat(),
+            'last_update': self.pet_state.stats.last_update.isoformat(),
             'is_sleeping': self.pet_state.is_sleeping,
             'sleep_start_time': self.pet_state.sleep_start_time.isoformat() if self.pet_state.sleep_start_time else None,
             'sleep_duration': getattr(self.pet_state, 'sleep_duration', None),
@@ -433,6 +456,12 @@ class VirtualPet:
                 self.pet_state.sleep_duration = save_data['sleep_duration']
             if 'poop_system_dirty' in save_data:
                 self.pet_state.poop_system_dirty = save_data['poop_system_dirty']
+            last_update = save_data.get('last_update') or save_data.get('save_date')
+            if last_update:
+                self.pet_state.stats.last_update = datetime.fromisoformat(last_update)
+                result = self.pet_state.stats.catch_up()
+                if result:
+                    print(f"Caught up time away: slept {result['sleeps']} times, sick for {result['sick_minutes']:.0f} minutes")
             self.last_save = os.path.basename(filepath)
             if 'treasure_system' in save_data and hasattr(self, 'treasure_system'):
                 self.treasure_system.load_save_data(save_data['treasure_system'])
@@ -529,12 +558,11 @@ class VirtualPet:
         y = self.root.winfo_y() + event.y
         self.status_panel.show_panel(x, y)
         self.schedule_resume_movement(5000)
-        self.root.after(100, self.update_sleep_timer_display)
+        self.scheduler.register('status_panel.sleep_timer', self.update_sleep_timer_display, 1000,
+                                subsystem='ui', delay_ms=100)
     def on_stats_panel_closed(self):
         self.schedule_resume_movement(200)
-        if self.sleep_timer_update_id:
-            self.root.after_cancel(self.sleep_timer_update_id)
-            self.sleep_timer_update_id = None
+        self.scheduler.unregister('status_panel.sleep_timer')
         if self.sleep_timer_label:
             self.sleep_timer_label.destroy()
             self.sleep_timer_label = None
@@ -543,7 +571,7 @@ class VirtualPet:
     def update_sleep_timer_display(self):
         """Update the sleep timer in the status panel to show remaining time"""
         if not self.status_panel or not self.status_panel.panel_window or not self.status_panel.panel_window.winfo_exists():
-            return
+            return False
         if hasattr(self.pet_state, 'is_sleeping') and self.pet_state.is_sleeping:
             if self.pet_state.sleep_start_time is None:
                 self.pet_state.sleep_start_time = datetime.now()
@@ -569,10 +597,11 @@ class VirtualPet:
                     self.sleep_timer_label.config(text=timer_text)
                 else:
                     self.sleep_timer_label = None
-            self.sleep_timer_update_id = self.root.after(1000, self.update_sleep_timer_display)
-        elif self.sleep_timer_label:
+            return True
+        if self.sleep_timer_label:
             self.sleep_timer_label.destroy()
             self.sleep_timer_label = None
+        return False
     def show_game_hub(self, parent_window=None):
         from game_hub import GameHub
         from currency_system import CurrencySystem
@@ -583,7 +612,7 @@ class VirtualPet:
         self.pause_movement()
         x = self.root.winfo_x() + event.x - 128
         y = self.root.winfo_y() + event.y - 128
-        self.root.geometry(f'+{x}+{y}')
+        self.animation.movement.set_position(x, y)
     def handle_drag_end(self, event):
         self.schedule_resume_movement(500)
     def pause_movement(self):
@@ -598,7 +627,8 @@ class VirtualPet:
             self.resume_timer = None
     def setup_system_tray(self):
         from system_tray import setup_system_tray
-        self.icon = setup_system_tray(self, self.show_settings, self.exit_app)
+        create_menu = self.household.create_tray_menu if self.household is not None else None
+        self.icon = setup_system_tray(self, self.show_settings, self.exit_app, create_menu=create_menu)
         try:
             dummy = self.icon.menu
             if hasattr(self.icon, '_update_menu'):
@@ -638,6 +668,8 @@ class VirtualPet:
         settings_window = SimpleUI(self.root)
         settings_window.show_settings(self)
     def exit_app(self):
+        if self.household is not None and not self.household.exiting:
+            return self.household.exit_app()
         print("Saving pet data before exit...")
         try:
             success, message = self.save_pet()
@@ -673,6 +705,12 @@ class VirtualPet:
                 self.animation.handle_size_change(old_value, value)
             else:
                 self.handle_size_change(old_value, value)
+        elif setting_name == 'sprite_memory_mb':
+            if hasattr(self.animation, 'sprite_store'):
+                self.animation.sprite_store.set_budget(int(value * 1024 * 1024))
+        elif setting_name == 'power_saver':
+            if hasattr(self, 'power_policy'):
+                self.power_policy.evaluate()
         self.save_settings()
     def handle_color_change(self, old_color, new_color):
         print(f"Pet color changed from {old_color} to {new_color}")
@@ -689,7 +727,7 @@ class VirtualPet:
         import os
         settings_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saves')
         os.makedirs(settings_dir, exist_ok=True)
-        settings_file = os.path.join(settings_dir, 'settings.json')
+        settings_file = os.path.join(settings_dir, self.settings_file)
         try:
             with open(settings_file, 'w') as f:
                 json.dump(self.settings, f, indent=4)
@@ -710,7 +748,8 @@ class VirtualPet:
                 else:
                     print(f"Failed to load pet: {error}")
             save_files = self.get_save_files()
-            if save_files:
+            # A lone pet adopts the most recent save; household pets keep to their own name or start fresh.
+            if save_files and self.household is None:
                 most_recent = None
                 most_recent_time = 0
                 for save_file in save_files:
@@ -741,7 +780,7 @@ class VirtualPet:
     def load_settings(self):
         import json
         import os
-        settings_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saves', 'settings.json')
+        settings_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saves', self.settings_file)
         if os.path.exists(settings_file):
             try:
                 with open(settings_file, 'r') as f:
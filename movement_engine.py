@@ -0,0 +1,120 @@
+import math
+import time
+PIXELS_PER_SECOND_PER_SPEED = 20
+MOVE_TICK_MS = 33
+MAX_STEP_GAP = 0.25
+def ease_in_out(t):
+    return t * t * (3 - 2 * t)
+def linear(t):
+    return t
+class MovementEngine:
+    def __init__(self, root, scheduler, clock=time.monotonic, task_name='pet.move', tick_ms=MOVE_TICK_MS):
+        self.root = root
+        self.scheduler = scheduler
+        self.clock = clock
+        self.task_name = task_name
+        self.tick_ms = tick_ms
+        self.x = None
+        self.y = None
+        self.pushed = None
+        self.start = None
+        self.target = None
+        self.start_time = 0.0
+        self.last_step = 0.0
+        self.duration = 0.0
+        self.easing = ease_in_out
+        self.on_step = None
+        self.on_arrive = None
+        self.overlays = {}
+        self.moves = 0
+        self.ticks = 0
+        self.geometry_pushes = 0
+        self.position_reads = 0
+    def sync(self):
+        """Re-read the window position, for when something other than the engine has moved it."""
+        self.x = float(self.root.winfo_x())
+        self.y = float(self.root.winfo_y())
+        self.pushed = (int(round(self.x)), int(round(self.y)))
+        self.position_reads += 1
+    def position(self):
+        if self.x is None:
+            self.sync()
+        return int(round(self.x)), int(round(self.y))
+    def set_position(self, x, y):
+        self.x = float(x)
+        self.y = float(y)
+        self._push()
+    def _push(self):
+        position = (int(round(self.x)), int(round(self.y)))
+        if position == self.pushed:
+            return False
+        self.root.geometry(f'+{position[0]}+{position[1]}')
+        self.pushed = position
+        self.geometry_pushes += 1
+        self._layout(position)
+        return True
+    def attach_overlay(self, name, place):
+        """Call place(x, y) with the pet's new position every time the window is moved, in the same tick."""
+        self.overlays[name] = place
+    def detach_overlay(self, name):
+        self.overlays.pop(name, None)
+    def _layout(self, position):
+        for name, place in list(self.overlays.items()):
+            try:
+                place(*position)
+            except Exception as e:
+                print(f"Error placing overlay {name}: {e}")
+    def is_moving(self):
+        return self.target is not None and self.scheduler.is_registered(self.task_name)
+    def move_to(self, x, y, speed, easing=ease_in_out, on_step=None, on_arrive=None):
+        """Glide to (x, y) at an average of speed pixels per second, placing the window by elapsed time rather than tick count."""
+        # The engine's own position is authoritative once set; reading the window back between legs can return a
+        # geometry Tk has not applied yet and snap the pet backwards at every waypoint.
+        if self.x is None:
+            self.sync()
+        self.start = (self.x, self.y)
+        self.target = (float(x), float(y))
+        self.duration = math.hypot(self.target[0] - self.x, self.target[1] - self.y) / max(1, speed)
+        self.start_time = self.clock()
+        self.last_step = self.start_time
+        self.easing = easing
+        self.on_step = on_step
+        self.on_arrive = on_arrive
+        self.moves += 1
+        self.scheduler.register(self.task_name, self._step, self.tick_ms, priority=5,
+                                subsystem='movement', delay_ms=0, replace=True)
+    def stop(self):
+        self.target = None
+        self.scheduler.unregister(self.task_name)
+    def _step(self):
+        if self.target is None:
+            return False
+        self.ticks += 1
+        now = self.clock()
+        # After a pause or a long stall, carry on from where the pet was instead of jumping ahead.
+        if now - self.last_step > MAX_STEP_GAP:
+            self.start_time += now - self.last_step - self.tick_ms / 1000
+        self.last_step = now
+        elapsed = now - self.start_time
+        progress = 1.0 if self.duration <= 0 else min(1.0, elapsed / self.duration)
+        eased = self.easing(progress)
+        self.x = self.start[0] + (self.target[0] - self.start[0]) * eased
+        self.y = self.start[1] + (self.target[1] - self.start[1]) * eased
+        self._push()
+        if progress >= 1.0:
+            on_arrive = self.on_arrive
+            self.target = None
+            if on_arrive:
+                on_arrive()
+            return False
+        if self.on_step is not None and self.on_step() is False:
+            self.target = None
+            return False
+        return True
+    def get_stats(self):
+        return {
+            'moves': self.moves,
+            'ticks': self.ticks,
+            'geometry_pushes': self.geometry_pushes,
+            'position_reads': self.position_reads
+        }
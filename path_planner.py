@@ -0,0 +1,236 @@
+import os
+import math
+import heapq
+import random
+try:
+    import win32gui
+    import win32process
+except ImportError:
+    win32gui = None
+    win32process = None
+PET_SIZE = 256
+CLEARANCE = 20
+CELL_SIZE = 256
+MAX_WINDOWS = 12
+TARGET_SAMPLES = 24
+POOP_SIZE = 32
+CHEST_PADDING = 40
+class ObstacleIndex:
+    """Occupied screen rectangles bucketed on a uniform grid, so a query only looks at nearby ones."""
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.rects = []
+        self.cells = {}
+    def _cells_for(self, rect):
+        left, top, right, bottom = rect
+        for cx in range(int(left) // self.cell_size, int(right) // self.cell_size + 1):
+            for cy in range(int(top) // self.cell_size, int(bottom) // self.cell_size + 1):
+                yield cx, cy
+    def add(self, rect, kind):
+        index = len(self.rects)
+        self.rects.append((rect, kind))
+        for cell in self._cells_for(rect):
+            self.cells.setdefault(cell, []).append(index)
+    def query(self, rect):
+        seen = set()
+        for cell in self._cells_for(rect):
+            for index in self.cells.get(cell, ()):
+                if index not in seen:
+                    seen.add(index)
+                    if rects_overlap(self.rects[index][0], rect):
+                        yield self.rects[index]
+    def __len__(self):
+        return len(self.rects)
+def rects_overlap(a, b):
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+def segment_hits_rect(start, end, rect):
+    """Slab test: whether the segment from start to end passes through the open rectangle."""
+    t0, t1 = 0.0, 1.0
+    for axis in (0, 1):
+        delta = end[axis] - start[axis]
+        low, high = rect[axis], rect[axis + 2]
+        if delta == 0:
+            if not low < start[axis] < high:
+                return False
+            continue
+        near, far = (low - start[axis]) / delta, (high - start[axis]) / delta
+        if near > far:
+            near, far = far, near
+        t0, t1 = max(t0, near), min(t1, far)
+        if t0 >= t1:
+            return False
+    return True
+class PathPlanner:
+    def __init__(self, root, pet_manager=None, pet_size=PET_SIZE, clearance=CLEARANCE, rng=random):
+        self.root = root
+        self.pet_manager = pet_manager
+        self.pet_size = pet_size
+        self.clearance = clearance
+        self.rng = rng
+        self.plans = 0
+        self.detours = 0
+        self.fallbacks = 0
+    def _screen(self):
+        return self.root.winfo_screenwidth(), self.root.winfo_screenheight()
+    def _footprint_top(self):
+        """How far above the window top the pet's footprint reaches, to keep room for a showing speech bubble."""
+        bubble = getattr(getattr(self.pet_manager, 'speech_bubble', None), 'bubble_window', None)
+        if not bubble:
+            return 0
+        try:
+            return max(0, bubble.winfo_height() - 100 + 10)
+        except Exception:
+            return 0
+    def _window_rects(self, screen_width, screen_height):
+        if win32gui is None:
+            return []
+        rects = []
+        own_pid = os.getpid()
+        def collect(hwnd, _):
+            if len(rects) >= MAX_WINDOWS:
+                return True
+            try:
+                if not win32gui.IsWindowVisible(hwnd) or win32gui.IsIconic(hwnd) or not win32gui.GetWindowText(hwnd):
+                    return True
+                if win32process.GetWindowThreadProcessId(hwnd)[1] == own_pid:
+                    return True
+                left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            except Exception:
+                return True
+            width, height = right - left, bottom - top
+            # Maximized windows and the desktop cover everything, avoiding them would leave nowhere to go.
+            if width <= 0 or height <= 0 or width * height >= 0.9 * screen_width * screen_height:
+                return True
+            rects.append((left, top, right, bottom))
+            return True
+        try:
+            win32gui.EnumWindows(collect, None)
+        except Exception as e:
+            print(f"Error listing windows for path planning: {e}")
+        return rects
+    def collect_obstacles(self):
+        """Index every occupied rectangle, inflated so the pet can be planned as a point at its top-left corner."""
+        screen_width, screen_height = self._screen()
+        index = ObstacleIndex()
+        footprint_top = self._footprint_top()
+        def add(rect, kind):
+            left, top, right, bottom = rect
+            index.add((left - self.pet_size - self.clearance, top - self.pet_size - self.clearance,
+                       right + self.clearance, bottom + footprint_top + self.clearance), kind)
+        for rect in self._window_rects(screen_width, screen_height):
+            add(rect, 'window')
+        poop_system = getattr(self.pet_manager, 'poop_system', None)
+        for poop in getattr(poop_system, 'poops', []):
+            add((poop['abs_x'], poop['abs_y'], poop['abs_x'] + POOP_SIZE, poop['abs_y'] + POOP_SIZE), 'poop')
+        treasure_system = getattr(self.pet_manager, 'treasure_system', None)
+        if treasure_system and getattr(treasure_system, 'chest_window', None):
+            chest_w = getattr(treasure_system, 'chest_width', 64) + CHEST_PADDING
+            chest_h = getattr(treasure_system, 'chest_height', 64) + CHEST_PADDING
+            add((treasure_system.chest_x, treasure_system.chest_y,
+                 treasure_system.chest_x + chest_w, treasure_system.chest_y + chest_h), 'chest')
+        return index
+    def is_free(self, position, index=None, ignore=(), kinds=None):
+        index = index if index is not None else self.collect_obstacles()
+        point = (position[0], position[1], position[0] + 1, position[1] + 1)
+        return not any(rect not in ignore and (kinds is None or kind in kinds) for rect, kind in index.query(point))
+    def _path_clear(self, start, end, index, ignore):
+        box = (min(start[0], end[0]), min(start[1], end[1]), max(start[0], end[0]) + 1, max(start[1], end[1]) + 1)
+        return not any(rect not in ignore and segment_hits_rect(start, end, rect) for rect, kind in index.query(box))
+    def _bounds(self, min_y):
+        screen_width, screen_height = self._screen()
+        return 0, min_y, max(0, screen_width - self.pet_size), max(min_y, screen_height - self.pet_size)
+    def _route(self, start, goal, index, ignore, bounds):
+        """Shortest route over the free corners of the inflated obstacles (a visibility graph), straight when clear."""
+        if self._path_clear(start, goal, index, ignore):
+            return [goal]
+        nodes = [start, goal]
+        for rect, kind in index.rects:
+            if rect in ignore:
+                continue
+            for corner in ((rect[0] - 1, rect[1] - 1), (rect[2] + 1, rect[1] - 1),
+                           (rect[0] - 1, rect[3] + 1), (rect[2] + 1, rect[3] + 1)):
+                if (bounds[0] <= corner[0] <= bounds[2] and bounds[1] <= corner[1] <= bounds[3] and
+                        self.is_free(corner, index, ignore)):
+                    nodes.append(corner)
+        distances = {0: 0.0}
+        previous = {}
+        heap = [(0.0, 0)]
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if node == 1:
+                break
+            if distance > distances.get(node, float('inf')):
+                continue
+            for other in range(1, len(nodes)):
+                if other == node:
+                    continue
+                step = math.hypot(nodes[other][0] - nodes[node][0], nodes[other][1] - nodes[node][1])
+                if distance + step >= distances.get(other, float('inf')):
+                    continue
+                if not self._path_clear(nodes[node], nodes[other], index, ignore):
+                    continue
+                distances[other] = distance + step
+                previous[other] = node
+                heapq.heappush(heap, (distance + step, other))
+        if 1 not in previous:
+            return None
+        route = []
+        node = 1
+        while node != 0:
+            route.append((int(nodes[node][0]), int(nodes[node][1])))
+            node = previous[node]
+        self.detours += 1
+        return route[::-1]
+    def _ignored_at(self, start, index):
+        # Whatever the pet is already standing on (usually its own fresh poop) must not block it from leaving.
+        point = (start[0], start[1], start[0] + 1, start[1] + 1)
+        return {rect for rect, kind in index.query(point)}
+    def plan_wander(self, start, min_y=0):
+        """Pick a random free target and a route to it, or None when nothing free and reachable was sampled."""
+        self.plans += 1
+        index = self.collect_obstacles()
+        bounds = self._bounds(min_y)
+        ignore = self._ignored_at(start, index)
+        blocked = []
+        for _ in range(TARGET_SAMPLES):
+            goal = (self.rng.randint(bounds[0], bounds[2]), self.rng.randint(bounds[1], bounds[3]))
+            if not self.is_free(goal, index):
+                continue
+            if self._path_clear(start, goal, index, ignore):
+                return [goal]
+            blocked.append(goal)
+        # Only search for a detour when no sampled target could be walked to in a straight line.
+        for goal in blocked[:2]:
+            route = self._route(start, goal, index, ignore, bounds)
+            if route:
+                return route
+        self.fallbacks += 1
+        return None
+    def plan_escape(self, start, min_y=0, kinds=('window',)):
+        """Route to the nearest free spot when the pet overlaps one of kinds; [] when it is already clear, None if stuck."""
+        self.plans += 1
+        index = self.collect_obstacles()
+        if self.is_free(start, index, kinds=kinds):
+            return []
+        bounds = self._bounds(min_y)
+        ignore = self._ignored_at(start, index)
+        candidates = []
+        for rect, kind in index.rects:
+            for x, y in ((rect[0] - 1, start[1]), (rect[2] + 1, start[1]), (start[0], rect[1] - 1), (start[0], rect[3] + 1)):
+                x = min(max(x, bounds[0]), bounds[2])
+                y = min(max(y, bounds[1]), bounds[3])
+                candidates.append(((x - start[0]) ** 2 + (y - start[1]) ** 2, (int(x), int(y))))
+        for distance, goal in sorted(candidates):
+            if not self.is_free(goal, index):
+                continue
+            route = self._route(start, goal, index, ignore, bounds)
+            if route:
+                return route
+        self.fallbacks += 1
+        return None
+    def get_stats(self):
+        return {
+            'plans': self.plans,
+            'detours': self.detours,
+            'fallbacks': self.fallbacks
+        }
@@ -1,43 +1,91 @@
 import tkinter as tk
-from PIL import Image, ImageTk
+from PIL import Image
 import os
-import math
 import random
 import time
 from datetime import datetime
+from sprite_cache import SpriteCache
+from sprite_atlas import SpriteAtlas
+from frame_manifest import FrameManifest
+from sprite_store import SpriteStore
+from sprite_preloader import SpritePreloader
+from sprite_scaler import SpriteScaler
+from sprite_pack import SpritePack
+from asset_loader import decode_icon
+from frame_scheduler import get_scheduler
+from movement_engine import MovementEngine, PIXELS_PER_SECOND_PER_SPEED, MAX_STEP_GAP
+from path_planner import PathPlanner
+from renderer import TkRenderer
+from animation_graph import AnimationGraph
 class PetAnimation:
-    def __init__(self, root, canvas, pet_state, settings):
+    PET_COLORS = ['black', 'blue', 'pink']
+    PRELOAD_DAYS_BEFORE_EVOLUTION = 1
+    WALK_POOP_CHECK_SECONDS = 0.05
+    FRAME_STATES = ['Walk1', 'Walk2', 'Happy', 'Sleep1', 'Sleep2',
+                    'Eat1', 'Eat2', 'Attack', 'Angry', 'Lose1', 'Refuse']
+    SHARED_SPRITE_ATTRS = ['sprite_cache', 'sprite_atlas', 'sprite_pack', 'frame_manifest',
+                           'sprite_scaler', 'sprite_store', 'sprite_preloader']
+    def __init__(self, root, canvas, pet_state, settings, renderer=None, sprites_from=None):
         self.root = root
         self.canvas = canvas
+        self.renderer = renderer or TkRenderer(root)
         self.pet_state = pet_state
         self.settings = settings
         self.animations = {}
-        self.movement_timer = None
-        self.movement_step_timer = None
-        self.resume_timer = None
+        self.animations_key = None
+        self.pet_item_id = None
+        self.rendered_key = None
+        self.animation_graph = AnimationGraph()
+        self.compiled_key = None
+        self.load_timings = {}
+        self.missing_frames = set()
         self.target_x = None
         self.target_y = None
+        self.last_poop_check = 0.0
         self.last_sleep_time = datetime.now()
         self.sickness_icon = None
         self.sickness_icon_id = None
-        self.sickness_blink_timer = None
         self.sickness_visible = True
+        self.scheduler = get_scheduler(self.root)
+        self.movement = MovementEngine(self.root, self.scheduler, self.scheduler.clock)
+        self.path_planner = PathPlanner(self.root, getattr(self.pet_state, 'pet_manager', None))
+        if sprites_from is not None:
+            # Another pet's caches, so identical (stage, color, size) frame sets are decoded and held once per process.
+            for name in self.SHARED_SPRITE_ATTRS:
+                setattr(self, name, getattr(sprites_from, name))
+        else:
+            self.sprite_cache = SpriteCache()
+            self.sprite_atlas = SpriteAtlas.load()
+            self.sprite_pack = SpritePack.load()
+            self.frame_manifest = FrameManifest(
+                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frames'), self.sprite_atlas)
+            self.sprite_scaler = SpriteScaler(self._open_frame)
+            self.sprite_store = SpriteStore(int(self.settings.get('sprite_memory_mb', 16) * 1024 * 1024))
+            self.sprite_preloader = SpritePreloader(self.root, self.decode_frame_set, self._on_preloaded)
+        self.asset_loader = getattr(getattr(self.pet_state, 'pet_manager', None), 'asset_loader', None)
+        self.loading_keys = set()
         self.load_animations()
+        if self.asset_loader:
+            self.load_sickness_icon()
         if hasattr(self.pet_state, 'growth'):
             self.pet_state.growth.on_stage_changed = self.handle_stage_change
-        self.root.after(0, self.animate)
+        self.scheduler.register('pet.animate', self.animate, 100, priority=10, subsystem='render', delay_ms=0)
+        # Background warm-up, held back while rendering is paused (hidden or behind a fullscreen app)
+        self.scheduler.after('pet.preload_colors', 10000, self.preload_alternate_colors, subsystem='render')
     def _apply_sleep_effects(self):
         """Apply effects while sleeping - energy recovery"""
         if not hasattr(self.pet_state, 'stats') or not getattr(self.pet_state, 'is_sleeping', False):
-            return
-        if getattr(self.pet_state, 'is_sleeping', False):
-            self.root.after(2000, self._apply_sleep_effects)
-        if hasattr(self.pet_state, 'stats'):
-            self.pet_state.stats.on_sickness_changed = self.update_sickness_display
+            return False
+        self.pet_state.stats.on_sickness_changed = self.update_sickness_display
+        if not self.scheduler.is_registered('pet.sleep_effects'):
+            self.scheduler.register('pet.sleep_effects', self._apply_sleep_effects, 2000, subsystem='simulation')
+        return True
     def handle_stage_change(self, old_stage, new_stage):
         print(f"Pet evolved from {old_stage} to {new_stage}, playing evolution animation")
         self.pet_state.current_animation = 'Evolving'
-        self.root.after(2400, self.load_new_stage_animations)
+        self._request_evolution_preload()
+        self._request_preload(new_stage)
+        self.scheduler.after('pet.stage_reload', 2400, self.load_new_stage_animations, subsystem='render', replace=True)
     def load_new_stage_animations(self):
         print("Evolution animation finished, reloading animations for new stage")
         self.animations = {}
@@ -56,103 +104,203 @@ class PetAnimation:
         self.pet_state.direction = current_direction
         
     def handle_size_change(self, old_size, new_size):
+        """Switch to the frame set for the new size; frames are scaled from in-memory masters as they are shown."""
         current_direction = self.pet_state.direction
-        self.animations = {}
-        self.load_animations()
+        store_key = self._current_sprite_key()
+        if store_key == self.animations_key:
+            return
+        self._set_animations_key(store_key)
+        # A set not in the store yet is put there once its first frame is scaled.
+        self.animations = self.sprite_store.get(store_key) or {}
+        self.rendered_key = None
         self.pet_state.direction = current_direction
     def load_animations(self):
         self.animations = {}
-        base_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frames')
-        pet_color = self.settings.get('pet_color', 'black').lower()
-        all_states = ['Walk1', 'Walk2', 'Happy', 'Sleep1', 'Sleep2',
-                     'Eat1', 'Eat2', 'Attack', 'Angry', 'Lose1', 'Refuse']
-        base_path_evo = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frames', 'Evolution')
-        evolution_frames = []
-        for i in range(1, 9):
-            try:
-                img_path = os.path.join(base_path_evo, f'Evo{i}.png')
-                if os.path.exists(img_path):
-                    pil_img = Image.open(img_path)
-                    size_factor = 4 * (self.settings['pet_size'] / 100)
-                    resized = pil_img.resize((int(pil_img.width * size_factor), int(pil_img.height * size_factor)), Image.LANCZOS)
-                    evolution_frames.append(ImageTk.PhotoImage(resized))
-            except Exception as e:
-                print(f'Error loading evolution frame {i}: {e}')
-        self.animations['Evolving'] = evolution_frames
-        fallback_map = {
-            'Sleep2': 'Sleep1',
-            'Refuse': 'Angry'
-        }
-        for state in all_states:
+        self.rendered_key = None
+        self.compiled_key = None
+        if self.frame_manifest.refresh_if_changed():
+            self.sprite_store.clear()
+            self.sprite_scaler.clear()
+        store_key = self._current_sprite_key()
+        self._set_animations_key(store_key)
+        stored = self.sprite_store.get(store_key)
+        if stored is not None:
+            self.animations = stored
+            return
+        if self.asset_loader:
+            if store_key not in self.loading_keys:
+                self.loading_keys.add(store_key)
+                self.asset_loader.load('pet_frames', self.decode_frame_set, *store_key,
+                                       on_ready=lambda frames: self._on_frame_set_loaded(store_key, frames))
+            return
+        self.animations = self._build_photo_set(self.decode_frame_set(*store_key))
+        self.sprite_store.put(store_key, self.animations)
+    def _on_frame_set_loaded(self, key, frames):
+        self.loading_keys.discard(key)
+        self._on_preloaded(key, frames)
+        if key == self.animations_key:
+            self.animations = self.sprite_store.get(key) or {}
+            self.rendered_key = None
+    def _set_animations_key(self, key):
+        self.animations_key = key
+        self.sprite_store.set_active(self, key)
+    def _store_frame(self, nbytes):
+        """Account for a frame added to the current set, putting the set in the store if it is not there yet."""
+        if self.animations_key in self.sprite_store.entries:
+            self.sprite_store.add_bytes(self.animations_key, nbytes)
+        else:
+            self.sprite_store.put(self.animations_key, self.animations)
+    def _current_sprite_key(self, stage=None, color=None):
+        stage = stage or self.pet_state.stage
+        color = (color or self.settings.get('pet_color', 'black')).lower()
+        return (stage, color, self.sprite_scaler.quantize(self.settings['pet_size']))
+    def decode_frame_set(self, stage, pet_color, pet_size):
+        """Decode and scale one frame set with PIL only, so it is safe to call from a worker thread."""
+        if stage == 'Evolution':
+            return {'Evolving': self.decode_evolution_frames(pet_size)}
+        start_time = time.perf_counter()
+        hits_before = self.sprite_cache.hits
+        misses_before = self.sprite_cache.misses
+        frames = {}
+        for state in self.FRAME_STATES:
             try:
-                img_path = None
-                if pet_color == 'black':
-                    img_path = os.path.join(base_path, f'{self.pet_state.stage}_{state}.png')
-                    if not os.path.exists(img_path):
-                        img_path = os.path.join(base_path, f'{self.pet_state.stage.lower()}_{state}.png')
-                else:
-                    possible_paths = [
-                        os.path.join(base_path, f'{self.pet_state.stage}_{state}_{pet_color}.png'),
-                        os.path.join(base_path, f'{self.pet_state.stage.lower()}_{state}_{pet_color}.png'),
-                        os.path.join(base_path, f'{self.pet_state.stage.upper()}_{state}_{pet_color}.png'),
-                        os.path.join(base_path, f'{self.pet_state.stage}_{state.lower()}_{pet_color}.png'),
-                        os.path.join(base_path, f'{self.pet_state.stage}_{state.upper()}_{pet_color}.png'),
-                        os.path.join(base_path, f'{self.pet_state.stage.lower()}_{state.lower()}_{pet_color}.png')
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path):
-                            img_path = path
-                            break
-                if img_path is None or not os.path.exists(img_path):
-                    fallback_paths = [
-                        os.path.join(base_path, f'{self.pet_state.stage}_{state}.png'),
-                        os.path.join(base_path, f'{self.pet_state.stage.lower()}_{state}.png'),
-                        os.path.join(base_path, f'{self.pet_state.stage.upper()}_{state}.png')
-                    ]
-                    for path in fallback_paths:
-                        if os.path.exists(path):
-                            img_path = path
-                            if pet_color != 'black':
-                                print(f"Using default black variant for {state} as {pet_color} variant not found")
-                            break
-                if (img_path is None or not os.path.exists(img_path)) and state in fallback_map:
-                    fallback_state = fallback_map[state]
-                    if pet_color != 'black':
-                        fallback_paths = [
-                            os.path.join(base_path, f'{self.pet_state.stage}_{fallback_state}_{pet_color}.png'),
-                            os.path.join(base_path, f'{self.pet_state.stage.lower()}_{fallback_state}_{pet_color}.png')
-                        ]
-                    else:
-                        fallback_paths = [
-                            os.path.join(base_path, f'{self.pet_state.stage}_{fallback_state}.png'),
-                            os.path.join(base_path, f'{self.pet_state.stage.lower()}_{fallback_state}.png')
-                        ]
-                    for path in fallback_paths:
-                        if os.path.exists(path):
-                            img_path = path
-                            break
-                if img_path and os.path.exists(img_path):
-                    pil_img = Image.open(img_path)
-                    size_factor = 4 * (self.settings['pet_size'] / 100)
-                    resized = pil_img.resize((int(pil_img.width * size_factor), int(pil_img.height * size_factor)), Image.LANCZOS)
-                    photo_normal = ImageTk.PhotoImage(resized)
-                    flipped = resized.transpose(Image.FLIP_LEFT_RIGHT)
-                    photo_flipped = ImageTk.PhotoImage(flipped)
-                    self.animations[state] = photo_normal
-                    self.animations[f"{state}_flip"] = photo_flipped
+                img_path = self.frame_manifest.resolve(stage, state, pet_color)
+                if img_path:
+                    frames[state] = self._load_scaled_frame(img_path, pet_size)
                 else:
                     essential_frames = ['Walk1', 'Walk2', 'Happy']
                     if state in essential_frames:
-                        print(f"Warning: Essential animation frame not found for {self.pet_state.stage}_{state}")
+                        print(f"Warning: Essential animation frame not found for {stage}_{state}")
             except Exception as e:
                 print(f'Error loading animation frame {state}: {e}')
+        self.sprite_cache.flush()
+        cache_stats = self.sprite_cache.get_stats()
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        self.load_timings['frames_ms'] = elapsed_ms
+        print(f"Loaded {stage} frames ({pet_color}, {pet_size}%) in {elapsed_ms:.1f} ms: "
+              f"{cache_stats['hits'] - hits_before} cache hits, {cache_stats['misses'] - misses_before} misses")
+        return frames
+    def decode_evolution_frames(self, pet_size):
+        frames = []
+        for i in range(1, 9):
+            try:
+                img_path = self.frame_manifest.resolve_evolution(i)
+                if img_path:
+                    frames.append(self._load_scaled_frame(img_path, pet_size))
+            except Exception as e:
+                print(f'Error loading evolution frame {i}: {e}')
+        return frames
+    def _evolution_key(self):
+        return ('Evolution', 'any', self.sprite_scaler.quantize(self.settings['pet_size']))
+    def _request_evolution_preload(self):
+        key = self._evolution_key()
+        if key in self.sprite_store.entries:
+            return False
+        return self.sprite_preloader.request(key)
+    def get_evolution_frames(self):
+        """Return the Evolving sequence for the current pet_size, or nothing while the preloader is still decoding it."""
+        stored = self.sprite_store.get(self._evolution_key())
+        if stored is not None:
+            return stored['Evolving']
+        self._request_evolution_preload()
+        return []
+    def _build_photo_set(self, frames):
+        animations = {}
+        for state, image in frames.items():
+            if isinstance(image, list):
+                animations[state] = [self.renderer.make_photo(frame) for frame in image]
+            else:
+                animations[state] = self.renderer.make_photo(image)
+        return animations
+    def _get_photo(self, state, direction='left'):
+        """Return the PhotoImage for a state, creating and caching the mirrored copy on first use."""
+        photo = self.animations.get(state)
+        if photo is None:
+            photo = self._load_state_photo(state)
+        if direction != 'right':
+            return photo
+        flip_key = f"{state}_flip"
+        flipped_photo = self.animations.get(flip_key)
+        if flipped_photo is None and photo is not None:
+            flipped = self.renderer.photo_image(photo).transpose(Image.FLIP_LEFT_RIGHT)
+            flipped_photo = self.renderer.make_photo(flipped)
+            self.animations[flip_key] = flipped_photo
+            self._store_frame(flipped.width * flipped.height * 4)
+        return flipped_photo
+    def _load_state_photo(self, state):
+        """Scale a single frame of the current set on demand, so a size change only pays for the frames shown."""
+        if self.animations_key is None or state not in self.FRAME_STATES:
+            return None
+        if (self.animations_key, state) in self.missing_frames:
+            return None
+        stage, color, pet_size = self.animations_key
+        try:
+            img_path = self.frame_manifest.resolve(stage, state, color)
+            if not img_path:
+                self.missing_frames.add((self.animations_key, state))
+                return None
+            image = self.sprite_pack.get_path(img_path, pet_size) if self.sprite_pack else None
+            if image is None:
+                master = self.sprite_scaler.get_master(img_path, self.frame_manifest.source_mtime(img_path))
+                image = self.sprite_scaler.scale(master, pet_size)
+        except Exception as e:
+            print(f'Error loading animation frame {state}: {e}')
+            self.missing_frames.add((self.animations_key, state))
+            return None
+        photo = self.renderer.make_photo(image)
+        self.animations[state] = photo
+        self._store_frame(image.width * image.height * 4)
+        return photo
+    def _request_preload(self, stage=None, color=None):
+        key = self._current_sprite_key(stage, color)
+        if key in self.sprite_store.entries:
+            return False
+        return self.sprite_preloader.request(key)
+    def _on_preloaded(self, key, frames):
+        if key not in self.sprite_store.entries:
+            self.sprite_store.put(key, self._build_photo_set(frames))
+    def preload_upcoming_sprites(self):
+        """Warm the sprite store for the next evolution stage once the pet gets close to it."""
+        growth = getattr(self.pet_state, 'growth', None)
+        if growth is None or not hasattr(growth, 'get_next_stage'):
+            return
+        next_stage = growth.get_next_stage()
+        days_left = growth.days_until_evolution()
+        if next_stage and days_left is not None and days_left <= self.PRELOAD_DAYS_BEFORE_EVOLUTION:
+            self._request_preload(next_stage)
+            self._request_evolution_preload()
+    def preload_alternate_colors(self):
+        for color in self.PET_COLORS:
+            self._request_preload(color=color)
+    def _load_scaled_frame(self, img_path, pet_size):
+        """Return the resized RGBA frame, served from the sprite pack or the on-disk sprite cache when possible."""
+        if self.sprite_pack:
+            packed = self.sprite_pack.get_path(img_path, pet_size)
+            if packed is not None:
+                return packed
+        # Keyed on the file actually resolved, so a colour that falls back to another sprite shares its entry.
+        source = self.frame_manifest.source_name(img_path)
+        source_mtime = self.frame_manifest.source_mtime(img_path)
+        cached = self.sprite_cache.get(source, pet_size, source_mtime)
+        if cached is not None:
+            return cached
+        resized = self.sprite_scaler.scale(self.sprite_scaler.get_master(img_path, source_mtime), pet_size)
+        self.sprite_cache.put(source, pet_size, source_mtime, resized)
+        return resized
+    def _open_frame(self, img_path):
+        if self.sprite_atlas:
+            frame = self.sprite_atlas.get_path(img_path)
+            if frame is not None:
+                return frame
+        return Image.open(img_path)
     def load_sickness_icon(self):
         try:
             img_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img_assets', 'sickness.png')
             if os.path.exists(img_path):
-                img = Image.open(img_path).convert("RGBA")
-                img = img.resize((32, 32), Image.LANCZOS)
-                self.sickness_icon = ImageTk.PhotoImage(img)
+                if self.asset_loader:
+                    return self.asset_loader.load('sickness_icon', decode_icon, img_path, (32, 32),
+                                                  on_ready=self._set_sickness_icon)
+                self._set_sickness_icon(decode_icon(img_path, (32, 32)))
                 return True
             else:
                 print(f"Sickness icon not found at {img_path}")
@@ -160,6 +308,8 @@ class PetAnimation:
         except Exception as e:
             print(f"Error loading sickness icon: {e}")
             return False
+    def _set_sickness_icon(self, img):
+        self.sickness_icon = self.renderer.make_photo(img)
     def update_sickness_display(self, is_sick):
         if not self.sickness_icon and not self.load_sickness_icon():
             return
@@ -193,15 +343,12 @@ class PetAnimation:
                     self.canvas.itemconfigure(self.sickness_icon_id, state='normal')
                     self.sickness_visible = True
                 if hasattr(self.pet_state.stats, 'is_sick') and self.pet_state.stats.is_sick:
-                    self.sickness_blink_timer = self.root.after(500, blink_icon)
-        if self.sickness_blink_timer:
-            self.root.after_cancel(self.sickness_blink_timer)
+                    return True
+            return False
         self.sickness_visible = True
-        self.sickness_blink_timer = self.root.after(500, blink_icon)
+        self.scheduler.register('pet.sickness_blink', blink_icon, 500, subsystem='render')
     def hide_sickness_overlay(self):
-        if self.sickness_blink_timer:
-            self.root.after_cancel(self.sickness_blink_timer)
-            self.sickness_blink_timer = None
+        self.scheduler.unregister('pet.sickness_blink')
         if self.sickness_icon_id:
             self.canvas.delete(self.sickness_icon_id)
             self.sickness_icon_id = None
@@ -236,68 +383,59 @@ class PetAnimation:
                     self.hide_sickness_overlay()
                 if self.pet_state.current_animation in ['sick', 'sleeping']:
                     self.pet_state.current_animation = 'Standing'
+    def _compile_animation_graph(self):
+        """Resolve the declarative animation states against the current sprite set, once per load."""
+        if self.animations_key is None:
+            self.animation_graph.compile(lambda frame: True)
+        else:
+            stage, color, pet_size = self.animations_key
+            self.animation_graph.compile(lambda frame: self.frame_manifest.resolve(stage, frame, color) is not None,
+                                         f" for {stage} ({color})")
+        self.compiled_key = self.animations_key
     def animate(self):
         try:
-            animation_sequences = {
-                'Standing': ['Walk1', 'Walk2'],
-                'Walking': ['Walk1', 'Walk2'],
-                'happy': ['Happy', 'Walk1'],
-                'sleeping': ['Sleep1', 'Sleep2'],
-                'eating': ['Eat1', 'Eat2'],
-                'playing': ['Attack', 'Walk1'],
-                'special': ['Happy', 'Walk1', 'Walk2', 'Happy'],
-                'angry': ['Angry', 'Walk1'],
-                'sad': ['Lose1', 'Walk1'],
-                'sick': ['Walk1', 'Lose1']
-            }
-            is_sleeping = getattr(self.pet_state, 'is_sleeping', False)
-            if is_sleeping and self.pet_state.current_animation in ['playing', 'angry']:
-                self.pet_state.current_animation = 'sleeping'
-            if self.pet_state.current_animation == 'Evolving':
-                sequence = self.animations.get('Evolving', [])
-                if not sequence:
-                    self.root.after(100, self.animate)
-                    return
-                frame = sequence[int(datetime.now().timestamp() * 4) % len(sequence)]
-                self.canvas.delete('pet')
-                self.canvas.create_image(128, 128, image=frame, tags='pet')
-            else:
-                sequence = animation_sequences.get(self.pet_state.current_animation, [])
-                if not sequence:
-                    self.root.after(100, self.animate)
-                    return
-                frame = sequence[int(datetime.now().timestamp() * 2) % len(sequence)]
-                self.canvas.delete('pet')
-                key = frame
-                flip_key = f"{frame}_flip"
-                photoimage = None
-                if self.pet_state.direction == 'right' and flip_key in self.animations:
-                    photoimage = self.animations[flip_key]
-                elif key in self.animations:
-                    photoimage = self.animations[key]
-                if photoimage:
-                    self.canvas.create_image(128, 128, image=photoimage, tags='pet')
-                    self.check_sickness_status()
-                else:
-                    print(f"Warning: Animation frame {frame} not found in preloaded animations")
-                    print(f"Available frames: {list(self.animations.keys())}")
-                    print(f"Current animation: {self.pet_state.current_animation}")
-                    print(f"Animation sequences: {animation_sequences}")
-                    if 'Walk1' in self.animations:
-                        photoimage = self.animations['Walk1']
-                        self.canvas.create_image(128, 128, image=photoimage, tags='pet')
-                        self.check_sickness_status()
-                    elif len(self.animations) > 0:
-                        available_frame = list(self.animations.keys())[0]
-                        photoimage = self.animations[available_frame]
-                        self.canvas.create_image(128, 128, image=photoimage, tags='pet')
-                        self.check_sickness_status()
+            if self.compiled_key != self.animations_key or not self.animation_graph.table:
+                self._compile_animation_graph()
+            is_sick = getattr(self.pet_state.stats, 'is_sick', False) if hasattr(self.pet_state, 'stats') else False
+            state = self.animation_graph.resolve(self.pet_state.current_animation,
+                                                 getattr(self.pet_state, 'is_sleeping', False), is_sick)
+            frames, fps, mirror = self.animation_graph.table[state]
+            if frames is None:
+                frames = self.get_evolution_frames()
+            if not frames:
+                return
+            index = int(self.scheduler.clock() * fps) % len(frames)
+            direction = self.pet_state.direction if mirror else None
+            render_key = (state, index, direction)
+            if render_key == self.rendered_key:
+                return
+            self.rendered_key = render_key
+            if state == 'Evolving':
+                self._show_pet_image(frames[index])
+                return
+            photoimage = self._get_photo(frames[index], direction)
+            if photoimage is None:
+                # A frame that failed to load is already reported once in _load_state_photo.
+                photoimage = self._get_photo(self.animation_graph.default_frame, direction)
+            self._show_pet_image(photoimage)
+            if photoimage is not None:
+                self.check_sickness_status()
         except Exception as e:
             print(f'Animation error: {e}')
-        self.root.after(100, self.animate)
+    def _show_pet_image(self, photoimage):
+        """Point the single pet canvas item at a new image, creating the item on first use."""
+        if self.pet_item_id is None or not self.canvas.type(self.pet_item_id):
+            if photoimage is None:
+                return
+            self.pet_item_id = self.canvas.create_image(128, 128, image=photoimage, tags='pet')
+            return
+        if photoimage is None:
+            self.canvas.itemconfigure(self.pet_item_id, state='hidden')
+            return
+        self.canvas.itemconfigure(self.pet_item_id, image=photoimage, state='normal')
     def start_random_movement(self):
         if getattr(self.pet_state, 'is_sleeping', False):
-            self.root.after(5000, self.start_random_movement)
+            self.scheduler.after('pet.start_movement', 5000, self.start_random_movement)
             return
         energy = self.pet_state.stats.get_stat('energy')
         if energy < 15:
@@ -307,15 +445,13 @@ class PetAnimation:
             self.pet_state.is_sleeping = True
             self.pet_state.sleep_start_time = datetime.now()
             self.pet_state.sleep_duration = int(sleep_time * 1000)
-            self.root.after(int(sleep_time * 1000), self.wake_up)
+            self.scheduler.after('pet.wake', int(sleep_time * 1000), self.wake_up)
             return
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
         def move_randomly():
             is_sleeping = getattr(self.pet_state, 'is_sleeping', False)
             if self.pet_state.is_interacting or is_sleeping:
                 if is_sleeping:
-                    self.movement_timer = self.root.after(5000, move_randomly)
+                    self.scheduler.after('pet.wander', 5000, move_randomly, subsystem='movement')
                 return
             if not self.pet_state.is_interacting:
                 activity_level = self.settings['activity_level']
@@ -332,12 +468,8 @@ class PetAnimation:
                         self.pet_state.is_interacting = True
                         self.pet_state.is_sleeping = True
                         self.last_sleep_time = datetime.now()
-                        if self.movement_timer:
-                            self.root.after_cancel(self.movement_timer)
-                            self.movement_timer = None
-                        if self.movement_step_timer:
-                            self.root.after_cancel(self.movement_step_timer)
-                            self.movement_step_timer = None
+                        self.scheduler.unregister('pet.wander')
+                        self.movement.stop()
                         self._apply_sleep_effects()
                         def wake_up():
                             if self.pet_state.current_animation == 'sleeping':
@@ -345,12 +477,12 @@ class PetAnimation:
                                 self.pet_state.is_interacting = False
                                 self.pet_state.is_sleeping = False
                                 self.start_random_movement()
-                        self.root.after(sleep_time, wake_up)
+                        self.scheduler.after('pet.wake', sleep_time, wake_up)
                         return
                     else:
                         idle_time = random.randint(5000, 15000)
                         self.pet_state.current_animation = 'Standing'
-                        self.movement_timer = self.root.after(idle_time, move_randomly)
+                        self.scheduler.after('pet.wander', idle_time, move_randomly, subsystem='movement')
                     return
                 min_y = 0
                 if (hasattr(self.pet_state, 'pet_manager') and
@@ -358,18 +490,19 @@ class PetAnimation:
                     hasattr(self.pet_state.pet_manager.context_awareness, 'monitoring_enabled') and
                     self.pet_state.pet_manager.context_awareness.monitoring_enabled):
                     min_y = 150
-                self.target_x = random.randint(0, screen_width - 256)
-                self.target_y = random.randint(min_y, screen_height - 256)
-                current_x = self.root.winfo_x()
-                self.pet_state.direction = 'right' if self.target_x > current_x else 'left'
-                self.pet_state.current_animation = 'Walking'
-                self.move_step()
+                if not self.movement.is_moving():
+                    self.movement.sync()
+                route = self.path_planner.plan_wander(self.movement.position(), min_y)
+                if route:
+                    self.walk_path(route)
+                else:
+                    self.pet_state.current_animation = 'Standing'
                 activity_level = self.settings['activity_level']
                 base_delay = 8000
                 activity_modifier = (10 - activity_level) * 500
                 delay = int(base_delay + activity_modifier)
-                self.movement_timer = self.root.after(delay, move_randomly)
-        move_randomly()
+                self.scheduler.after('pet.wander', delay, move_randomly, subsystem='movement')
+        self.scheduler.after('pet.wander', 0, move_randomly, subsystem='movement')
     def wake_up(self):
         """Wake up the pet from sleep"""
         if getattr(self.pet_state, 'is_sleeping', False):
@@ -377,86 +510,75 @@ class PetAnimation:
             self.pet_state.is_interacting = False
             self.pet_state.is_sleeping = False
             self.start_random_movement()
-    def move_step(self):
-        if not hasattr(self, 'target_x') or not hasattr(self, 'target_y'):
-            return
-        current_x = self.root.winfo_x()
-        current_y = self.root.winfo_y()
-        dx = self.target_x - current_x
-        dy = self.target_y - current_y
-        distance = math.sqrt(dx*dx + dy*dy)
-        if distance < 5:
-            if self.pet_state.current_animation in ['Walking']:
-                self.pet_state.current_animation = 'Standing'
-            return
+    def walk_to(self, x, y, on_arrive=None, stop_on_interaction=True):
+        """Walk the window to (x, y) at the movement_speed setting, facing the way it travels."""
+        self.target_x = x
+        self.target_y = y
+        speed = max(1, self.settings.get('movement_speed', 5)) * PIXELS_PER_SECOND_PER_SPEED
+        self.movement.move_to(x, y, speed,
+                              on_step=self._on_walk_step if stop_on_interaction else None,
+                              on_arrive=on_arrive or self._on_walk_arrived)
+        dx = x - self.movement.start[0]
         if abs(dx) > 2:
-            new_direction = 'right' if dx > 0 else 'left'
-            if new_direction != self.pet_state.direction:
-                self.pet_state.direction = new_direction
-        speed = self.settings.get('movement_speed', 5)
-        base_step_size = max(1, speed)
-        if distance > 0:
-            step_x = dx * base_step_size / distance
-            step_y = dy * base_step_size / distance
+            self.pet_state.direction = 'right' if dx > 0 else 'left'
+        self.pet_state.current_animation = 'Walking'
+    def walk_path(self, route, on_arrive=None, stop_on_interaction=True):
+        """Walk through each waypoint of route in turn, calling on_arrive at the last one."""
+        (x, y), rest = route[0], route[1:]
+        if rest:
+            def next_leg():
+                self.walk_path(rest, on_arrive, stop_on_interaction)
+            self.walk_to(x, y, on_arrive=next_leg, stop_on_interaction=stop_on_interaction)
         else:
-            step_x = 0
-            step_y = 0
-        new_x = current_x + step_x
-        new_y = current_y + step_y
-        self.root.geometry(f'+{int(new_x)}+{int(new_y)}')
+            self.walk_to(x, y, on_arrive=on_arrive, stop_on_interaction=stop_on_interaction)
+    def _on_walk_step(self):
+        now = self.scheduler.clock()
+        # Poop chances are tuned per 50 ms of walking, so roll once for every 50 ms walked whatever the movement tick is.
         if hasattr(self.pet_state, 'poop_system'):
-            self.pet_state.poop_system.check_poop_generation(128, 128)
-        if not self.pet_state.is_interacting:
-            self.movement_timer = self.root.after(50, self.move_step)
+            if now - self.last_poop_check > MAX_STEP_GAP:
+                # A new walk, or one resumed after a stall: roll once now rather than for the time spent standing.
+                self.last_poop_check = now - self.WALK_POOP_CHECK_SECONDS
+            checks = int((now - self.last_poop_check) / self.WALK_POOP_CHECK_SECONDS)
+            self.last_poop_check += checks * self.WALK_POOP_CHECK_SECONDS
+            for _ in range(checks):
+                self.pet_state.poop_system.check_poop_generation(128, 128)
+        return not self.pet_state.is_interacting
+    def _on_walk_arrived(self):
+        if self.pet_state.current_animation == 'Walking':
+            self.pet_state.current_animation = 'Standing'
     def pause_movement(self):
         self.pet_state.is_interacting = True
-        if self.movement_timer:
-            self.root.after_cancel(self.movement_timer)
-            self.movement_timer = None
-        if self.movement_step_timer:
-            self.root.after_cancel(self.movement_step_timer)
-            self.movement_step_timer = None
-        if self.resume_timer:
-            self.root.after_cancel(self.resume_timer)
-            self.resume_timer = None
+        self.scheduler.unregister('pet.wander')
+        self.movement.stop()
+        self.scheduler.unregister('pet.resume_movement')
     def resume_movement(self):
         self.pet_state.is_interacting = False
-        if not self.movement_timer:
+        if not self.scheduler.is_registered('pet.wander'):
             self.start_random_movement()
     def force_restart_movement(self):
         if getattr(self.pet_state, 'is_sleeping', False) or self.pet_state.current_animation == 'sleeping':
             return
-        if self.movement_timer:
-            self.root.after_cancel(self.movement_timer)
-            self.movement_timer = None
-        if self.movement_step_timer:
-            self.root.after_cancel(self.movement_step_timer)
-            self.movement_step_timer = None
-        if self.resume_timer:
-            self.root.after_cancel(self.resume_timer)
-            self.resume_timer = None
+        self.scheduler.unregister('pet.wander')
+        self.movement.stop()
+        self.scheduler.unregister('pet.resume_movement')
         self.pet_state.is_interacting = False
         self.pet_state.current_animation = 'Standing'
-        self.root.after(1000, self.start_random_movement)
+        self.scheduler.after('pet.start_movement', 1000, self.start_random_movement, replace=True)
     def start_movement_watchdog(self):
         def check_movement():
             if getattr(self.pet_state, 'is_sleeping', False) or self.pet_state.current_animation == 'sleeping':
-                self.root.after(15000, check_movement)
                 return
             if (not self.pet_state.is_interacting and
                 self.pet_state.current_animation == 'Standing' and
-                not self.movement_timer):
+                not self.scheduler.is_registered('pet.wander')):
                 self.force_restart_movement()
-            self.root.after(15000, check_movement)
-        self.root.after(15000, check_movement)
+        self.scheduler.register('pet.movement_watchdog', check_movement, 15000, subsystem='movement')
     def schedule_resume_movement(self, delay_ms):
         if getattr(self.pet_state, 'is_sleeping', False):
             return
-        if self.resume_timer:
-            self.root.after_cancel(self.resume_timer)
-        self.resume_timer = self.root.after(delay_ms, self.resume_movement)
+        self.scheduler.after('pet.resume_movement', delay_ms, self.resume_movement, replace=True)
     def handle_drag(self, event):
         self.pause_movement()
         x = self.root.winfo_x() + event.x - 128
         y = self.root.winfo_y() + event.y - 128
-        self.root.geometry(f'+{x}+{y}')
\ No newline at end of file
+        self.movement.set_position(x, y)
\ No newline at end of file
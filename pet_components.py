@@ -2,9 +2,13 @@ import random
 from datetime import datetime, timedelta
 import json
 import os
+from stat_catchup import catch_up
+# A gap this long between updates (app closed, machine asleep) goes through catch_up instead of one big step.
+CATCH_UP_AFTER_MINUTES = 1
 class PetStats:
-    def __init__(self, growth=None):
+    def __init__(self, growth=None, clock=datetime.now):
         self.growth = growth
+        self.clock = clock
         self.stats = {
             'hunger': 100,
             'happiness': 100,
@@ -21,8 +25,8 @@ class PetStats:
         self.cleanliness = self.stats['cleanliness']
         self.social = self.stats['social']
         self.age = self.stats['age']
-        self.last_update = datetime.now()
-        self.last_health_reduction_time = datetime.now()
+        self.last_update = clock()
+        self.last_health_reduction_time = clock()
         self.decay_rates = {
             'hunger': 0.25,
             'happiness': 0.2,
@@ -68,11 +72,16 @@ class PetStats:
             'emergency': 10
         }
         self.shown_alerts = {}
-        self.last_update = datetime.now()
+        self.last_update = self.clock()
         self.is_sick = False
     def update(self):
-        now = datetime.now()
+        now = self.clock()
         elapsed_minutes = (now - self.last_update).total_seconds() / 60.0
+        if elapsed_minutes > CATCH_UP_AFTER_MINUTES:
+            result = self.catch_up(now)
+            print(f"Caught up {elapsed_minutes:.0f} minutes: slept {result['sleeps']} times, sick for {result['sick_minutes']:.0f} minutes")
+            self.check_stat_alerts()
+            return
         self.last_update = now
         is_sleeping = (hasattr(self, 'pet_state') and getattr(self.pet_state, 'is_sleeping', False)) or \
                       (hasattr(self.growth, 'behavior') and getattr(self.growth.behavior, 'current_activity', None) == 'sleeping')
@@ -120,6 +129,34 @@ class PetStats:
             if time_since_last_reduction >= health_reduction_interval:
                 self.modify_stat('health', -1)
                 self.last_health_reduction_time = now
+    def catch_up(self, now=None):
+        """Apply everything that happened since last_update at once, integrating decay, sleep and sickness piecewise."""
+        now = now or self.clock()
+        since = self.last_update
+        minutes = (now - since).total_seconds() / 60.0
+        self.last_update = now
+        self.last_health_reduction_time = now
+        if minutes <= 0:
+            return None
+        pet_state = getattr(self, 'pet_state', None)
+        result = catch_up(self.stats, self.decay_rates, minutes,
+                          getattr(pet_state, 'is_sleeping', False), self.thresholds['health_sick'])
+        for stat, value in result['stats'].items():
+            self.stats[stat] = value
+            if hasattr(self, stat):
+                setattr(self, stat, value)
+        if pet_state is not None:
+            was_sleeping = getattr(pet_state, 'is_sleeping', False)
+            pet_state.is_sleeping = result['is_sleeping']
+            if result['asleep_at'] is not None:
+                pet_state.sleep_start_time = since + timedelta(minutes=result['asleep_at'])
+                pet_state.sleep_duration = int((100 - result['asleep_energy']) / 12 * 60 * 1000)
+                pet_state.current_animation = 'sleeping'
+            elif was_sleeping and not result['is_sleeping']:
+                pet_state.sleep_start_time = None
+                pet_state.current_animation = 'Standing'
+        self.update_sickness_status()
+        return result
     def modify_stat(self, stat, amount):
         if stat in self.stats:
             self.stats[stat] = max(0, min(100, self.stats[stat] + amount))
@@ -193,7 +230,7 @@ class PetStats:
         if stat not in self.shown_alerts or self.shown_alerts[stat] != level:
             self.shown_alerts[stat] = level
             if hasattr(self, 'speech_bubble') and self.speech_bubble:
-                self.speech_bubble.show_bubble('custom', message)
+                self.speech_bubble.show_bubble('custom', message, urgent=(level == 'emergency'))
     def update_sickness_status(self):
         critical_stats = [stat for stat, value in self.stats.items()
                          if stat in ['hunger', 'happiness', 'energy', 'health', 'cleanliness', 'social']
@@ -252,6 +289,12 @@ class PetGrowth:
                 self.on_stage_changed(old_stage, new_stage)
             return True
         return False
+    def get_next_stage(self):
+        return {'Baby': 'Child', 'Child': 'Teen', 'Teen': 'Adult'}.get(self.stage)
+    def days_until_evolution(self):
+        if self.stage not in self.evolution_thresholds or not self.stats:
+            return None
+        return max(0, self.evolution_thresholds[self.stage] - self.stats.get_stat('age'))
     def improve_skill(self, skill, amount=0.1):
         if skill in self.skills:
             self.skills[skill] = min(10, self.skills[skill] + amount)
@@ -262,13 +305,15 @@ class PetGrowth:
     def get_skill_level(self, skill):
         return self.skills.get(skill, 0)
 class PetBehavior:
-    def __init__(self, stats, growth):
+    def __init__(self, stats, growth, clock=datetime.now, rng=random):
         self.stats = stats
         self.growth = growth
+        self.clock = clock
+        self.rng = rng
         self.current_mood = 'normal'
         self.current_activity = 'idle'
-        self.last_mood_update = datetime.now()
-        self.last_random_action = datetime.now()
+        self.last_mood_update = clock()
+        self.last_random_action = clock()
         self.mood_mappings = {
             'happiness': {'low': 'sad', 'high': 'happy'},
             'energy': {'low': 'tired', 'high': 'energetic'},
@@ -289,7 +334,7 @@ class PetBehavior:
             self.current_mood = 'normal'
         return self.current_mood
     def decide_activity(self):
-        now = datetime.now()
+        now = self.clock()
         if (now - self.last_random_action).total_seconds() < 30:
             return self.current_activity
         hunger = self.stats.get_stat('hunger')
@@ -298,7 +343,7 @@ class PetBehavior:
             self.current_activity = 'sleeping'
             if not getattr(self.stats.pet_state, 'is_sleeping', False):
                 self.stats.pet_state.is_sleeping = True
-                self.stats.pet_state.sleep_start_time = datetime.now()
+                self.stats.pet_state.sleep_start_time = now
         elif hunger < 30:
             self.current_activity = 'hungry'
         else:
@@ -306,7 +351,7 @@ class PetBehavior:
             if self.growth.get_stage() in ['Teen', 'Adult']:
                 activities.extend(['playing', 'exploring'])
             weights = [0.5, 0.3, 0.1, 0.1][:len(activities)]
-            self.current_activity = random.choices(activities, weights=weights, k=1)[0]
+            self.current_activity = self.rng.choices(activities, weights=weights, k=1)[0]
             self.last_random_action = now
         return self.current_activity
     def handle_interaction(self, interaction_type):
@@ -413,11 +458,12 @@ class PetManager:
     def save_pet(self, is_autosave=False):
         save_data = {
             'name': self._name,
-            'stats': self.stats.stats,
+            'stats': dict(self.stats.stats),
             'stage': self.growth.stage,
             'skills': self.growth.skills,
             'creation_date': self.creation_date.isoformat(),
             'save_date': datetime.now().isoformat(),
+            'last_update': self.stats.last_update.isoformat(),
             'version': '1.0',
             'evolution_thresholds': self.growth.evolution_thresholds,
             'game_progress': getattr(self, 'game_progress', {'number_guesser': 1, 'reaction_test': 1, 'ball_clicker': 1})
@@ -486,6 +532,10 @@ class PetManager:
                     raise ValueError(f"Invalid skill level for {skill}: {level}")
             pet.growth.skills = save_data['skills']
             pet.creation_date = datetime.fromisoformat(save_data['creation_date'])
+            last_update = save_data.get('last_update') or save_data.get('save_date')
+            if last_update:
+                pet.stats.last_update = datetime.fromisoformat(last_update)
+                pet.stats.catch_up()
             return pet, None
         except json.JSONDecodeError:
             return None, "Invalid save file format"
@@ -0,0 +1,62 @@
+import random
+from datetime import datetime
+BASE_POOP_CHANCE = 0.05
+MAX_POOP_CHANCE = 0.4
+MAX_POOP_PRESSURE = 100.0
+FOOD_PRESSURE_MULTIPLIER = 8.0
+MIN_POOP_INTERVAL = 300
+POST_POOP_PRESSURE_REDUCTION = 60.0
+POOP_CLEANLINESS_PENALTY = -9
+# Every OLD_POOP_CHECK_SECONDS each poop older than OLD_POOP_SECONDS costs cleanliness; having any costs happiness and health once.
+OLD_POOP_CHECK_SECONDS = 15
+OLD_POOP_SECONDS = 300
+OLD_POOP_PENALTY = {'cleanliness': -3, 'happiness': -0.5, 'health': -0.2}
+class PoopPressureModel:
+    """When the pet needs to go: pressure builds with time and food, and each check rolls against a chance that grows with it."""
+    def __init__(self, pressure_increase_rate=0.5, clock=datetime.now, rng=random):
+        self.clock = clock
+        self.rng = rng
+        self.base_poop_chance = BASE_POOP_CHANCE
+        self.current_poop_chance = self.base_poop_chance
+        self.max_poop_chance = MAX_POOP_CHANCE
+        self.poop_pressure = 0.0
+        self.max_poop_pressure = MAX_POOP_PRESSURE
+        self.pressure_increase_rate = pressure_increase_rate
+        self.last_pressure_update = clock()
+        self.food_consumed = 0
+        self.food_pressure_multiplier = FOOD_PRESSURE_MULTIPLIER
+        self.last_poop_time = clock()
+        self.min_poop_interval = MIN_POOP_INTERVAL
+        self.post_poop_pressure_reduction = POST_POOP_PRESSURE_REDUCTION
+    def add_food(self, amount=1):
+        self.food_consumed += amount
+        pressure_increase = amount * self.food_pressure_multiplier
+        self.poop_pressure = min(self.max_poop_pressure, self.poop_pressure + pressure_increase)
+        self.update_chance()
+    def update_pressure(self, now=None):
+        now = now or self.clock()
+        elapsed_minutes = (now - self.last_pressure_update).total_seconds() / 60.0
+        self.last_pressure_update = now
+        pressure_increase = elapsed_minutes * self.pressure_increase_rate
+        self.poop_pressure = min(self.max_poop_pressure, self.poop_pressure + pressure_increase)
+        self.update_chance()
+    def update_chance(self):
+        pressure_ratio = self.poop_pressure / self.max_poop_pressure
+        self.current_poop_chance = self.base_poop_chance + (pressure_ratio * (self.max_poop_chance - self.base_poop_chance))
+    def seconds_since_last_poop(self, now=None):
+        return ((now or self.clock()) - self.last_poop_time).total_seconds()
+    def roll(self, cleanliness=100, now=None):
+        """One generation check; True when the pet poops now, with its pressure already relieved."""
+        now = now or self.clock()
+        if self.seconds_since_last_poop(now) < self.min_poop_interval:
+            return False
+        self.update_pressure(now)
+        cleanliness_factor = 1 + ((100 - cleanliness) / 200)
+        final_chance = self.current_poop_chance * cleanliness_factor
+        if self.rng.random() > final_chance:
+            return False
+        self.last_poop_time = now
+        self.poop_pressure = max(0, self.poop_pressure - self.post_poop_pressure_reduction)
+        self.food_consumed = max(0, self.food_consumed - 1)
+        self.update_chance()
+        return True
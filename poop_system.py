@@ -1,124 +1,101 @@
-import tkinter as tk
-from PIL import Image, ImageTk
+from PIL import Image
 import os
 import random
 from datetime import datetime, timedelta
+from frame_scheduler import get_scheduler
+from renderer import TkRenderer
+from poop_pressure import PoopPressureModel, POOP_CLEANLINESS_PENALTY, OLD_POOP_CHECK_SECONDS, OLD_POOP_SECONDS, OLD_POOP_PENALTY
+def decode_poop_images():
+    img_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img_assets')
+    poop1 = Image.open(os.path.join(img_path, 'poop1.png')).convert("RGBA")
+    poop2 = Image.open(os.path.join(img_path, 'poop2.png')).convert("RGBA")
+    size = (32, 32)
+    poop1 = poop1.resize(size, Image.LANCZOS)
+    poop2 = poop2.resize(size, Image.LANCZOS)
+    toilet_paper = Image.open(os.path.join(img_path, 'toilet_paper.png')).convert("RGBA")
+    toilet_paper = toilet_paper.resize((32, 32), Image.LANCZOS)
+    background = Image.new("RGBA", toilet_paper.size, (0, 0, 0, 0))
+    background.paste(toilet_paper, (0, 0), toilet_paper)
+    return poop1, poop2, background
 class PoopSystem:
-    def __init__(self, root, canvas, pet_state):
+    def __init__(self, root, canvas, pet_state, renderer=None):
         self.root = root
         self.canvas = canvas
+        self.renderer = renderer or TkRenderer(root)
         self.pet_state = pet_state
         self.poops = []
+        self.pending_poops = []
         self.poop_images = []
         self.toilet_paper_image = None
         self.load_images()
-        self.base_poop_chance = 0.05
-        self.current_poop_chance = self.base_poop_chance
-        self.max_poop_chance = 0.4
-        self.poop_pressure = 0.0
-        self.max_poop_pressure = 100.0
-        self.pressure_increase_rate = self.pet_state.pet_manager.settings.get('poop_frequency', 0.5)
-        self.last_pressure_update = datetime.now()
-        self.food_consumed = 0
-        self.food_pressure_multiplier = 8.0
-        self.last_poop_time = datetime.now()
-        self.min_poop_interval = 300
-        self.post_poop_pressure_reduction = 60.0
+        self.pressure = PoopPressureModel(self.pet_state.pet_manager.settings.get('poop_frequency', 0.5))
         self.cleaning_mode = False
         self.original_cursor = None
-        self.poop_check_timer = None
-        self.poop_animation_timer = None
+        self.scheduler = get_scheduler(self.root)
         self.start_poop_animation()
         self.start_poop_check_timer()
+    @property
+    def poop_pressure(self):
+        return self.pressure.poop_pressure
+    @property
+    def current_poop_chance(self):
+        return self.pressure.current_poop_chance
     def add_food_consumed(self, amount=1):
-        self.food_consumed += amount
-        pressure_increase = amount * self.food_pressure_multiplier
-        self.poop_pressure = min(self.max_poop_pressure, self.poop_pressure + pressure_increase)
-        self.update_poop_chance()
-        self.start_poop_check_timer()
+        self.pressure.add_food(amount)
     def load_images(self):
         try:
-            img_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img_assets')
-            poop1 = Image.open(os.path.join(img_path, 'poop1.png')).convert("RGBA")
-            poop2 = Image.open(os.path.join(img_path, 'poop2.png')).convert("RGBA")
-            size = (32, 32)
-            poop1 = poop1.resize(size, Image.LANCZOS)
-            poop2 = poop2.resize(size, Image.LANCZOS)
-            for img in [poop1, poop2]:
-                background = Image.new("RGBA", img.size, (0, 0, 0, 0))
-                background.paste(img, (0, 0), img)
-                img = background
-            self.poop_images = [
-                ImageTk.PhotoImage(poop1),
-                ImageTk.PhotoImage(poop2)
-            ]
-            toilet_paper = Image.open(os.path.join(img_path, 'toilet_paper.png')).convert("RGBA")
-            toilet_paper = toilet_paper.resize((32, 32), Image.LANCZOS)
-            background = Image.new("RGBA", toilet_paper.size, (0, 0, 0, 0))
-            background.paste(toilet_paper, (0, 0), toilet_paper)
-            toilet_paper = background
-            self.toilet_paper_image = ImageTk.PhotoImage(toilet_paper)
+            asset_loader = getattr(self.pet_state.pet_manager, 'asset_loader', None)
+            if asset_loader:
+                asset_loader.load('poop', decode_poop_images, on_ready=self._set_images)
+            else:
+                self._set_images(decode_poop_images())
         except Exception as e:
             print(f'Error loading poop images: {e}')
+    def _set_images(self, images):
+        poop1, poop2, toilet_paper = images
+        self.poop_images = [
+            self.renderer.make_photo(poop1),
+            self.renderer.make_photo(poop2)
+        ]
+        self.toilet_paper_image = self.renderer.make_photo(toilet_paper)
     def update_poop_pressure(self):
-        now = datetime.now()
-        elapsed_minutes = (now - self.last_pressure_update).total_seconds() / 60.0
-        self.last_pressure_update = now
-        pressure_increase = elapsed_minutes * self.pressure_increase_rate
-        self.poop_pressure = min(self.max_poop_pressure, self.poop_pressure + pressure_increase)
-        self.update_poop_chance()
-    def update_poop_chance(self):
-        pressure_ratio = self.poop_pressure / self.max_poop_pressure
-        self.current_poop_chance = self.base_poop_chance + (pressure_ratio * (self.max_poop_chance - self.base_poop_chance))
+        self.pressure.update_pressure()
     def check_poop_generation(self, x, y):
         if self.pet_state.is_interacting or self.cleaning_mode:
             return
-        now = datetime.now()
-        if (now - self.last_poop_time).total_seconds() < self.min_poop_interval:
-            return
-        self.update_poop_pressure()
         cleanliness = self.pet_state.stats.get_stat('cleanliness') if hasattr(self.pet_state, 'stats') else 100
-        cleanliness_factor = 1 + ((100 - cleanliness) / 200)
-        final_chance = self.current_poop_chance * cleanliness_factor
-        random_value = random.random()
-        if random_value <= final_chance:
+        if self.pressure.roll(cleanliness):
             screen_x = self.root.winfo_x() + 128
             screen_y = self.root.winfo_y() + 128
             self.generate_poop(screen_x, screen_y)
-            self.last_poop_time = now
-            self.poop_pressure = max(0, self.poop_pressure - self.post_poop_pressure_reduction)
-            self.food_consumed = max(0, self.food_consumed - 1)
-            self.update_poop_chance()
     def generate_poop(self, screen_x, screen_y):
-        poop_img = self.poop_images[0]
-        offset_x = random.randint(-20, 20)
-        offset_y = random.randint(-20, 20)
-        abs_x = screen_x + offset_x
-        abs_y = screen_y + offset_y
-        poop_window = tk.Toplevel(self.root)
-        poop_window.overrideredirect(True)
-        poop_window.attributes('-topmost', True)
-        transparent_color = '#010101'
-        poop_window.config(bg=transparent_color)
-        poop_window.attributes('-transparentcolor', transparent_color)
-        poop_canvas = tk.Canvas(poop_window, width=32, height=32,
-                               highlightthickness=0, bg=transparent_color)
-        poop_canvas.pack()
-        poop_id = poop_canvas.create_image(16, 16, image=poop_img)
-        poop_window.geometry(f'32x32+{abs_x}+{abs_y}')
-        self.poops.append({
-            'id': poop_id,
-            'window': poop_window,
-            'canvas': poop_canvas,
-            'image': poop_img,
+        poop = {
+            'image': self.poop_images[0],
             'time': datetime.now(),
-            'abs_x': abs_x,
-            'abs_y': abs_y,
+            'abs_x': screen_x + random.randint(-20, 20),
+            'abs_y': screen_y + random.randint(-20, 20),
             'frame': 0
-        })
+        }
+        # While overlays are suspended (hidden pet or fullscreen app) the poop still counts, its window waits for them.
+        if self.scheduler.is_paused('overlay'):
+            self.pending_poops.append(poop)
+            if not self.scheduler.is_registered('poop.show_pending'):
+                self.scheduler.after('poop.show_pending', 0, self.show_pending_poops, subsystem='overlay')
+        else:
+            self._open_poop_window(poop)
         if hasattr(self.pet_state, 'stats'):
-            self.pet_state.stats.modify_stat('cleanliness', -9)
+            self.pet_state.stats.modify_stat('cleanliness', POOP_CLEANLINESS_PENALTY)
             self.pet_state.poop_system_dirty = True
+    def _open_poop_window(self, poop):
+        transparent_color = '#010101'
+        poop['window'], poop['canvas'] = self.renderer.open_overlay(poop['abs_x'], poop['abs_y'], 32, 32, bg=transparent_color,
+                                                                    transparent_color=transparent_color)
+        poop['id'] = poop['canvas'].create_image(16, 16, image=poop['image'])
+        self.poops.append(poop)
+    def show_pending_poops(self):
+        pending, self.pending_poops = self.pending_poops, []
+        for poop in pending:
+            self._open_poop_window(poop)
     def start_cleaning_mode(self):
         if not self.cleaning_mode:
             self.cleaning_mode = True
@@ -183,26 +160,25 @@ class PoopSystem:
             return cleaned
     def start_poop_check_timer(self):
         self.check_old_poops()
-        self.poop_check_timer = self.root.after(15000, self.start_poop_check_timer)
+        self.scheduler.register('poop.check', self.check_old_poops, OLD_POOP_CHECK_SECONDS * 1000, subsystem='simulation')
     def check_old_poops(self):
         now = datetime.now()
         has_old_poops = False
-        for poop in self.poops:
-            if (now - poop['time']).total_seconds() > 300:
+        for poop in self.poops + self.pending_poops:
+            if (now - poop['time']).total_seconds() > OLD_POOP_SECONDS:
                 has_old_poops = True
                 if hasattr(self.pet_state, 'stats'):
-                    self.pet_state.stats.modify_stat('cleanliness', -3)
+                    self.pet_state.stats.modify_stat('cleanliness', OLD_POOP_PENALTY['cleanliness'])
                     print(f"Old poop found! Cleanliness reduced to {self.pet_state.stats.get_stat('cleanliness')}")
         if has_old_poops:
             if hasattr(self.pet_state, 'stats'):
-                self.pet_state.stats.modify_stat('happiness', -0.5)
-                self.pet_state.stats.modify_stat('health', -0.2)
+                self.pet_state.stats.modify_stat('happiness', OLD_POOP_PENALTY['happiness'])
+                self.pet_state.stats.modify_stat('health', OLD_POOP_PENALTY['health'])
                 print(f"Old poops affecting pet! Happiness: {self.pet_state.stats.get_stat('happiness')}, Health: {self.pet_state.stats.get_stat('health')}")
-            if len(self.poops) > 3 and self.pet_state.current_animation != 'sad':
+            if len(self.poops) + len(self.pending_poops) > 3 and self.pet_state.current_animation != 'sad':
                 self.pet_state.current_animation = 'sad'
     def start_poop_animation(self):
-        self.animate_poops()
-        self.poop_animation_timer = self.root.after(500, self.start_poop_animation)
+        self.scheduler.register('poop.animate', self.animate_poops, 500, subsystem='render')
     def animate_poops(self):
         if not self.poops:
             return
@@ -217,12 +193,10 @@ class PoopSystem:
             poop['canvas'].config(bg=transparent_color)
             poop['window'].update()
     def cleanup(self):
-        if self.poop_check_timer:
-            self.root.after_cancel(self.poop_check_timer)
-            self.poop_check_timer = None
-        if hasattr(self, 'poop_animation_timer') and self.poop_animation_timer:
-            self.root.after_cancel(self.poop_animation_timer)
-            self.poop_animation_timer = None
+        self.scheduler.unregister('poop.check')
+        self.scheduler.unregister('poop.animate')
+        self.scheduler.unregister('poop.show_pending')
+        self.pending_poops = []
         for poop in self.poops:
             if 'window' in poop and poop['window'].winfo_exists():
                 poop['window'].destroy()
@@ -231,6 +205,7 @@ class PoopSystem:
         for poop in self.poops:
             poop['window'].destroy()
         self.poops = []
+        self.pending_poops = []
     def remove_poop(self, index):
         if 0 <= index < len(self.poops):
             self.poops[index]['window'].destroy()
@@ -239,9 +214,9 @@ class PoopSystem:
         return False
     def get_poop_status(self):
         return {
-            'poop_pressure': round(self.poop_pressure, 1),
-            'current_poop_chance': round(self.current_poop_chance, 3),
-            'food_consumed': self.food_consumed,
-            'active_poops': len(self.poops),
-            'time_since_last_poop': round((datetime.now() - self.last_poop_time).total_seconds(), 1)
+            'poop_pressure': round(self.pressure.poop_pressure, 1),
+            'current_poop_chance': round(self.pressure.current_poop_chance, 3),
+            'food_consumed': self.pressure.food_consumed,
+            'active_poops': len(self.poops) + len(self.pending_poops),
+            'time_since_last_poop': round(self.pressure.seconds_since_last_poop(), 1)
         }
\ No newline at end of file
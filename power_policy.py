@@ -0,0 +1,158 @@
+import os
+from collections import deque
+try:
+    import psutil
+except ImportError:
+    psutil = None
+try:
+    import win32gui
+    import win32process
+except ImportError:
+    win32gui = None
+    win32process = None
+RENDER_INTERVALS = {
+    'active': 100,
+    'idle': 250,
+    'sleeping': 500
+}
+IDLE_ANIMATIONS = ['Standing', 'sick', 'sad']
+HIDDEN_SUBSYSTEMS = ['render', 'overlay', 'movement']
+FULLSCREEN_SUBSYSTEMS = ['render', 'overlay', 'movement', 'ui']
+PAUSED_SUBSYSTEMS = {
+    'hidden': HIDDEN_SUBSYSTEMS,
+    'fullscreen': FULLSCREEN_SUBSYSTEMS
+}
+# The desktop and taskbar cover the screen too, but focusing them is not fullscreen use.
+SHELL_WINDOW_CLASSES = ['Progman', 'WorkerW', 'Shell_TrayWnd']
+# While suspended the policy itself backs off: a hidden window is also woken by its Map event, fullscreen apps are only polled.
+SUSPENDED_CHECK_MS = {
+    'hidden': 30000,
+    'fullscreen': 5000
+}
+LOW_POWER_SUBSYSTEMS = ['render', 'overlay']
+LOW_POWER_SCALE = 2
+class PowerPolicy:
+    def __init__(self, root, pet_state, settings, scheduler, check_interval_ms=1000, battery_check_seconds=60):
+        self.root = root
+        self.pet_state = pet_state
+        self.settings = settings
+        self.scheduler = scheduler
+        self.check_interval_ms = check_interval_ms
+        self.battery_check_seconds = battery_check_seconds
+        self.mode = None
+        self.low_power = False
+        self.on_battery = False
+        self.last_battery_check = None
+        self.wakeup_samples = deque()
+        self.scheduler.register('power.evaluate', self.evaluate, check_interval_ms, subsystem='power', delay_ms=0)
+        try:
+            self.root.bind('<Map>', self._on_map_change, add='+')
+            self.root.bind('<Unmap>', self._on_map_change, add='+')
+        except Exception as e:
+            print(f"Error binding window visibility events: {e}")
+    def _on_map_change(self, event):
+        if getattr(event, 'widget', self.root) is self.root:
+            self.evaluate()
+    def _is_hidden(self):
+        try:
+            return self.root.state() == 'withdrawn'
+        except Exception:
+            return False
+    def _is_fullscreen_foreground(self):
+        """Whether another process's foreground window covers the whole screen, like a game or fullscreen video."""
+        if win32gui is None:
+            return False
+        try:
+            hwnd = win32gui.GetForegroundWindow()
+            if not hwnd or win32gui.GetClassName(hwnd) in SHELL_WINDOW_CLASSES:
+                return False
+            if win32process.GetWindowThreadProcessId(hwnd)[1] == os.getpid():
+                return False
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+        except Exception:
+            return False
+        return (left <= 0 and top <= 0 and
+                right >= self.root.winfo_screenwidth() and bottom >= self.root.winfo_screenheight())
+    def _activity_mode(self):
+        if self._is_hidden():
+            return 'hidden'
+        if self.settings.get('fullscreen_suspend', True) and self._is_fullscreen_foreground():
+            return 'fullscreen'
+        animation = getattr(self.pet_state, 'current_animation', 'Standing')
+        if getattr(self.pet_state, 'is_sleeping', False) or animation == 'sleeping':
+            return 'sleeping'
+        if (animation in IDLE_ANIMATIONS and not self.pet_state.is_interacting and
+                not self.scheduler.is_registered('pet.move')):
+            return 'idle'
+        return 'active'
+    def _read_on_battery(self):
+        now = self.scheduler.clock()
+        if self.last_battery_check is not None and now - self.last_battery_check < self.battery_check_seconds:
+            return self.on_battery
+        self.last_battery_check = now
+        if psutil is None or not hasattr(psutil, 'sensors_battery'):
+            return False
+        try:
+            battery = psutil.sensors_battery()
+        except Exception as e:
+            print(f"Error reading battery status: {e}")
+            return False
+        return battery is not None and not battery.power_plugged
+    def _wants_low_power(self):
+        setting = self.settings.get('power_saver', 'auto')
+        if setting == 'on':
+            return True
+        if setting == 'off':
+            return False
+        self.on_battery = self._read_on_battery()
+        return self.on_battery
+    def _apply_mode(self, mode, old_mode):
+        paused = PAUSED_SUBSYSTEMS.get(mode, [])
+        for subsystem in PAUSED_SUBSYSTEMS.get(old_mode, []):
+            if subsystem not in paused:
+                self.scheduler.resume(subsystem)
+        for subsystem in paused:
+            self.scheduler.pause(subsystem)
+        if mode == 'fullscreen' or old_mode == 'fullscreen':
+            self._set_topmost(mode != 'fullscreen')
+            print("Fullscreen app in front, pet suspended" if mode == 'fullscreen' else "Fullscreen app closed, pet resumed")
+        if mode in RENDER_INTERVALS:
+            self.scheduler.set_interval('pet.animate', RENDER_INTERVALS[mode])
+        self.scheduler.set_interval('power.evaluate', SUSPENDED_CHECK_MS.get(mode, self.check_interval_ms))
+    def _set_topmost(self, topmost):
+        try:
+            self.root.attributes('-topmost', topmost and self.settings.get('always_on_top', True))
+        except Exception as e:
+            print(f"Error changing topmost state: {e}")
+    def _apply_low_power(self, low_power):
+        for subsystem in LOW_POWER_SUBSYSTEMS:
+            self.scheduler.set_interval_scale(subsystem, LOW_POWER_SCALE if low_power else 1)
+        print(f"Power saver {'on' if low_power else 'off'}")
+    def evaluate(self):
+        """Pick tick rates from what is visible: full rate when active, slower when idle or asleep, none when hidden or behind a fullscreen app."""
+        low_power = self._wants_low_power()
+        if low_power != self.low_power:
+            self.low_power = low_power
+            self._apply_low_power(low_power)
+        mode = self._activity_mode()
+        if mode != self.mode:
+            old_mode, self.mode = self.mode, mode
+            self._apply_mode(mode, old_mode)
+        now = self.scheduler.clock()
+        self.wakeup_samples.append((now, self.scheduler.wakeups))
+        while len(self.wakeup_samples) > 2 and now - self.wakeup_samples[0][0] > 60:
+            self.wakeup_samples.popleft()
+    def wakeups_per_minute(self):
+        if len(self.wakeup_samples) < 2:
+            return 0.0
+        (start_time, start_wakeups), (end_time, end_wakeups) = self.wakeup_samples[0], self.wakeup_samples[-1]
+        if end_time <= start_time:
+            return 0.0
+        return (end_wakeups - start_wakeups) * 60 / (end_time - start_time)
+    def get_stats(self):
+        return {
+            'mode': self.mode,
+            'low_power': self.low_power,
+            'on_battery': self.on_battery,
+            'wakeups_per_minute': self.wakeups_per_minute()
+        }
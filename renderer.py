@@ -0,0 +1,213 @@
+import heapq
+import time
+import tkinter as tk
+from collections import Counter
+from PIL import ImageTk
+class TkRenderer:
+    def __init__(self, root):
+        self.root = root
+    def make_photo(self, image):
+        return ImageTk.PhotoImage(image)
+    def photo_image(self, photo):
+        return ImageTk.getimage(photo)
+    def open_overlay(self, x, y, width, height, bg='white', transparent_color=None, parent=None):
+        """Borderless topmost window with one canvas filling it; returns (window, canvas)."""
+        window = tk.Toplevel(parent or self.root)
+        window.overrideredirect(True)
+        window.attributes('-topmost', True)
+        window.config(bg=bg)
+        if transparent_color:
+            window.attributes('-transparentcolor', transparent_color)
+        canvas = tk.Canvas(window, width=width, height=height, highlightthickness=0, bg=bg)
+        canvas.pack()
+        if x is not None and y is not None:
+            window.geometry(f'{width}x{height}+{x}+{y}')
+        return window, canvas
+    def move_window(self, window, x, y):
+        window.geometry(f'+{x}+{y}')
+    def measure_text(self, parent, text, font, wraplength):
+        label = tk.Label(parent, text=text, font=font, wraplength=wraplength)
+        label.update_idletasks()
+        size = (label.winfo_reqwidth(), label.winfo_reqheight())
+        label.destroy()
+        return size
+    def close(self, window):
+        window.destroy()
+class NullPhoto:
+    def __init__(self, image):
+        self.image = image
+    def width(self):
+        return self.image.width
+    def height(self):
+        return self.image.height
+class NullSurface:
+    """Stands in for a tk.Canvas: keeps item options and records every call made on it."""
+    def __init__(self, renderer, width=256, height=256):
+        self.renderer = renderer
+        self.width = width
+        self.height = height
+        self.items = {}
+    def _create(self, kind, args, kwargs):
+        self.renderer.next_id += 1
+        self.items[self.renderer.next_id] = dict(kwargs, type=kind, coords=args)
+        self.renderer.record(f'canvas.create_{kind}')
+        return self.renderer.next_id
+    def create_image(self, *args, **kwargs):
+        return self._create('image', args, kwargs)
+    def itemconfigure(self, item, **kwargs):
+        self.renderer.record('canvas.itemconfigure')
+        if item in self.items:
+            self.items[item].update(kwargs)
+    itemconfig = itemconfigure
+    def coords(self, item, *args):
+        self.renderer.record('canvas.coords')
+        if item in self.items and args:
+            self.items[item]['coords'] = args
+        return list(self.items.get(item, {}).get('coords', ()))
+    def delete(self, *items):
+        self.renderer.record('canvas.delete')
+        for item in items:
+            if item == 'all':
+                self.items.clear()
+            self.items.pop(item, None)
+    def type(self, item):
+        return self.items.get(item, {}).get('type', '')
+    def winfo_width(self):
+        return self.width
+    def winfo_height(self):
+        return self.height
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        if name.startswith('create_'):
+            return lambda *args, **kwargs: self._create(name[len('create_'):], args, kwargs)
+        def call(*args, **kwargs):
+            self.renderer.record(f'canvas.{name}')
+        return call
+class NullWindow:
+    """Stands in for a Toplevel: tracks position and records geometry and other window calls."""
+    def __init__(self, renderer, x=0, y=0, width=256, height=256):
+        self.renderer = renderer
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.exists = True
+    def geometry(self, spec=None):
+        if spec is None:
+            return f'+{self.x}+{self.y}'
+        self.renderer.record('window.geometry')
+        position = spec[spec.index('+'):] if '+' in spec else ''
+        if position:
+            x, y = position[1:].split('+')
+            self.x, self.y = int(x), int(y)
+    def winfo_x(self):
+        return self.x
+    def winfo_y(self):
+        return self.y
+    def winfo_width(self):
+        return self.width
+    def winfo_height(self):
+        return self.height
+    def winfo_exists(self):
+        return self.exists
+    def destroy(self):
+        self.renderer.record('window.destroy')
+        self.exists = False
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        def call(*args, **kwargs):
+            self.renderer.record(f'window.{name}')
+        return call
+class NullRenderer:
+    """Headless backend that counts and timestamps draw and geometry operations instead of performing them."""
+    def __init__(self, clock=time.monotonic, keep_ops=True):
+        self.clock = clock
+        self.keep_ops = keep_ops
+        self.ops = []
+        self.counts = Counter()
+        self.next_id = 0
+    def record(self, op):
+        self.counts[op] += 1
+        if self.keep_ops:
+            self.ops.append((self.clock(), op))
+    def mark(self):
+        return len(self.ops)
+    def counts_since(self, mark):
+        return Counter(op for timestamp, op in self.ops[mark:])
+    def surface(self, width=256, height=256):
+        return NullSurface(self, width, height)
+    def make_photo(self, image):
+        self.record('photo')
+        return NullPhoto(image)
+    def photo_image(self, photo):
+        return photo.image
+    def open_overlay(self, x, y, width, height, bg='white', transparent_color=None, parent=None):
+        self.record('open_overlay')
+        return NullWindow(self, x or 0, y or 0, width, height), NullSurface(self, width, height)
+    def move_window(self, window, x, y):
+        window.geometry(f'+{x}+{y}')
+    def measure_text(self, parent, text, font, wraplength):
+        # Roughly 8 px per character, wrapped at wraplength, 20 px per line.
+        width = len(text) * 8
+        lines = max(1, -(-width // wraplength))
+        return min(width, wraplength), lines * 20
+    def close(self, window):
+        window.destroy()
+class ManualClock:
+    def __init__(self, start=0.0):
+        self.now = start
+    def __call__(self):
+        return self.now
+    def advance(self, seconds):
+        self.now += seconds
+class HeadlessRoot(NullWindow):
+    """Enough of a Tk root for the pet loop to run without a display, jumping the clock from one timer to the next."""
+    def __init__(self, renderer=None, clock=None, screen_size=(1920, 1080), x=300, y=300):
+        self.clock = clock or ManualClock()
+        super().__init__(renderer or NullRenderer(self.clock), x, y)
+        self.screen_size = screen_size
+        self.window_state = 'normal'
+        self.timers = []
+        self.cancelled = set()
+        self.next_timer = 0
+    def _root(self):
+        return self
+    def after(self, delay_ms, callback=None, *args):
+        self.next_timer += 1
+        heapq.heappush(self.timers, (self.clock() + delay_ms / 1000, self.next_timer, callback, args))
+        return self.next_timer
+    def after_idle(self, callback, *args):
+        return self.after(0, callback, *args)
+    def after_cancel(self, timer_id):
+        self.cancelled.add(timer_id)
+    def winfo_screenwidth(self):
+        return self.screen_size[0]
+    def winfo_screenheight(self):
+        return self.screen_size[1]
+    def state(self, new_state=None):
+        if new_state is None:
+            return self.window_state
+        self.window_state = new_state
+    def withdraw(self):
+        self.window_state = 'withdrawn'
+    def deiconify(self):
+        self.window_state = 'normal'
+    def run_for(self, seconds):
+        """Fire every timer due in the next seconds of simulated time, as fast as the callbacks allow."""
+        end = self.clock() + seconds
+        fired = 0
+        while self.timers and self.timers[0][0] <= end:
+            due, timer_id, callback, args = heapq.heappop(self.timers)
+            if timer_id in self.cancelled:
+                self.cancelled.discard(timer_id)
+                continue
+            self.clock.now = max(self.clock.now, due)
+            fired += 1
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error in headless timer: {e}")
+        self.clock.now = max(self.clock.now, end)
+        return fired
@@ -0,0 +1,287 @@
+import argparse
+import bisect
+import csv
+import json
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pet_components import PetStats, PetGrowth, PetBehavior
+from poop_pressure import PoopPressureModel, POOP_CLEANLINESS_PENALTY, OLD_POOP_CHECK_SECONDS, OLD_POOP_SECONDS, OLD_POOP_PENALTY
+from stat_catchup import VITAL_STATS, MINUTES_PER_DAY
+from treasure_rewards import CHEST_CHECK_SECONDS, roll_chest_spawn, generate_rewards, level_reward
+# Stats are integrated exactly whatever the step; it only sets how often evolution, sickness and care are looked at.
+TICK_SECONDS = 300
+# update_state checks for poop every 5 s. A walking pet also rolls every 50 ms it walks (PetAnimation._on_walk_step);
+# the simulation has no window or wandering, so it models a pet standing still and undercounts poops for one that roams.
+POOP_CHECK_SECONDS = 5
+SAMPLE_MINUTES = 60
+# main's default poop_frequency setting.
+DEFAULT_POOP_FREQUENCY = 0.2
+DEFAULT_START = datetime(2025, 1, 1, 8, 0)
+DEFAULT_POLICY = {
+    'check_every_minutes': 60,
+    'awake_hours': [8, 23],
+    'feed_below': 50,
+    'play_below': 40,
+    'pet_below': 50,
+    'clean_below': 40,
+    'medicine_when_sick': True,
+    'clean_poops': True,
+    'max_actions': 3,
+    # Chance the owner is around to click a chest in the five minutes before it disappears.
+    'open_chest_chance': 0.5,
+    'games_per_check': 0,
+    'game_win_rate': 0.6
+}
+CLEANED_POOP_BONUS = 2
+# Average energy a game round costs across the three mini-games.
+GAME_ENERGY_COST = 1
+SERIES_FIELDS = ['minute', 'day', 'stage'] + VITAL_STATS + ['age', 'sleeping', 'sick', 'mood', 'activity',
+                                                            'poops_on_floor', 'poop_pressure']
+class SimClock:
+    """Injected in place of datetime.now; only moves when the simulation advances it."""
+    def __init__(self, start=DEFAULT_START):
+        self.start = start
+        self.seconds = 0.0
+    def __call__(self):
+        return self.start + timedelta(seconds=self.seconds)
+    def advance(self, seconds):
+        self.seconds += seconds
+class SimPetState:
+    """The parts of main.PetState that PetStats, PetGrowth and PetBehavior touch."""
+    def __init__(self):
+        self.stage = 'Baby'
+        self.current_animation = 'Standing'
+        self.is_interacting = False
+        self.is_sleeping = False
+        self.sleep_start_time = None
+        self.sleep_duration = None
+class CarePolicy:
+    """A scripted owner who checks in during waking hours and tops up whatever is below its thresholds."""
+    def __init__(self, policy=None):
+        self.policy = dict(DEFAULT_POLICY, **(policy or {}))
+        self.last_check = None
+    def is_awake(self, now):
+        start_hour, end_hour = self.policy['awake_hours']
+        return start_hour <= now.hour < end_hour
+    def due(self, now):
+        if not self.is_awake(now):
+            return False
+        if self.last_check is not None and (now - self.last_check).total_seconds() < self.policy['check_every_minutes'] * 60:
+            return False
+        self.last_check = now
+        return True
+    def act(self, sim):
+        """Run one check-in and return the interactions performed."""
+        policy = self.policy
+        stats = sim.stats
+        actions = []
+        if policy['clean_poops'] and sim.poops:
+            stats.modify_stat('cleanliness', CLEANED_POOP_BONUS * len(sim.poops))
+            actions.append('clean_poops')
+            sim.poops = []
+        if policy['medicine_when_sick'] and 'sick' in stats.get_status_effects():
+            actions.append(sim.interact('medicine'))
+        if sim.pet_state.is_sleeping:
+            return actions
+        for interaction, stat, threshold in (('feed', 'hunger', 'feed_below'), ('play', 'happiness', 'play_below'),
+                                             ('pet', 'social', 'pet_below'), ('clean', 'cleanliness', 'clean_below')):
+            for _ in range(policy['max_actions']):
+                if stats.get_stat(stat) >= policy[threshold]:
+                    break
+                actions.append(sim.interact(interaction))
+        for _ in range(policy['games_per_check']):
+            actions.append(sim.play_game(sim.rng.random() < policy['game_win_rate']))
+        return actions
+class Simulation:
+    """PetStats, PetGrowth, PetBehavior and the poop model on a simulated clock, advanced TICK_SECONDS at a time."""
+    def __init__(self, policy=None, config=None, seed=None, start=DEFAULT_START, tick_seconds=TICK_SECONDS,
+                 sample_minutes=SAMPLE_MINUTES, rng=None):
+        config = config or {}
+        self.clock = SimClock(start)
+        self.rng = rng or random.Random(seed)
+        self.tick_seconds = tick_seconds
+        self.sample_minutes = sample_minutes
+        self.pet_state = SimPetState()
+        self.growth = PetGrowth(None)
+        self.stats = PetStats(self.growth, self.clock)
+        self.growth.stats = self.stats
+        self.stats.pet_state = self.pet_state
+        self.pet_state.stats = self.stats
+        self.pet_state.growth = self.growth
+        if 'decay_rates' in config:
+            self.stats.decay_rates = dict(config['decay_rates'])
+            self.stats.decay_rates = self.stats._get_stage_adjusted_rates()
+        if 'evolution_thresholds' in config:
+            self.growth.evolution_thresholds.update(config['evolution_thresholds'])
+        self.behavior = PetBehavior(self.stats, self.growth, self.clock, self.rng)
+        self.poop_model = PoopPressureModel(config.get('poop_frequency', DEFAULT_POOP_FREQUENCY), self.clock, self.rng)
+        self.policy = CarePolicy(policy)
+        self.poops = []
+        self.poops_total = 0
+        self.interactions = {}
+        self.series = []
+        self.sickness_periods = []
+        self.evolutions = []
+        self.was_sick = False
+        self.next_sample = 0.0
+        self.next_old_poop_check = OLD_POOP_CHECK_SECONDS
+        self.next_poop_check = POOP_CHECK_SECONDS
+        self.next_chest_check = 0.0
+        self.last_chest_date = None
+        self.chests = {'opened': 0, 'missed': 0}
+        self.coins = {'chest': 0, 'games': 0}
+        self.game_level = 1
+    def minutes(self):
+        return self.clock.seconds / 60
+    def interact(self, interaction):
+        self.behavior.handle_interaction(interaction)
+        if interaction == 'feed':
+            self.poop_model.add_food(1)
+        self.interactions[interaction] = self.interactions.get(interaction, 0) + 1
+        return interaction
+    def play_game(self, won):
+        self.stats.modify_stat('energy', -GAME_ENERGY_COST)
+        if not won:
+            self.game_level = max(1, self.game_level - 1)
+            return 'game_lost'
+        self.coins['games'] += level_reward(self.game_level)
+        self.game_level += 1
+        self.interact('play')
+        return 'game_won'
+    def _chest_checks(self, end):
+        while self.next_chest_check <= end:
+            now = self.clock.start + timedelta(seconds=self.next_chest_check)
+            self.next_chest_check += CHEST_CHECK_SECONDS
+            if self.last_chest_date == now.date() or not roll_chest_spawn(self.rng):
+                continue
+            self.last_chest_date = now.date()
+            if self.policy.is_awake(now) and self.rng.random() < self.policy.policy['open_chest_chance']:
+                self.coins['chest'] += generate_rewards(self.rng)['coins']
+                self.chests['opened'] += 1
+            else:
+                self.chests['missed'] += 1
+    def _poop_checks(self, end):
+        # Rolls land on update_state's check cadence; cleanliness is read once per tick, it barely moves in between.
+        cleanliness = self.stats.get_stat('cleanliness')
+        while self.next_poop_check <= end:
+            now = self.clock.start + timedelta(seconds=self.next_poop_check)
+            if self.poop_model.roll(cleanliness, now):
+                self.poops.append(self.next_poop_check)
+                self.poops_total += 1
+                self.stats.modify_stat('cleanliness', POOP_CLEANLINESS_PENALTY)
+                cleanliness = self.stats.get_stat('cleanliness')
+                # Checks inside min_poop_interval cannot succeed and change nothing, so skip straight past them.
+                wait = -(-self.poop_model.min_poop_interval // POOP_CHECK_SECONDS) * POOP_CHECK_SECONDS
+                self.next_poop_check += wait
+            else:
+                self.next_poop_check += POOP_CHECK_SECONDS
+        old_poops = 0
+        checks_with_old_poops = 0
+        while self.next_old_poop_check <= end:
+            # poops holds drop times in order, so the old ones are a prefix.
+            count = bisect.bisect_left(self.poops, self.next_old_poop_check - OLD_POOP_SECONDS)
+            old_poops += count
+            checks_with_old_poops += 1 if count else 0
+            self.next_old_poop_check += OLD_POOP_CHECK_SECONDS
+        # Every penalty is negative, so applying a tick's worth at once clamps the same as one check at a time.
+        if checks_with_old_poops:
+            self.stats.modify_stat('cleanliness', OLD_POOP_PENALTY['cleanliness'] * old_poops)
+            self.stats.modify_stat('happiness', OLD_POOP_PENALTY['happiness'] * checks_with_old_poops)
+            self.stats.modify_stat('health', OLD_POOP_PENALTY['health'] * checks_with_old_poops)
+    def _record(self):
+        row = {
+            'minute': round(self.minutes(), 2),
+            'day': round(self.minutes() / MINUTES_PER_DAY, 3),
+            'stage': self.growth.stage,
+            'age': round(self.stats.get_stat('age'), 3),
+            'sleeping': self.pet_state.is_sleeping,
+            'sick': self.stats.is_sick,
+            'mood': self.behavior.current_mood,
+            'activity': self.behavior.current_activity,
+            'poops_on_floor': len(self.poops),
+            'poop_pressure': round(self.poop_model.poop_pressure, 2)
+        }
+        for stat in VITAL_STATS:
+            row[stat] = round(self.stats.get_stat(stat), 2)
+        self.series.append(row)
+    def step(self):
+        self.clock.advance(self.tick_seconds)
+        self.stats.catch_up()
+        self._poop_checks(self.clock.seconds)
+        self._chest_checks(self.clock.seconds)
+        if self.growth.check_evolution():
+            self.evolutions.append({'stage': self.growth.stage, 'day': round(self.minutes() / MINUTES_PER_DAY, 3),
+                                    'age': round(self.stats.get_stat('age'), 3)})
+        self.behavior.update_mood()
+        self.behavior.decide_activity()
+        if self.policy.due(self.clock()):
+            self.policy.act(self)
+        self.stats.update_sickness_status()
+        if self.stats.is_sick != self.was_sick:
+            self.was_sick = self.stats.is_sick
+            if self.was_sick:
+                self.sickness_periods.append({'start_day': round(self.minutes() / MINUTES_PER_DAY, 3), 'end_day': None})
+            else:
+                self.sickness_periods[-1]['end_day'] = round(self.minutes() / MINUTES_PER_DAY, 3)
+        if self.minutes() >= self.next_sample:
+            self._record()
+            self.next_sample += self.sample_minutes
+    def run(self, days):
+        self._record()
+        self.next_sample = self.sample_minutes
+        end = days * MINUTES_PER_DAY * 60
+        while self.clock.seconds < end:
+            self.step()
+        return self.summary()
+    def summary(self):
+        sick_days = sum((period['end_day'] if period['end_day'] is not None else self.minutes() / MINUTES_PER_DAY)
+                        - period['start_day'] for period in self.sickness_periods)
+        return {
+            'days': round(self.minutes() / MINUTES_PER_DAY, 3),
+            'stage': self.growth.stage,
+            'evolutions': self.evolutions,
+            'sickness_periods': len(self.sickness_periods),
+            'first_sick_day': self.sickness_periods[0]['start_day'] if self.sickness_periods else None,
+            'sick_days': round(sick_days, 3),
+            'poops': self.poops_total,
+            'interactions': self.interactions,
+            'chests': self.chests,
+            'coins': self.coins
+        }
+def write_output(sim, summary, path, output_format=None):
+    output_format = output_format or ('csv' if path.endswith('.csv') else 'json')
+    if output_format == 'csv':
+        with open(path, 'w', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=SERIES_FIELDS)
+            writer.writeheader()
+            writer.writerows(sim.series)
+        return
+    with open(path, 'w') as f:
+        json.dump({'summary': summary, 'sickness_periods': sim.sickness_periods, 'evolutions': sim.evolutions,
+                   'policy': sim.policy.policy, 'series': sim.series}, f, indent=4)
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fast-forward a pet headlessly under a scripted care policy.")
+    parser.add_argument('--days', type=float, default=90)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--config', help="JSON file with policy, decay_rates, evolution_thresholds and poop_frequency")
+    parser.add_argument('--tick', type=float, default=TICK_SECONDS, help="simulation step in seconds")
+    parser.add_argument('--sample', type=float, default=SAMPLE_MINUTES, help="minutes between time series rows")
+    parser.add_argument('--out', help="write the time series to a .csv file, or everything to a .json file")
+    parser.add_argument('--format', choices=['csv', 'json'])
+    args = parser.parse_args(argv)
+    config = {}
+    if args.config:
+        with open(args.config) as f:
+            config = json.load(f)
+    started = time.perf_counter()
+    sim = Simulation(config.get('policy'), config, args.seed, tick_seconds=args.tick, sample_minutes=args.sample)
+    summary = sim.run(args.days)
+    if args.out:
+        write_output(sim, summary, args.out, args.format)
+    print(json.dumps(summary, indent=4))
+    print(f"Simulated {args.days:g} days in {time.perf_counter() - started:.2f} s", file=sys.stderr)
+    return summary
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,25 @@
 import tkinter as tk
 import math
 import random
+from collections import deque
 from PIL import Image, ImageDraw, ImageTk
 from unified_ui import COLORS
+from renderer import TkRenderer
+from frame_scheduler import get_scheduler
+
+SPEECH_QUEUE_LIMIT = 3
 
 class SpeechBubble:
     
-    def __init__(self, canvas, parent):
+    def __init__(self, canvas, parent, renderer=None):
         self.canvas = canvas
         self.parent = parent
+        self.renderer = renderer or TkRenderer(parent)
+        self.scheduler = get_scheduler(self.parent)
+        self.speech_queue = deque(maxlen=SPEECH_QUEUE_LIMIT)  # Held while overlays are suspended
         self.bubble_window = None
         self.bubble_duration = 5000
         self._bubble_timer = None
-        self._update_position_timer = None
         self._repositioning_pet = False  # Flag to prevent repositioning loops
         self._last_reposition_time = 0  # Track when we last repositioned
         self._bubble_positioned = False  # Flag to prevent positioning loops
@@ -259,7 +266,7 @@ class SpeechBubble:
             ]
         }
     
-    def show_bubble(self, message_type, custom_message=None, use_typewriter=False):
+    def show_bubble(self, message_type, custom_message=None, use_typewriter=False, urgent=False):
         # Skip all bubbles during sleep except sleep-related ones
         if (hasattr(self.parent, 'pet_manager') and
             hasattr(self.parent.pet_manager, 'pet_state') and
@@ -270,6 +277,13 @@ class SpeechBubble:
         responses = self.responses.get(message_type, self.responses['default'])
         message = custom_message if custom_message else random.choice(responses)
         
+        # While overlays are suspended (e.g. a fullscreen game), keep the latest few messages for later
+        if not urgent and self.scheduler.is_paused('overlay'):
+            self.speech_queue.append((message_type, message))
+            if not self.scheduler.is_registered('speech_bubble.queue'):
+                self.scheduler.after('speech_bubble.queue', 0, self._show_queued_speech, subsystem='overlay')
+            return
+        
         self.clear_bubble() # Always clear previous bubble before showing a new one
         
         # Disable typewriter effect entirely - always show complete messages
@@ -291,14 +305,6 @@ class SpeechBubble:
             self.pet_x = pet_x
             self.pet_y = pet_y
             
-            self.bubble_window = tk.Toplevel(self.parent)
-            
-            self.bubble_window.overrideredirect(True)
-            self.bubble_window.attributes('-topmost', True)
-            self.bubble_window.attributes('-transparentcolor', 'white')
-            
-            self.bubble_window.configure(bg='white')
-            
         except Exception as e:
             print(f"Error in _create_bubble setup: {e}")
             import traceback
@@ -309,12 +315,7 @@ class SpeechBubble:
             padding = 12
             
             # Calculate dynamic size based on message length (following old implementation pattern)
-            temp_label = tk.Label(self.bubble_window, text=message, font=("Comic Sans MS", 11, "bold"), wraplength=250)
-            temp_label.update_idletasks()
-            
-            text_width = temp_label.winfo_reqwidth()
-            text_height = temp_label.winfo_reqheight()
-            temp_label.destroy()
+            text_width, text_height = self.renderer.measure_text(self.parent, message, ("Comic Sans MS", 11, "bold"), 250)
             
             # Dynamic sizing - grow with content but have reasonable limits
             min_width = 120
@@ -325,14 +326,11 @@ class SpeechBubble:
             canvas_width = bubble_width + 40
             canvas_height = bubble_height + 40
             
-            bubble_canvas = tk.Canvas(
-                self.bubble_window,
-                width=canvas_width,
-                height=canvas_height,
-                bg='white',
-                highlightthickness=0
+            # White is the transparent color, so only the bubble shape shows
+            self.bubble_window, bubble_canvas = self.renderer.open_overlay(
+                None, None, canvas_width, canvas_height,
+                bg='white', transparent_color='white', parent=self.parent
             )
-            bubble_canvas.pack()
             
             corner_radius = 15
             
@@ -387,8 +385,6 @@ class SpeechBubble:
             
             self._update_bubble_position(canvas_width, canvas_height)
             
-            self._start_position_updates(canvas_width, canvas_height)
-            
             # Store text widget reference
             self.bubble_text_id = bubble_canvas.create_text(
                 (bubble_width + 30) // 2,
@@ -420,12 +416,29 @@ class SpeechBubble:
             import traceback
             traceback.print_exc()
     
-    def _update_bubble_position(self, canvas_width, canvas_height):
+    def _show_queued_speech(self):
+        """Runs once overlays resume, showing held messages one after another."""
+        if not self.speech_queue:
+            return
+        message_type, message = self.speech_queue.popleft()
+        self.show_bubble(message_type, message)
+        if self.speech_queue:
+            display_time = max(self.bubble_duration, len(message) * 100)
+            self.scheduler.after('speech_bubble.queue', display_time, self._show_queued_speech, subsystem='overlay')
+    
+    def follow_pet(self, x, y):
+        """Layout callback from the pet's movement engine, so the bubble moves in the same tick as the pet."""
+        if self.bubble_window:
+            self._update_bubble_position(self.canvas_width, self.canvas_height, (x, y))
+    
+    def _update_bubble_position(self, canvas_width, canvas_height, pet_position=None):
         if not self.bubble_window:
             return
-            
-        pet_x = self.parent.winfo_x() + self.canvas.winfo_width() // 2
-        pet_y = self.parent.winfo_y() + 100
+        
+        if pet_position is None:
+            pet_position = (self.parent.winfo_x(), self.parent.winfo_y())
+        pet_x = pet_position[0] + self.canvas.winfo_width() // 2
+        pet_y = pet_position[1] + 100
         
         # Calculate ideal bubble position (above pet)
         bubble_x = pet_x - canvas_width // 2
@@ -456,7 +469,7 @@ class SpeechBubble:
             self._last_bubble_position = current_position
             self._bubble_positioned = True
         
-        self.bubble_window.geometry(f"+{bubble_x}+{bubble_y}")
+        self.renderer.move_window(self.bubble_window, bubble_x, bubble_y)
     
     def _adjust_pet_position_for_bubble(self, new_y):
         """Naturally move the pet down to accommodate speech bubble using normal movement speed"""
@@ -483,15 +496,8 @@ class SpeechBubble:
                 # Pause current movement
                 pet_animation.pause_movement()
                 
-                # Set target position (keep same X, move to new Y)
-                pet_animation.target_x = current_x
-                pet_animation.target_y = new_y
-                
-                # Set walking animation and direction (no direction change needed for vertical movement)
-                pet_state.current_animation = 'Walking'
-                
-                # Start natural movement
-                pet_animation.move_step()
+                # Walk to the new Y, keeping the same X
+                pet_animation.walk_to(current_x, new_y, stop_on_interaction=False)
                 
                 # Schedule resuming normal behavior after reaching position
                 def check_arrival():
@@ -538,17 +544,6 @@ class SpeechBubble:
                 
                 move_step(1)
     
-    def _start_position_updates(self, canvas_width, canvas_height):
-        if self._update_position_timer:
-            self.parent.after_cancel(self._update_position_timer)
-        
-        def update_loop():
-            if self.bubble_window:
-                self._update_bubble_position(canvas_width, canvas_height)
-                self._update_position_timer = self.parent.after(50, update_loop)
-        
-        self._update_position_timer = self.parent.after(50, update_loop)
-    
     def _update_bubble_text(self, new_text, is_complete=False):
         """Update the text in an existing bubble (deprecated - no longer used for typewriter)"""
         if not self.bubble_window or not hasattr(self, 'bubble_canvas') or not hasattr(self, 'bubble_text_id'):
@@ -580,12 +575,6 @@ class SpeechBubble:
         if self._bubble_timer:
             self.parent.after_cancel(self._bubble_timer)
             self._bubble_timer = None
-            
-        if self._update_position_timer:
-            self.parent.after_cancel(self._update_position_timer)
-            self._update_position_timer = None
-        
-        
         
         if self.bubble_window:
             self.bubble_window.destroy()
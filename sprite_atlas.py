@@ -0,0 +1,112 @@
+import os
+import json
+import sys
+from PIL import Image
+FRAMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'frames')
+ATLAS_DIR = os.path.join(FRAMES_DIR, 'atlas')
+ATLAS_IMAGE = 'atlas.png'
+ATLAS_INDEX = 'atlas.json'
+ATLAS_VERSION = 1
+def _source_dirs(frames_dir):
+    return [frames_dir, os.path.join(frames_dir, 'Evolution')]
+def _dir_signature(frames_dir):
+    signature = {}
+    for directory in _source_dirs(frames_dir):
+        rel = os.path.relpath(directory, frames_dir).replace(os.sep, '/')
+        try:
+            signature[rel] = os.stat(directory).st_mtime_ns
+        except OSError:
+            signature[rel] = None
+    return signature
+def collect_frame_files(frames_dir=FRAMES_DIR):
+    files = []
+    for directory in _source_dirs(frames_dir):
+        if not os.path.isdir(directory):
+            continue
+        for name in sorted(os.listdir(directory)):
+            if name.lower().endswith('.png'):
+                path = os.path.join(directory, name)
+                files.append((os.path.relpath(path, frames_dir).replace(os.sep, '/'), path))
+    return files
+def build_atlas(frames_dir=FRAMES_DIR, atlas_dir=ATLAS_DIR, max_width=256, padding=1):
+    """Pack every frame PNG into one RGBA atlas image plus a JSON index."""
+    images = []
+    for name, path in collect_frame_files(frames_dir):
+        try:
+            images.append((name, Image.open(path).convert('RGBA')))
+        except Exception as e:
+            print(f"Skipping {name}: {e}")
+    images.sort(key=lambda item: (-item[1].height, item[0]))
+    placements = {}
+    x = y = shelf_height = atlas_width = 0
+    for name, img in images:
+        if x + img.width > max_width and x > 0:
+            y += shelf_height + padding
+            x = shelf_height = 0
+        placements[name] = [x, y, img.width, img.height]
+        x += img.width + padding
+        shelf_height = max(shelf_height, img.height)
+        atlas_width = max(atlas_width, x)
+    atlas_height = y + shelf_height
+    atlas = Image.new('RGBA', (max(1, atlas_width), max(1, atlas_height)), (0, 0, 0, 0))
+    for name, img in images:
+        atlas.paste(img, tuple(placements[name][:2]))
+    os.makedirs(atlas_dir, exist_ok=True)
+    atlas.save(os.path.join(atlas_dir, ATLAS_IMAGE), optimize=True)
+    index = {
+        'version': ATLAS_VERSION,
+        'image': ATLAS_IMAGE,
+        'size': [atlas.width, atlas.height],
+        'sources': _dir_signature(frames_dir),
+        'frames': placements
+    }
+    with open(os.path.join(atlas_dir, ATLAS_INDEX), 'w') as f:
+        json.dump(index, f, indent=1)
+    return index
+class SpriteAtlas:
+    def __init__(self, image, frames, frames_dir=FRAMES_DIR, mtime=0):
+        self.image = image
+        self.frames_dir = frames_dir
+        self.mtime = mtime
+        self.frames = {name.lower(): tuple(box) for name, box in frames.items()}
+    @classmethod
+    def load(cls, frames_dir=FRAMES_DIR, atlas_dir=ATLAS_DIR):
+        """Load the atlas if it exists and matches the frames directory, otherwise return None."""
+        index_path = os.path.join(atlas_dir, ATLAS_INDEX)
+        if not os.path.exists(index_path):
+            return None
+        try:
+            with open(index_path, 'r') as f:
+                index = json.load(f)
+            if index.get('version') != ATLAS_VERSION:
+                return None
+            if index.get('sources') != _dir_signature(frames_dir):
+                print("Sprite atlas is out of date, run 'python sprite_atlas.py' to rebuild it")
+                return None
+            image_path = os.path.join(atlas_dir, index['image'])
+            image = Image.open(image_path)
+            image.load()
+            if image.mode != 'RGBA':
+                image = image.convert('RGBA')
+            return cls(image, index['frames'], frames_dir, os.stat(image_path).st_mtime_ns)
+        except Exception as e:
+            print(f"Error loading sprite atlas: {e}")
+            return None
+    def _name_for(self, path):
+        return os.path.relpath(path, self.frames_dir).replace(os.sep, '/').lower()
+    def has_path(self, path):
+        return self._name_for(path) in self.frames
+    def get_path(self, path):
+        return self.get(self._name_for(path))
+    def get(self, name):
+        box = self.frames.get(name.lower())
+        if box is None:
+            return None
+        x, y, width, height = box
+        return self.image.crop((x, y, x + width, y + height))
+if __name__ == "__main__":
+    frames_dir = sys.argv[1] if len(sys.argv) > 1 else FRAMES_DIR
+    atlas_dir = sys.argv[2] if len(sys.argv) > 2 else os.path.join(frames_dir, 'atlas')
+    index = build_atlas(frames_dir, atlas_dir)
+    print(f"Packed {len(index['frames'])} frames into {os.path.join(atlas_dir, ATLAS_IMAGE)} "
+          f"({index['size'][0]}x{index['size'][1]})")
@@ -0,0 +1,114 @@
+import os
+import json
+import threading
+from PIL import Image
+class SpriteCache:
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'saves', 'sprite_cache')
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(self.cache_dir, 'index.json')
+        self.index = {}
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.load_index()
+    def load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, 'r') as f:
+                self.index = json.load(f)
+        except Exception as e:
+            print(f"Error loading sprite cache index: {e}")
+            self.index = {}
+        # Entries written before the cache was keyed by source file can't be matched any more.
+        stale = [key for key, entry in self.index.items() if 'source' not in entry]
+        for key in stale:
+            self._remove_file(self.index.pop(key))
+        if stale:
+            self._dirty = True
+    @staticmethod
+    def make_key(source, pet_size):
+        return f"{source}@{pet_size}"
+    def get(self, source, pet_size, source_mtime):
+        """Return the cached RGBA frame for a source file, or None if missing or stale."""
+        with self._lock:
+            key = self.make_key(source, pet_size)
+            entry = self.index.get(key)
+            if not entry or entry.get('mtime') != source_mtime:
+                self.misses += 1
+                return None
+            try:
+                width, height = entry['size']
+                with open(os.path.join(self.cache_dir, entry['file']), 'rb') as f:
+                    data = f.read()
+                if len(data) != width * height * 4:
+                    raise ValueError(f"size mismatch for {key}")
+                self.hits += 1
+                return Image.frombytes('RGBA', (width, height), data)
+            except Exception as e:
+                print(f"Error reading sprite cache entry {key}: {e}")
+                del self.index[key]
+                self._dirty = True
+                self.misses += 1
+                return None
+    def put(self, source, pet_size, source_mtime, image):
+        with self._lock:
+            key = self.make_key(source, pet_size)
+            filename = f"{os.path.splitext(source)[0].replace('/', '_')}_{pet_size}.rgba"
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                rgba = image if image.mode == 'RGBA' else image.convert('RGBA')
+                with open(os.path.join(self.cache_dir, filename), 'wb') as f:
+                    f.write(rgba.tobytes())
+                self.index[key] = {
+                    'file': filename,
+                    'source': source,
+                    'size': [rgba.width, rgba.height],
+                    'mtime': source_mtime
+                }
+                self.writes += 1
+                self._dirty = True
+                return True
+            except Exception as e:
+                print(f"Error writing sprite cache entry {key}: {e}")
+                return False
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                tmp_path = self.index_path + '.tmp'
+                with open(tmp_path, 'w') as f:
+                    json.dump(self.index, f)
+                os.replace(tmp_path, self.index_path)
+                self._dirty = False
+            except Exception as e:
+                print(f"Error saving sprite cache index: {e}")
+    def _remove_file(self, entry):
+        try:
+            os.remove(os.path.join(self.cache_dir, entry['file']))
+        except (OSError, KeyError):
+            pass
+    def clear(self):
+        with self._lock:
+            for entry in self.index.values():
+                self._remove_file(entry)
+            self.index = {}
+            self._dirty = True
+            self.flush()
+    def reset_counters(self):
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+    def get_stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'entries': len(self.index)
+        }
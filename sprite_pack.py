@@ -0,0 +1,114 @@
+import os
+import sys
+import json
+import mmap
+import struct
+from PIL import Image
+from sprite_atlas import FRAMES_DIR, collect_frame_files, _dir_signature
+from sprite_scaler import SpriteScaler
+PACK_DIR = os.path.join(FRAMES_DIR, 'pack')
+PACK_FILE = 'sprites.pack'
+PACK_MAGIC = b'VPETPACK'
+PACK_VERSION = 1
+PACK_ALIGN = 16
+DEFAULT_PACK_SIZES = [50, 75, 100, 125, 150]
+_HEADER = struct.Struct('<8sII')
+def make_key(name, pet_size):
+    return f"{name.lower()}@{pet_size}"
+def _aligned(offset):
+    return (offset + PACK_ALIGN - 1) // PACK_ALIGN * PACK_ALIGN
+def build_pack(frames_dir=FRAMES_DIR, pack_dir=PACK_DIR, sizes=None):
+    """Write every frame, pre-scaled for each size, as raw RGBA into one file with an offset table."""
+    sizes = sizes or DEFAULT_PACK_SIZES
+    os.makedirs(pack_dir, exist_ok=True)
+    scaler = SpriteScaler(Image.open)
+    blobs = []
+    for name, path in collect_frame_files(frames_dir):
+        try:
+            master = scaler.get_master(path, 0)
+        except Exception as e:
+            print(f"Skipping {name}: {e}")
+            continue
+        for pet_size in sizes:
+            scaled = scaler.scale(master, scaler.quantize(pet_size))
+            blobs.append((make_key(name, scaler.quantize(pet_size)), scaled.width, scaled.height, scaled.tobytes()))
+    frames = {}
+    offset = 0
+    for key, width, height, data in blobs:
+        frames[key] = [offset, width, height]
+        offset = _aligned(offset + len(data))
+    table = json.dumps({
+        'sources': _dir_signature(frames_dir),
+        'sizes': sorted({scaler.quantize(pet_size) for pet_size in sizes}),
+        'frames': frames
+    }).encode('utf-8')
+    data_start = _aligned(_HEADER.size + len(table))
+    pack_path = os.path.join(pack_dir, PACK_FILE)
+    tmp_path = pack_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(table)))
+        f.write(table)
+        for key, width, height, data in blobs:
+            f.seek(data_start + frames[key][0])
+            f.write(data)
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, pack_path)
+    return {'frames': len(frames), 'bytes': data_start + offset, 'path': pack_path}
+class SpritePack:
+    def __init__(self, buffer, frames, data_start, frames_dir=FRAMES_DIR, source_file=None):
+        self.buffer = buffer
+        self.view = memoryview(buffer)
+        self.frames = frames
+        self.data_start = data_start
+        self.frames_dir = frames_dir
+        self.source_file = source_file
+        self.hits = 0
+        self.misses = 0
+    @classmethod
+    def load(cls, frames_dir=FRAMES_DIR, pack_dir=PACK_DIR):
+        """Memory-map the pack if it exists and matches the frames directory, otherwise return None."""
+        pack_path = os.path.join(pack_dir, PACK_FILE)
+        if not os.path.exists(pack_path):
+            return None
+        try:
+            with open(pack_path, 'rb') as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, table_len = _HEADER.unpack_from(buffer, 0)
+            if magic != PACK_MAGIC or version != PACK_VERSION:
+                buffer.close()
+                return None
+            table = json.loads(bytes(buffer[_HEADER.size:_HEADER.size + table_len]).decode('utf-8'))
+            # A frozen build's bundled frames cannot change, and their extracted mtimes differ every run.
+            if not getattr(sys, 'frozen', False) and table.get('sources') != _dir_signature(frames_dir):
+                print("Sprite pack is out of date, run 'python sprite_pack.py' to rebuild it")
+                buffer.close()
+                return None
+            return cls(buffer, table['frames'], _aligned(_HEADER.size + table_len), frames_dir, pack_path)
+        except Exception as e:
+            print(f"Error loading sprite pack: {e}")
+            return None
+    def _name_for(self, path):
+        return os.path.relpath(path, self.frames_dir).replace(os.sep, '/').lower()
+    def get_path(self, path, pet_size):
+        return self.get(self._name_for(path), pet_size)
+    def get(self, name, pet_size):
+        """Return a read-only RGBA image backed directly by the mapped file, without copying pixels."""
+        entry = self.frames.get(make_key(name, pet_size))
+        if entry is None:
+            self.misses += 1
+            return None
+        offset, width, height = entry
+        start = self.data_start + offset
+        self.hits += 1
+        return Image.frombuffer('RGBA', (width, height), self.view[start:start + width * height * 4], 'raw', 'RGBA', 0, 1)
+    def get_stats(self):
+        return {
+            'frames': len(self.frames),
+            'bytes': len(self.buffer),
+            'hits': self.hits,
+            'misses': self.misses
+        }
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_PACK_SIZES
+    result = build_pack(sizes=sizes)
+    print(f"Packed {result['frames']} frames ({result['bytes'] // 1024} KB) into {result['path']}")
@@ -0,0 +1,57 @@
+import queue
+import threading
+class SpritePreloader:
+    def __init__(self, root, decode_func, on_ready, poll_ms=200):
+        self.root = root
+        self.decode_func = decode_func
+        self.on_ready = on_ready
+        self.poll_ms = poll_ms
+        self.requests = queue.Queue()
+        self.results = queue.Queue()
+        self.pending = set()
+        self.poll_timer = None
+        self.thread = None
+        self.completed = 0
+        self.failed = 0
+    def request(self, key):
+        """Queue a (stage, color, pet_size) set for decoding on the worker thread."""
+        if key in self.pending:
+            return False
+        self.pending.add(key)
+        self.requests.put(key)
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._worker, daemon=True)
+            self.thread.name = "SpritePreloaderThread"
+            self.thread.start()
+        if self.poll_timer is None:
+            self.poll_timer = self.root.after(self.poll_ms, self._poll)
+        return True
+    def is_pending(self, key):
+        return key in self.pending
+    def _worker(self):
+        while True:
+            key = self.requests.get()
+            try:
+                frames = self.decode_func(*key)
+            except Exception as e:
+                print(f"Error preloading sprites for {key}: {e}")
+                frames = None
+            self.results.put((key, frames))
+    def _poll(self):
+        self.poll_timer = None
+        while True:
+            try:
+                key, frames = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending.discard(key)
+            if frames is None:
+                self.failed += 1
+                continue
+            self.completed += 1
+            try:
+                self.on_ready(key, frames)
+            except Exception as e:
+                print(f"Error finishing preloaded sprites for {key}: {e}")
+        if self.pending:
+            self.poll_timer = self.root.after(self.poll_ms, self._poll)
@@ -0,0 +1,40 @@
+import threading
+from PIL import Image
+BASE_SCALE = 4
+SIZE_STEP = 5
+class SpriteScaler:
+    def __init__(self, open_func, size_step=SIZE_STEP):
+        self.open_func = open_func
+        self.size_step = size_step
+        self.masters = {}
+        self.scales = 0
+        self._lock = threading.Lock()
+    def quantize(self, pet_size):
+        """Snap a slider value to size_step so nearby notches share one scaled frame set; frames render at the snapped size."""
+        return int(round(pet_size / self.size_step) * self.size_step)
+    @staticmethod
+    def scale_factor(pet_size):
+        return BASE_SCALE * pet_size / 100
+    def get_master(self, img_path, source_mtime):
+        """Return the decoded unscaled RGBA frame, decoding the source only once per mtime."""
+        with self._lock:
+            entry = self.masters.get(img_path)
+            if entry is not None and entry[1] == source_mtime:
+                return entry[0]
+        master = self.open_func(img_path).convert('RGBA')
+        with self._lock:
+            self.masters[img_path] = (master, source_mtime)
+        return master
+    def scale(self, master, pet_size):
+        """Nearest-neighbour resize, the native look for the pixel art at every size."""
+        size_factor = self.scale_factor(pet_size)
+        self.scales += 1
+        return master.resize((int(master.width * size_factor), int(master.height * size_factor)), Image.NEAREST)
+    def clear(self):
+        with self._lock:
+            self.masters = {}
+    def get_stats(self):
+        return {
+            'masters': len(self.masters),
+            'scales': self.scales
+        }
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+class SpriteStore:
+    def __init__(self, budget_bytes=16 * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # The frame set each pet is showing right now, never evicted from under it.
+        self.active = {}
+    @staticmethod
+    def estimate_bytes(frames):
+        total = 0
+        for value in frames.values():
+            images = value if isinstance(value, (list, tuple)) else [value]
+            for image in images:
+                try:
+                    total += image.width() * image.height() * 4
+                except Exception:
+                    pass
+        return total
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+    def put(self, key, frames, nbytes=None):
+        if nbytes is None:
+            nbytes = self.estimate_bytes(frames)
+        self.discard(key)
+        self.entries[key] = (frames, nbytes)
+        self.total_bytes += nbytes
+        self._evict()
+    def add_bytes(self, key, nbytes):
+        """Account for images added to a stored frame set after it was put."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return
+        self.entries[key] = (entry[0], entry[1] + nbytes)
+        self.total_bytes += nbytes
+        self._evict()
+    def set_active(self, owner, key):
+        self.active[owner] = key
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+    def set_budget(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self._evict()
+    def _evict(self):
+        active = set(self.active.values())
+        # The newest entry always stays, as it is the one just asked for.
+        for key in list(self.entries)[:-1]:
+            if self.total_bytes <= self.budget_bytes:
+                break
+            if key in active:
+                continue
+            self.total_bytes -= self.entries.pop(key)[1]
+            self.evictions += 1
+    def get_stats(self):
+        return {
+            'entries': len(self.entries),
+            'bytes': self.total_bytes,
+            'budget_bytes': self.budget_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
@@ -0,0 +1,89 @@
+import math
+VITAL_STATS = ['hunger', 'happiness', 'energy', 'health', 'cleanliness', 'social']
+MINUTES_PER_DAY = 24 * 60
+# Mirrors the live loop: update_state puts the pet to sleep below this energy, PetStats.update wakes it at 100.
+SLEEP_BELOW = 15
+SLEEP_ENERGY_PER_MINUTE = 12
+SLEEP_HUNGER_SHARE = 0.5
+SLEEP_HEALTH_SHARE = 0.33
+CRITICAL_STAT = 5
+SICK_TICK_SECONDS = 45
+STARVING_TICK_SECONDS = 22.5
+# PetStats.update runs on update_state's 5 s tick, so a health drain that is due between ticks waits for the next one.
+UPDATE_TICK_SECONDS = 5
+MAX_SEGMENTS = 100000
+EPSILON = 1e-9
+def live_drain_seconds(interval_seconds):
+    """How often the live loop really drains health for a drain interval: rounded up to whole update ticks."""
+    return math.ceil(interval_seconds / UPDATE_TICK_SECONDS) * UPDATE_TICK_SECONDS
+def _rates(values, decay_rates, sleeping, sick):
+    """Per-minute change of every vital stat while nothing crosses a threshold."""
+    rates = {stat: -decay_rates.get(stat, 0) for stat in VITAL_STATS}
+    if sleeping:
+        rates['energy'] += SLEEP_ENERGY_PER_MINUTE
+        rates['health'] += SLEEP_ENERGY_PER_MINUTE * SLEEP_HEALTH_SHARE
+        rates['hunger'] -= SLEEP_ENERGY_PER_MINUTE * SLEEP_HUNGER_SHARE
+    if sick:
+        starving = any(values[stat] <= 0 for stat in VITAL_STATS)
+        rates['health'] -= 60 / live_drain_seconds(STARVING_TICK_SECONDS if starving else SICK_TICK_SECONDS)
+    for stat, rate in rates.items():
+        if (rate < 0 and values[stat] <= 0) or (rate > 0 and values[stat] >= 100):
+            rates[stat] = 0
+    return rates
+def _minutes_to_next_event(value, rate, boundaries):
+    if rate < 0:
+        below = [b for b in boundaries if b < value - EPSILON]
+        return (value - max(below)) / -rate if below else float('inf')
+    if rate > 0:
+        above = [b for b in boundaries if b > value + EPSILON]
+        return (min(above) - value) / rate if above else float('inf')
+    return float('inf')
+def catch_up(stats, decay_rates, minutes, is_sleeping=False, sick_health=30):
+    """Advance stats by minutes in closed form, one linear segment per stretch between clamps, sleep/wake and sickness changes."""
+    values = {stat: float(stats.get(stat, 0)) for stat in VITAL_STATS}
+    boundaries = {stat: [0, CRITICAL_STAT, 100] for stat in VITAL_STATS}
+    boundaries['health'].append(sick_health)
+    boundaries['energy'].append(SLEEP_BELOW)
+    sleeping = is_sleeping
+    asleep_at = None
+    asleep_energy = None
+    sleeps = 0
+    sick_minutes = 0.0
+    elapsed = 0.0
+    segments = 0
+    while elapsed < minutes and segments < MAX_SEGMENTS:
+        segments += 1
+        if sleeping and values['energy'] >= 100:
+            sleeping = False
+            asleep_at = None
+        elif not sleeping and values['energy'] <= SLEEP_BELOW:
+            sleeping = True
+            asleep_at = elapsed
+            asleep_energy = values['energy']
+            sleeps += 1
+        sick = values['health'] <= sick_health or any(values[stat] <= CRITICAL_STAT for stat in VITAL_STATS)
+        rates = _rates(values, decay_rates, sleeping, sick)
+        step = minutes - elapsed
+        for stat in VITAL_STATS:
+            step = min(step, _minutes_to_next_event(values[stat], rates[stat], boundaries[stat]))
+        for stat in VITAL_STATS:
+            value = max(0.0, min(100.0, values[stat] + rates[stat] * step))
+            # Land exactly on the threshold just reached so the next segment sees it crossed.
+            for boundary in boundaries[stat]:
+                if abs(value - boundary) < EPSILON:
+                    value = float(boundary)
+            values[stat] = value
+        if sick:
+            sick_minutes += step
+        elapsed += step
+    result = dict(values)
+    result['age'] = stats.get('age', 0) + minutes / MINUTES_PER_DAY
+    return {
+        'stats': result,
+        'is_sleeping': sleeping,
+        'asleep_at': asleep_at,
+        'asleep_energy': asleep_energy,
+        'sleeps': sleeps,
+        'sick_minutes': sick_minutes,
+        'segments': segments
+    }
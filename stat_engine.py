@@ -0,0 +1,203 @@
+from collections.abc import MutableMapping
+from datetime import datetime
+from pet_components import PetStats, CATCH_UP_AFTER_MINUTES
+from stat_catchup import VITAL_STATS, MINUTES_PER_DAY, SLEEP_ENERGY_PER_MINUTE, SLEEP_HUNGER_SHARE, \
+    SLEEP_HEALTH_SHARE, CRITICAL_STAT, SICK_TICK_SECONDS, STARVING_TICK_SECONDS
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+STAT_INDEX = {stat: i for i, stat in enumerate(VITAL_STATS)}
+HUNGER, ENERGY, HEALTH = STAT_INDEX['hunger'], STAT_INDEX['energy'], STAT_INDEX['health']
+# Alert level per stat: 0 none, 1 low, 2 critical, 3 emergency, matching PetStats.alert_thresholds.
+ALERT_LEVELS = ['low', 'critical', 'emergency']
+ALERT_THRESHOLDS = [50, 30, 10]
+EXHAUSTED_ENERGY_CAP = 25
+class StatEngine:
+    """The vitals, decay rates and age of many pets as fixed-order float arrays, one row per pet."""
+    def __init__(self, capacity=8, sick_health=30):
+        if np is None:
+            raise RuntimeError("StatEngine needs NumPy")
+        self.sick_health = sick_health
+        self.size = 0
+        self.values = np.zeros((capacity, len(VITAL_STATS)))
+        self.decay = np.zeros((capacity, len(VITAL_STATS)))
+        self.age = np.zeros(capacity)
+        self.since_health_tick = np.zeros(capacity)
+        self.sick = np.zeros(capacity, dtype=bool)
+        self.alert_levels = np.zeros((capacity, len(VITAL_STATS)), dtype=np.int8)
+    def _grow(self):
+        capacity = len(self.age) * 2
+        for name in ('values', 'decay', 'alert_levels'):
+            array = getattr(self, name)
+            grown = np.zeros((capacity, array.shape[1]), dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            setattr(self, name, grown)
+        for name in ('age', 'since_health_tick', 'sick'):
+            array = getattr(self, name)
+            grown = np.zeros(capacity, dtype=array.dtype)
+            grown[:self.size] = array[:self.size]
+            setattr(self, name, grown)
+    def add(self, stats=None, decay_rates=None):
+        if self.size == len(self.age):
+            self._grow()
+        row = self.size
+        self.size += 1
+        self.values[row] = [(stats or {}).get(stat, 100) for stat in VITAL_STATS]
+        self.set_decay(row, decay_rates or {})
+        self.age[row] = (stats or {}).get('age', 0)
+        # PetStats starts its health timer at creation, so a pet that is sick from the start waits a full tick.
+        self.since_health_tick[row] = 0
+        return row
+    def set_decay(self, row, decay_rates):
+        self.decay[row] = [decay_rates.get(stat, 0) for stat in VITAL_STATS]
+    def update(self, minutes, sleeping=False, rows=slice(None)):
+        """One PetStats.update step for the given rows at once; returns the rows' sick, woke and alert-change masks."""
+        rows = np.arange(self.size)[rows]
+        minutes = np.broadcast_to(np.asarray(minutes, dtype=float), rows.shape)
+        sleeping = np.broadcast_to(np.asarray(sleeping, dtype=bool), rows.shape)
+        values = self.values[rows]
+        gain = np.where(sleeping & (values[:, ENERGY] < 100), minutes * SLEEP_ENERGY_PER_MINUTE, 0.0)
+        hunger_drop = np.minimum(values[:, HUNGER], gain * SLEEP_HUNGER_SHARE)
+        values[:, ENERGY] += gain
+        values[:, HEALTH] += gain * SLEEP_HEALTH_SHARE
+        values[:, HUNGER] -= hunger_drop
+        np.clip(values, 0, 100, out=values)
+        woke = sleeping & (values[:, ENERGY] >= 100)
+        values -= self.decay[rows] * minutes[:, None]
+        np.clip(values, 0, 100, out=values)
+        exhausted = values[:, ENERGY] <= 0
+        values[exhausted, ENERGY] = np.minimum(minutes[exhausted] * 12, EXHAUSTED_ENERGY_CAP)
+        self.age[rows] += np.where(exhausted, 0.0, minutes / MINUTES_PER_DAY)
+        sick = (values[:, HEALTH] <= self.sick_health) | (values <= CRITICAL_STAT).any(axis=1)
+        starving = (values <= 0).any(axis=1)
+        self.since_health_tick[rows] += minutes * 60
+        drain = sick & (self.since_health_tick[rows] >= np.where(starving, STARVING_TICK_SECONDS, SICK_TICK_SECONDS))
+        values[drain, HEALTH] = np.maximum(values[drain, HEALTH] - 1, 0)
+        self.since_health_tick[rows[drain]] = 0
+        self.values[rows] = values
+        self.sick[rows] = sick
+        levels = (values[:, :, None] <= np.array(ALERT_THRESHOLDS)).sum(axis=2).astype(np.int8)
+        alert_changed = levels != self.alert_levels[rows]
+        self.alert_levels[rows] = levels
+        return {'sick': sick, 'woke': woke, 'alert_changed': alert_changed}
+    def get(self, row, stat):
+        if stat == 'age':
+            return float(self.age[row])
+        return float(self.values[row, STAT_INDEX[stat]])
+    def set(self, row, stat, value):
+        if stat == 'age':
+            self.age[row] = value
+        else:
+            self.values[row, STAT_INDEX[stat]] = value
+class StatRow(MutableMapping):
+    """Dict-like view of one engine row, so code written against PetStats.stats keeps working."""
+    def __init__(self, engine, row):
+        self.engine = engine
+        self.row = row
+    def __getitem__(self, stat):
+        if stat != 'age' and stat not in STAT_INDEX:
+            raise KeyError(stat)
+        return self.engine.get(self.row, stat)
+    def __setitem__(self, stat, value):
+        if stat != 'age' and stat not in STAT_INDEX:
+            raise KeyError(stat)
+        self.engine.set(self.row, stat, value)
+    def __delitem__(self, stat):
+        raise KeyError(f"Cannot remove stat {stat}")
+    def __iter__(self):
+        return iter(VITAL_STATS + ['age'])
+    def __len__(self):
+        return len(VITAL_STATS) + 1
+    def copy(self):
+        return dict(self)
+class DecayRow(StatRow):
+    """Dict-like view of one row's decay rates, keeping the keys the rates were assigned with."""
+    def __init__(self, engine, row, keys):
+        super().__init__(engine, row)
+        self.keys_order = keys
+    def __getitem__(self, stat):
+        if stat not in self.keys_order:
+            raise KeyError(stat)
+        return float(self.engine.decay[self.row, STAT_INDEX[stat]])
+    def __setitem__(self, stat, value):
+        if stat not in STAT_INDEX:
+            raise KeyError(stat)
+        if stat not in self.keys_order:
+            self.keys_order.append(stat)
+        self.engine.decay[self.row, STAT_INDEX[stat]] = value
+    def __iter__(self):
+        return iter(list(self.keys_order))
+    def __len__(self):
+        return len(self.keys_order)
+class VectorPetStats(PetStats):
+    """PetStats backed by a StatEngine row; pets sharing an engine can be stepped together with engine.update."""
+    def __init__(self, growth=None, engine=None, clock=None):
+        self.engine = engine or StatEngine()
+        self.row = self.engine.add()
+        super().__init__(growth, clock or datetime.now)
+    @property
+    def stats(self):
+        return StatRow(self.engine, self.row)
+    @stats.setter
+    def stats(self, values):
+        for stat, value in dict(values).items():
+            if stat == 'age' or stat in STAT_INDEX:
+                self.engine.set(self.row, stat, value)
+    @property
+    def decay_rates(self):
+        return DecayRow(self.engine, self.row, self._decay_keys)
+    @decay_rates.setter
+    def decay_rates(self, rates):
+        rates = dict(rates)
+        self._decay_keys = [stat for stat in rates if stat in STAT_INDEX]
+        self.engine.set_decay(self.row, rates)
+    def modify_stat(self, stat, amount):
+        if stat == 'age' or stat in STAT_INDEX:
+            value = max(0, min(100, self.engine.get(self.row, stat) + amount))
+            self.engine.set(self.row, stat, value)
+            if hasattr(self, stat):
+                setattr(self, stat, value)
+            return True
+        return False
+    def get_stat(self, stat):
+        if stat == 'age' or stat in STAT_INDEX:
+            return self.engine.get(self.row, stat)
+        return 0
+    def update(self):
+        now = self.clock()
+        elapsed_minutes = (now - self.last_update).total_seconds() / 60.0
+        if elapsed_minutes > CATCH_UP_AFTER_MINUTES:
+            result = self.catch_up(now)
+            print(f"Caught up {elapsed_minutes:.0f} minutes: slept {result['sleeps']} times, sick for {result['sick_minutes']:.0f} minutes")
+            self.check_stat_alerts()
+            return
+        self.last_update = now
+        pet_state = getattr(self, 'pet_state', None)
+        is_sleeping = getattr(pet_state, 'is_sleeping', False) or \
+                      getattr(getattr(self.growth, 'behavior', None), 'current_activity', None) == 'sleeping'
+        result = self.engine.update(elapsed_minutes, is_sleeping, rows=slice(self.row, self.row + 1))
+        self.apply_update(result, 0)
+    def apply_update(self, result, index):
+        """Side effects of an engine step for this pet: attribute mirrors, waking, alerts and sickness changes."""
+        for stat in VITAL_STATS + ['age']:
+            setattr(self, stat, self.engine.get(self.row, stat))
+        pet_state = getattr(self, 'pet_state', None)
+        if pet_state is not None and getattr(pet_state, 'is_sleeping', False) and \
+                (result['woke'][index] or self.engine.get(self.row, 'energy') >= 100):
+            pet_state.is_sleeping = False
+            pet_state.sleep_start_time = None
+            pet_state.current_animation = 'Standing'
+        if result['alert_changed'][index].any():
+            self.check_stat_alerts()
+        was_sick = self.is_sick
+        self.is_sick = bool(result['sick'][index])
+        if was_sick != self.is_sick and hasattr(self, 'on_sickness_changed'):
+            self.on_sickness_changed(self.is_sick)
+def create_stats(growth=None, engine=None, clock=datetime.now):
+    """VectorPetStats on engine when NumPy is installed, plain PetStats otherwise."""
+    if NUMPY_AVAILABLE:
+        return VectorPetStats(growth, engine, clock)
+    return PetStats(growth, clock)
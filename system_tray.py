@@ -37,6 +37,15 @@ class SystemTrayMenu:
             SystemTrayMenu.create_custom_menu_item('Exit', exit_func)
         )
     
+    @staticmethod
+    def create_household_menu_items(pets, exit_func):
+        """One submenu per pet with its own status, inventory, games and settings, then a single Exit for all of them."""
+        pet_menus = tuple(
+            pystray.MenuItem(pet.name, pystray.Menu(*SystemTrayMenu.create_menu_items(pet, pet.show_settings, exit_func)[:-1]))
+            for pet in pets
+        )
+        return pet_menus + (pystray.Menu.SEPARATOR, SystemTrayMenu.create_custom_menu_item('Exit', exit_func))
+    
     @staticmethod
     def create_tray_icon(image_path=None):
         if image_path and os.path.exists(image_path):
@@ -67,13 +76,18 @@ class SystemTrayMenu:
 def create_context_menu(pet_manager, show_settings_func, exit_func):
     return SystemTrayMenu.create_menu_items(pet_manager, show_settings_func, exit_func)
 
-def setup_system_tray(pet_manager, show_settings_func, exit_func, icon_path='frames/Adult_Happy.png'):
+def create_household_menu(pets, exit_func):
+    return SystemTrayMenu.create_household_menu_items(pets, exit_func)
+
+def setup_system_tray(pet_manager, show_settings_func, exit_func, icon_path='frames/Adult_Happy.png', create_menu=None):
     # Ensure the icon path is absolute
     absolute_icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), icon_path)
     icon_image = SystemTrayMenu.create_tray_icon(absolute_icon_path)
     
     def get_updated_menu():
         try:
+            if create_menu is not None:
+                return create_menu()
             pet_manager.pet_state.stats.update()
             return SystemTrayMenu.create_menu_items(pet_manager, show_settings_func, exit_func)
         except Exception as e:
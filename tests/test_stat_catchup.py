@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta
+from pet_components import PetStats
+from stat_catchup import VITAL_STATS
+START = datetime(2025, 1, 1, 8, 0)
+class Clock:
+    def __init__(self):
+        self.now = START
+    def __call__(self):
+        return self.now
+class PetState:
+    def __init__(self):
+        self.is_sleeping = False
+        self.sleep_start_time = None
+        self.current_animation = 'Standing'
+def make_stats(start, decay_rates):
+    clock = Clock()
+    stats = PetStats(None, clock)
+    stats.check_stat_alerts = lambda: None
+    stats.pet_state = PetState()
+    stats.decay_rates = dict(decay_rates)
+    stats.stats.update(start)
+    return stats, clock
+def step_live(start, decay_rates, minutes):
+    """Run PetStats.update on update_state's 5 s tick, putting the pet to sleep the way update_state does."""
+    stats, clock = make_stats(start, decay_rates)
+    for _ in range(int(minutes * 12)):
+        clock.now += timedelta(seconds=5)
+        stats.update()
+        if stats.stats['energy'] < 15 and not stats.pet_state.is_sleeping:
+            stats.pet_state.is_sleeping = True
+    return stats
+def catch_up_once(start, decay_rates, minutes):
+    stats, clock = make_stats(start, decay_rates)
+    clock.now += timedelta(minutes=minutes)
+    stats.catch_up()
+    return stats
+# The live loop takes health off one point at a time, catch-up spreads it evenly, so they can sit one drain apart.
+def assert_matches_live(start, decay_rates, minutes, tolerance=1.0):
+    live = step_live(start, decay_rates, minutes)
+    caught = catch_up_once(start, decay_rates, minutes)
+    for stat in VITAL_STATS:
+        assert abs(live.stats[stat] - caught.stats[stat]) <= tolerance, (stat, live.stats[stat], caught.stats[stat])
+    assert live.pet_state.is_sleeping == caught.pet_state.is_sleeping
+    assert live.is_sick == caught.is_sick
+BABY_RATES = {'hunger': 0.3, 'happiness': 0.24, 'energy': 0.15, 'cleanliness': 0.21, 'social': 0.18}
+def test_starving_pet_loses_health_on_the_live_tick():
+    assert_matches_live({'hunger': 30, 'energy': 40}, BABY_RATES, 120)
+def test_sick_pet_with_low_health():
+    assert_matches_live({'hunger': 60, 'health': 35, 'cleanliness': 20, 'energy': 70}, BABY_RATES, 90)
+def test_tired_pet_sleeps_and_wakes():
+    assert_matches_live({'hunger': 80, 'energy': 20, 'happiness': 50}, BABY_RATES, 180)
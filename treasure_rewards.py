@@ -0,0 +1,38 @@
+import random
+# Rolled once a minute until a chest has spawned today.
+CHEST_SPAWN_CHANCE = 0.2
+CHEST_CHECK_SECONDS = 60
+CHEST_LIFETIME_SECONDS = 300
+COIN_REWARD_RANGE = (50, 300)
+ITEM_TIERS = {
+    'basic': ['apple', 'donut', 'croissant'],
+    'mid': ['hotdog', 'sandwich', 'bacon', 'cupcake'],
+    'good': ['cheese', 'burger', 'ice_cream'],
+    'premium': ['chocolate_bar', 'cooked_fish', 'sushi'],
+    'exotic': ['enchanted_apple', 'first_aid']  # Special items
+}
+def roll_chest_spawn(rng=random):
+    return rng.random() < CHEST_SPAWN_CHANCE
+def generate_rewards(rng=random, item_tiers=ITEM_TIERS):
+    """Roll a chest's coins and items: 60% basic, 20% mid, 10% good, 5% premium, 5% exotic."""
+    rewards = {
+        'coins': rng.randint(*COIN_REWARD_RANGE),
+        'items': []
+    }
+    rand = rng.random() * 100
+    if rand <= 60:
+        tier, item_count = 'basic', rng.randint(1, 5)
+    elif rand <= 80:
+        tier, item_count = 'mid', rng.randint(1, 3)
+    elif rand <= 90:
+        tier, item_count = 'good', rng.randint(1, 3)
+    elif rand <= 95:
+        tier, item_count = 'premium', 1
+    else:
+        tier, item_count = 'exotic', 1
+    for _ in range(item_count):
+        rewards['items'].append(rng.choice(item_tiers[tier]))
+    return rewards
+def level_reward(level):
+    """Coins for winning a mini-game round at level: 1, going up by 2 every three levels."""
+    return 1 + 2 * ((level - 1) // 3)
@@ -1,15 +1,35 @@
 import tkinter as tk
-from PIL import Image, ImageTk
+from PIL import Image
 import os
 import random
 import time
 from datetime import datetime, timedelta
 from unified_ui import COLORS
+from frame_scheduler import get_scheduler
+from renderer import TkRenderer
+from treasure_rewards import ITEM_TIERS, CHEST_CHECK_SECONDS, CHEST_LIFETIME_SECONDS, roll_chest_spawn, generate_rewards
+
+def decode_chest_image(img_path, max_size=80):
+    img = Image.open(img_path).convert("RGBA")
+    # Get original dimensions
+    original_width, original_height = img.size
+    
+    # Calculate scaling factor to fit within max size while preserving aspect ratio
+    scale_factor = min(max_size / original_width, max_size / original_height)
+    
+    # Calculate new dimensions
+    new_width = int(original_width * scale_factor)
+    new_height = int(original_height * scale_factor)
+    
+    # Resize with proper aspect ratio
+    return img.resize((new_width, new_height), Image.LANCZOS)
 
 class TreasureSystem:
-    def __init__(self, root, canvas, pet_state, inventory_system, pet_manager=None):
+    def __init__(self, root, canvas, pet_state, inventory_system, pet_manager=None, renderer=None, rng=random):
         self.root = root
         self.canvas = canvas
+        self.renderer = renderer or TkRenderer(root)
+        self.rng = rng
         self.pet_state = pet_state
         self.inventory_system = inventory_system
         self.pet_manager = pet_manager  # Add this line
@@ -27,13 +47,7 @@ class TreasureSystem:
         self.load_chest_image()
         
         # Define item tiers
-        self.item_tiers = {
-            'basic': ['apple', 'donut', 'croissant'],
-            'mid': ['hotdog', 'sandwich', 'bacon', 'cupcake'],
-            'good': ['cheese', 'burger', 'ice_cream'],
-            'premium': ['chocolate_bar', 'cooked_fish', 'sushi'],
-            'exotic': ['enchanted_apple', 'first_aid']  # Special items
-        }
+        self.item_tiers = dict(ITEM_TIERS)
         
         # Start the treasure system
         self.start_treasure_system()
@@ -43,33 +57,25 @@ class TreasureSystem:
         try:
             img_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'img_assets', 'Treasure.png')
             if os.path.exists(img_path):
-                img = Image.open(img_path).convert("RGBA")
-                # Get original dimensions
-                original_width, original_height = img.size
-                
-                # Calculate scaling factor to fit within max size while preserving aspect ratio
-                max_size = 80
-                scale_factor = min(max_size / original_width, max_size / original_height)
-                
-                # Calculate new dimensions
-                new_width = int(original_width * scale_factor)
-                new_height = int(original_height * scale_factor)
-                
-                # Resize with proper aspect ratio
-                img = img.resize((new_width, new_height), Image.LANCZOS)
-                self.chest_image = ImageTk.PhotoImage(img)
-                self.chest_width = new_width
-                self.chest_height = new_height
+                asset_loader = getattr(self.pet_manager, 'asset_loader', None)
+                if asset_loader:
+                    return asset_loader.load('chest', decode_chest_image, img_path, on_ready=self._set_chest_image)
+                self._set_chest_image(decode_chest_image(img_path))
                 return True
         except Exception as e:
             print(f"Error loading treasure chest image: {e}")
         return False
     
+    def _set_chest_image(self, img):
+        self.chest_image = self.renderer.make_photo(img)
+        self.chest_width = img.width
+        self.chest_height = img.height
+    
     def start_treasure_system(self):
         """Start the treasure chest system with frequent checks for testing"""
         self.check_treasure_spawn()
         # Schedule next check in 1 minute (reverted from 10 seconds testing)
-        self.chest_timer_id = self.root.after(60000, self.start_treasure_system)
+        self.chest_timer_id = self.root.after(CHEST_CHECK_SECONDS * 1000, self.start_treasure_system)
     
     def check_treasure_spawn(self):
         """Check if a treasure chest should spawn"""
@@ -83,9 +89,14 @@ class TreasureSystem:
             self.chest_active):
             return
         
-        # Random chance to spawn (15-25% chance per hour)
-        if random.random() < 0.2:  # 20% chance every hour
-            self.spawn_treasure_chest()
+        # Random chance to spawn, rolled on every check until today's chest appears
+        if roll_chest_spawn(self.rng):
+            scheduler = get_scheduler(self.root)
+            # Overlays are suspended (fullscreen app or hidden pet), the chest appears once they resume
+            if scheduler.is_paused('overlay'):
+                scheduler.after('treasure.spawn', 0, self.spawn_treasure_chest, subsystem='overlay', replace=True)
+            else:
+                self.spawn_treasure_chest()
             self.last_chest_hour = current_hour
             self.last_chest_spawn_date = current_date  # Add this line
     
@@ -120,26 +131,17 @@ class TreasureSystem:
         chest_h = getattr(self, 'chest_height', 64)
         
         # Random position on screen (avoiding edges)
-        chest_x = random.randint(100, screen_width - chest_w - 100)
-        chest_y = random.randint(100, screen_height - chest_h - 100)
+        chest_x = self.rng.randint(100, screen_width - chest_w - 100)
+        chest_y = self.rng.randint(100, screen_height - chest_h - 100)
         
         # Store position for popup message
         self.chest_x = chest_x
         self.chest_y = chest_y
         
         # Create treasure chest window with proper dimensions
-        self.chest_window = tk.Toplevel(self.root)
-        self.chest_window.overrideredirect(True)
-        self.chest_window.attributes('-topmost', True)
-        self.chest_window.geometry(f"{chest_w + 40}x{chest_h + 40}+{chest_x}+{chest_y}")
-        
-        # Create chest canvas with padding for glow effect
-        chest_canvas = tk.Canvas(self.chest_window, width=chest_w + 40, height=chest_h + 40,
-                                highlightthickness=0, bg='white')
-        chest_canvas.pack()
-        
-        # Make white background transparent
-        self.chest_window.wm_attributes('-transparentcolor', 'white')
+        # Chest canvas has padding for the glow effect, and its white background is transparent
+        self.chest_window, chest_canvas = self.renderer.open_overlay(chest_x, chest_y, chest_w + 40, chest_h + 40,
+                                                                     bg='white', transparent_color='white')
         
         # Add chest image at center
         chest_canvas.create_image((chest_w + 40) // 2, (chest_h + 40) // 2, image=self.chest_image)
@@ -157,7 +159,7 @@ class TreasureSystem:
         self.chest_active = True
         
         # Schedule chest disappearance after 5 minutes (reverted from 30 seconds testing)
-        self.chest_disappear_timer_id = self.root.after(300000, self.remove_treasure_chest)
+        self.chest_disappear_timer_id = self.root.after(CHEST_LIFETIME_SECONDS * 1000, self.remove_treasure_chest)
         
         print("Treasure chest spawned!")
     
@@ -167,7 +169,7 @@ class TreasureSystem:
         
         def pulse_glow():
             if not self.chest_active or not canvas.winfo_exists():
-                return
+                return False
             
             # Remove previous glow
             canvas.delete("glow")
@@ -215,11 +217,10 @@ class TreasureSystem:
                 outline="#FFFF88", width=int(2 * intensity), tags="glow"
             )
             
-            # Schedule next pulse
-            if self.chest_active:
-                self.root.after(80, pulse_glow)
+            return self.chest_active
         
-        pulse_glow()
+        if pulse_glow():
+            get_scheduler(self.root).register('treasure.glow', pulse_glow, 80, subsystem='render')
     
     def on_chest_clicked(self, event):
         """Handle treasure chest click"""
@@ -240,44 +241,7 @@ class TreasureSystem:
     
     def generate_rewards(self):
         """Generate random rewards based on the specified probabilities"""
-        rewards = {
-            'coins': 0,
-            'items': []
-        }
-        
-        # Generate coin reward (50-300)
-        rewards['coins'] = random.randint(50, 300)
-        
-        # Generate item rewards based on probabilities
-        rand = random.random() * 100
-        
-        if rand <= 60:  # 60% chance - Basic Tier
-            item_count = random.randint(1, 5)
-            for _ in range(item_count):
-                item = random.choice(self.item_tiers['basic'])
-                rewards['items'].append(item)
-        
-        elif rand <= 80:  # 20% chance - Mid-Tier
-            item_count = random.randint(1, 3)
-            for _ in range(item_count):
-                item = random.choice(self.item_tiers['mid'])
-                rewards['items'].append(item)
-        
-        elif rand <= 90:  # 10% chance - Good Tier
-            item_count = random.randint(1, 3)
-            for _ in range(item_count):
-                item = random.choice(self.item_tiers['good'])
-                rewards['items'].append(item)
-        
-        elif rand <= 95:  # 5% chance - Premium Tier
-            item = random.choice(self.item_tiers['premium'])
-            rewards['items'].append(item)
-        
-        else:  # 5% chance - Exotic Tier (changed from 1% to 5% for better balance)
-            item = random.choice(self.item_tiers['exotic'])
-            rewards['items'].append(item)
-        
-        return rewards
+        return generate_rewards(self.rng, self.item_tiers)
     
     def apply_rewards(self, rewards):
         """Apply the generated rewards to the player"""
@@ -417,6 +381,7 @@ class TreasureSystem:
         
         if self.chest_disappear_timer_id:
             self.root.after_cancel(self.chest_disappear_timer_id)
-        
+        get_scheduler(self.root).unregister('treasure.spawn')
+
         # Remove chest if active
         self.remove_treasure_chest()
\ No newline at end of file
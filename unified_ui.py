@@ -8,6 +8,7 @@ from datetime import datetime
 import threading
 import webbrowser
 from startup_manager import StartupManager
+from frame_scheduler import get_scheduler
 import json
 COLORS = {
     'primary': '#4a6baf',
@@ -1147,7 +1148,7 @@ class SimpleStatusPanel:
         self.parent = parent
         self.pet_manager = pet_manager
         self.panel_window = None
-        self.update_timer = None
+        self.scheduler = get_scheduler(parent)
         self.is_visible = False
         self._stat_widgets = {}
         self.stats_frame = None
@@ -1222,7 +1223,7 @@ class SimpleStatusPanel:
         else:
             self._position_panel_adaptively()
         self.is_visible = True
-        self.update_timer = self.parent.after(100, self.periodic_update)
+        self.scheduler.register('status_panel.update', self.periodic_update, 1500, subsystem='ui', delay_ms=100)
         self.panel_window.lift()
         self.panel_window.attributes('-topmost', True)
         final_x = self.panel_window.winfo_x()
@@ -1261,9 +1262,7 @@ class SimpleStatusPanel:
     def hide_panel(self):
         """Hide the status panel"""
         if self.panel_window:
-            if self.update_timer:
-                self.parent.after_cancel(self.update_timer)
-                self.update_timer = None
+            self.scheduler.unregister('status_panel.update')
             self.panel_window.destroy()
             self.panel_window = None
             self.is_visible = False
@@ -1635,9 +1634,9 @@ class SimpleStatusPanel:
                 messagebox.showerror("Error", f"Failed to reset pet: {message}")
     def periodic_update(self):
         """Periodically update the stats display"""
-        if self.is_visible:
-            self.update_stats_display()
-            self.update_timer = self.parent.after(1500, self.periodic_update)
+        if not self.is_visible:
+            return False
+        self.update_stats_display()
     def show_inventory(self):
         """Show the pet's inventory"""
         if self.pet_manager: